@@ -0,0 +1,57 @@
+"""Added broadcasts
+
+Revision ID: 3c5e1f0a9b27
+Revises: afa83432adf6
+Create Date: 2026-10-18 18:02:31.640512
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3c5e1f0a9b27'
+down_revision: Union[str, None] = 'afa83432adf6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'broadcasts',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('admin_id', sa.BigInteger(), nullable=False),
+        sa.Column(
+            'audience',
+            sa.Enum('ALL', 'ACCEPTED', 'REJECTED_THIS_MONTH', name='broadcastaudienceenum'),
+            nullable=False,
+        ),
+        sa.Column('message', sa.String(), nullable=False),
+        sa.Column('last_user_id', sa.BigInteger(), server_default='0', nullable=False),
+        sa.Column('delivered', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('failed', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('blocked', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('is_finished', sa.Boolean(), server_default='false', nullable=False),
+        sa.Column(
+            'created_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', NOW())"),
+            nullable=False,
+        ),
+        sa.Column('finished_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    # Broadcasts to resume on startup.
+    op.create_index(
+        'ix_broadcasts_unfinished_id',
+        'broadcasts',
+        ['id'],
+        postgresql_where=sa.text('NOT is_finished'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_broadcasts_unfinished_id', table_name='broadcasts')
+    op.drop_table('broadcasts')
+    sa.Enum(name='broadcastaudienceenum').drop(op.get_bind(), checkfirst=True)
@@ -0,0 +1,51 @@
+"""Added persistence
+
+Revision ID: 5a9e3d71b0c4
+Revises: c48f2a7e9d15
+Create Date: 2026-10-18 21:02:41.183204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '5a9e3d71b0c4'
+down_revision: Union[str, None] = 'c48f2a7e9d15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'user_data',
+        sa.Column('user_id', sa.BigInteger(), nullable=False),
+        sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', NOW())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('user_id'),
+    )
+    op.create_table(
+        'conversation_states',
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.Column('key', postgresql.ARRAY(sa.BigInteger()), nullable=False),
+        sa.Column('state', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            'updated_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', NOW())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('name', 'key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('conversation_states')
+    op.drop_table('user_data')
@@ -0,0 +1,37 @@
+"""Added invite link pool
+
+Revision ID: 7d2b94e6c1f3
+Revises: 3c5e1f0a9b27
+Create Date: 2026-10-18 19:11:48.208731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2b94e6c1f3'
+down_revision: Union[str, None] = '3c5e1f0a9b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'invite_links',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('link', sa.String(length=255), nullable=False),
+        sa.Column(
+            'created_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', NOW())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('link'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('invite_links')
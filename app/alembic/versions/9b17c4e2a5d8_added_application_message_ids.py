@@ -0,0 +1,33 @@
+"""Added application message ids
+
+Revision ID: 9b17c4e2a5d8
+Revises: 5a9e3d71b0c4
+Create Date: 2026-10-18 21:40:12.602318
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9b17c4e2a5d8'
+down_revision: Union[str, None] = '5a9e3d71b0c4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        'applications',
+        sa.Column('admin_chat_message_id', sa.BigInteger(), nullable=True),
+    )
+    op.add_column(
+        'applications',
+        sa.Column('review_message_id', sa.BigInteger(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('applications', 'review_message_id')
+    op.drop_column('applications', 'admin_chat_message_id')
@@ -0,0 +1,50 @@
+"""Added unique answer per question
+
+Revision ID: afa83432adf6
+Revises: ba6bf5b5510b
+Create Date: 2026-10-18 15:10:03.552184
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'afa83432adf6'
+down_revision: Union[str, None] = 'ba6bf5b5510b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the latest answer if duplicates slipped in before the constraint.
+    op.execute(
+        """
+        DELETE FROM application_answers a
+        USING application_answers b
+        WHERE a.application_id = b.application_id
+          AND a.question_number = b.question_number
+          AND a.id < b.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_application_answers_application_id_question_number',
+        'application_answers',
+        ['application_id', 'question_number'],
+    )
+    # Covered by the leading column of the unique constraint.
+    op.drop_index('ix_application_answers_application_id', table_name='application_answers')
+
+
+def downgrade() -> None:
+    op.create_index(
+        'ix_application_answers_application_id',
+        'application_answers',
+        ['application_id'],
+    )
+    op.drop_constraint(
+        'uq_application_answers_application_id_question_number',
+        'application_answers',
+        type_='unique',
+    )
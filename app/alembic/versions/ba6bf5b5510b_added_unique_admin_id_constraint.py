@@ -0,0 +1,33 @@
+"""Added unique admin_id constraint
+
+Revision ID: ba6bf5b5510b
+Revises: f3ed433d7b9a
+Create Date: 2026-10-18 14:22:47.901356
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'ba6bf5b5510b'
+down_revision: Union[str, None] = 'f3ed433d7b9a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        'admin_processing_applications_admin_id_key',
+        'admin_processing_applications',
+        ['admin_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(
+        'admin_processing_applications_admin_id_key',
+        'admin_processing_applications',
+        type_='unique',
+    )
@@ -0,0 +1,53 @@
+"""Added outbox
+
+Revision ID: c48f2a7e9d15
+Revises: 7d2b94e6c1f3
+Create Date: 2026-10-18 20:24:05.517936
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c48f2a7e9d15'
+down_revision: Union[str, None] = '7d2b94e6c1f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('chat_id', sa.BigInteger(), nullable=False),
+        sa.Column('message', sa.String(), nullable=False),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column(
+            'available_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text('NOW()'),
+            nullable=False,
+        ),
+        sa.Column('failed_at', sa.TIMESTAMP(timezone=True), nullable=True),
+        sa.Column(
+            'created_at',
+            sa.TIMESTAMP(timezone=True),
+            server_default=sa.text("TIMEZONE('utc', NOW())"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    # Messages still to be sent, in the order they were written.
+    op.create_index(
+        'ix_outbox_pending_id',
+        'outbox',
+        ['id'],
+        postgresql_where=sa.text('failed_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_pending_id', table_name='outbox')
+    op.drop_table('outbox')
@@ -0,0 +1,30 @@
+"""Added outbox chat index
+
+Revision ID: d61a8c3f4e90
+Revises: 9b17c4e2a5d8
+Create Date: 2026-10-18 23:05:41.318274
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'd61a8c3f4e90'
+down_revision: Union[str, None] = '9b17c4e2a5d8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_outbox_pending_chat_id_id',
+        'outbox',
+        ['chat_id', 'id'],
+        postgresql_where=sa.text('failed_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_pending_chat_id_id', table_name='outbox')
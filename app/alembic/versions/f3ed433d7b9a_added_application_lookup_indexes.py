@@ -0,0 +1,37 @@
+"""Added application lookup indexes
+
+Revision ID: f3ed433d7b9a
+Revises: 6870be35d3f7
+Create Date: 2026-10-18 13:05:12.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3ed433d7b9a'
+down_revision: Union[str, None] = '6870be35d3f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Serves `WHERE user_id = ? ORDER BY created_at DESC LIMIT 1`.
+    op.create_index(
+        'ix_applications_user_id_created_at',
+        'applications',
+        ['user_id', 'created_at'],
+    )
+    # Serves `selectinload(Application.answers)`.
+    op.create_index(
+        'ix_application_answers_application_id',
+        'application_answers',
+        ['application_id'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_application_answers_application_id', table_name='application_answers')
+    op.drop_index('ix_applications_user_id_created_at', table_name='applications')
@@ -37,6 +37,88 @@ class Settings(BaseSettings):
         )
 
     SQLALCHEMY_ECHO: bool = True
+    SQLALCHEMY_POOL_SIZE: int = 5
+    SQLALCHEMY_MAX_OVERFLOW: int = 10
+    SQLALCHEMY_POOL_TIMEOUT: float = 30
+    SQLALCHEMY_POOL_RECYCLE: int = 1800
+    SQLALCHEMY_POOL_PRE_PING: bool = False
+    # Compiled statements kept by SQLAlchemy for the engine.
+    SQLALCHEMY_QUERY_CACHE_SIZE: int = 500
+    # Prepared statements kept by the asyncpg dialect per connection.
+    SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE: int = 100
+    # Connections opened on startup, at most SQLALCHEMY_POOL_SIZE.
+    SQLALCHEMY_POOL_WARMUP: int = 2
+    # Seconds between pool state reports in the log, 0 disables them.
+    POOL_METRICS_INTERVAL: int = 60
+
+    # Handler, service, Bot API and query metrics are served in the Prometheus
+    # text format at http://METRICS_LISTEN:METRICS_PORT/metrics, 0 disables.
+    METRICS_LISTEN: str = "127.0.0.1"
+    METRICS_PORT: int = 9464
+
+    # Handlers running at the same time, updates of one user run one by one.
+    UPDATE_WORKERS: int = 8
+    # Updates in flight, including those waiting for their user's turn.
+    MAX_CONCURRENT_UPDATES: int = 256
+
+    # Outbound Bot API requests, see Telegram's "My bot is hitting limits".
+    RATE_LIMIT_MESSAGES_PER_SECOND: float = 30
+    RATE_LIMIT_GROUP_MESSAGES_PER_MINUTE: float = 20
+    RATE_LIMIT_GROUP_BURST: int = 5
+    RATE_LIMIT_MAX_RETRIES: int = 3
+
+    # Broadcast messages sent at the same time and recipients between saves
+    # of the progress.
+    BROADCAST_WORKERS: int = 10
+    BROADCAST_BATCH_SIZE: int = 100
+
+    # Notifications are written to the outbox with the change they report and
+    # sent by OUTBOX_WORKERS workers, each claims up to OUTBOX_BATCH_SIZE chats
+    # with all their messages. A failed message is retried after
+    # OUTBOX_RETRY_DELAY seconds, doubled with every attempt. A worker renews
+    # the lease of its batch every OUTBOX_LEASE / 2 seconds while sending, the
+    # messages are claimed again OUTBOX_LEASE seconds after a worker stopped.
+    OUTBOX_WORKERS: int = 2
+    OUTBOX_BATCH_SIZE: int = 20
+    OUTBOX_POLL_INTERVAL: float = 1
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_RETRY_DELAY: float = 5
+    OUTBOX_LEASE: float = 120
+
+    # Minimum level of logs/full_log.log, JSON lines instead of text if
+    # LOG_JSON is set. DEBUG records of the modules in LOG_DEBUG_SAMPLING are
+    # written once per the given number, like {"app.core.persistence": 10}.
+    LOG_LEVEL: str = "DEBUG"
+    LOG_JSON: bool = False
+    LOG_DEBUG_SAMPLING: dict[str, int] = {
+        "app.core.persistence": 10,
+        "app.services.applications.application_formatting": 10,
+        "app.services.outbox.outbox_send": 10,
+    }
+
+    # user_data and conversation states changed by handlers are written to
+    # the database in one batch every PERSISTENCE_UPDATE_INTERVAL seconds.
+    PERSISTENCE_UPDATE_INTERVAL: float = 0.5
+
+    # Shared link to the clan chat that creates join requests. If it is set,
+    # accepted users get this link and their requests are approved by the
+    # bot, otherwise every accepted user gets a single-use link.
+    CLAN_CHAT_JOIN_LINK: str | None = None
+
+    # Single-use invite links to the clan chat created ahead of accepts.
+    # Links unused for INVITE_LINK_MAX_AGE seconds are revoked and replaced.
+    INVITE_LINK_POOL_SIZE: int = 10
+    INVITE_LINK_MAX_AGE: int = 86400
+    INVITE_LINK_POOL_REFILL_INTERVAL: int = 60
+
+    # Public HTTPS URL of the webhook endpoint without the path. Updates are
+    # received by long polling if it is not set.
+    WEBHOOK_URL: str | None = None
+    WEBHOOK_LISTEN: str = "127.0.0.1"
+    WEBHOOK_PORT: int = 8443
+    WEBHOOK_PATH: str = "telegram"
+    # Sent by Telegram in X-Telegram-Bot-Api-Secret-Token, required for webhooks.
+    WEBHOOK_SECRET_TOKEN: str | None = None
 
     ADMIN_CHAT_ID: int
     DEVELOPER_CHAT_ID: int
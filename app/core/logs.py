@@ -0,0 +1,221 @@
+import asyncio
+import contextlib
+import itertools
+import logging
+import os
+import queue
+import threading
+import zipfile
+from collections.abc import Mapping
+from datetime import datetime
+from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+
+class DebugSampler:
+    """
+    Filter of a sink that keeps every n-th DEBUG record of chosen modules.
+
+    Records of other levels and modules always pass. The counters are not
+    locked, a lost increment only shifts which record is kept.
+    """
+
+    def __init__(self, rates: Mapping[str, int]) -> None:
+        """
+        Initialize the sampler.
+
+        Args:
+            rates (Mapping[str, int]): Every how many DEBUG records to keep
+            by module name, like `app.services.outbox.outbox_send`.
+
+        Returns:
+            None
+        """
+        self._rates = dict(rates)
+        self._counters = {name: itertools.count() for name in self._rates}
+
+    def __call__(self, record: Mapping[str, Any]) -> bool:
+        """
+        Decide whether the sink writes the record.
+
+        Args:
+            record (Mapping[str, Any]): The loguru record.
+
+        Returns:
+            bool: True if the record is written.
+        """
+        if record["level"].name != "DEBUG":
+            return True
+        counter = self._counters.get(record["name"])
+        if counter is None:
+            return True
+        return next(counter) % self._rates[record["name"]] == 0
+
+
+class QueuedFileSink:
+    """
+    Loguru sink that hands formatted records to a thread writing the file.
+
+    The caller only puts the text into an in-process queue. The thread takes
+    all texts waiting in the queue and writes them at once, rotation and
+    compression of the file run in the thread too. Loguru's `enqueue=True`
+    is not used, it pickles every record in the caller. `logger.complete()`
+    waits until the queued records are written.
+    """
+
+    def __init__(self, handler: logging.Handler) -> None:
+        """
+        Start the writing thread.
+
+        Args:
+            handler (logging.Handler): Writes the texts to the file.
+
+        Returns:
+            None
+        """
+        # Loguru texts already end with a newline.
+        if isinstance(handler, logging.StreamHandler):
+            handler.terminator = ""
+        self._handler = handler
+        # A `None` stops the thread, an event is set once the texts queued
+        # before it are written.
+        self._queue: queue.SimpleQueue[str | threading.Event | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread = threading.Thread(target=self._write_batches, daemon=True)
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """
+        Queue the formatted record.
+
+        Args:
+            message (str): The text of the record.
+
+        Returns:
+            None
+        """
+        self._queue.put(message)
+
+    async def complete(self) -> None:
+        """Wait until the queued records are written, called by loguru."""
+        written = threading.Event()
+        self._queue.put(written)
+        await asyncio.to_thread(written.wait)
+
+    def stop(self) -> None:
+        """Write the queued records and stop the thread, called by loguru."""
+        self._queue.put(None)
+        self._thread.join()
+        self._handler.close()
+
+    def _write_batches(self) -> None:
+        """Write the waiting texts until `stop` is called."""
+        while True:
+            batch = [self._queue.get()]
+            with contextlib.suppress(queue.Empty):
+                while isinstance(batch[-1], str):
+                    batch.append(self._queue.get_nowait())
+            last = batch[-1]
+            if not isinstance(last, str):
+                batch.pop()
+            if batch:
+                record = logging.makeLogRecord({"msg": "".join(batch)})  # type: ignore[arg-type]
+                self._handler.handle(record)
+            if last is None:
+                return
+            if isinstance(last, threading.Event):
+                last.set()
+
+
+def setup_logging(
+    logs_directory: Path,
+    level: str,
+    json: bool,  # noqa: FBT001
+    debug_sampling: Mapping[str, int],
+) -> None:
+    """
+    Replace the default sink with files written outside the event loop.
+
+    A handler only pays for building and formatting the record, the files are
+    written by `QueuedFileSink` threads. Messages passed with arguments, like
+    `logger.debug("id={}", id)`, are not formatted if the level is disabled.
+
+    Args:
+        logs_directory (Path): Directory of the log files.
+        level (str): Minimum level of the full log.
+        json (bool): Write the full log as JSON lines.
+        debug_sampling (Mapping[str, int]): Every how many DEBUG records of
+        a module to write to the full log, see `DebugSampler`.
+
+    Returns:
+        None
+    """
+    logger.remove()
+    Path.mkdir(logs_directory, exist_ok=True)
+    full_log = TimedRotatingFileHandler(
+        logs_directory / "full_log.log",
+        when="midnight",
+        encoding="utf-8",
+    )
+    full_log.namer = _zip_name
+    full_log.rotator = _zip_rotator
+    warnings_log = _rotating_by_size(
+        logs_directory / "warnings_and_above.log",
+        10 * 1024 * 1024,
+    )
+    logger.add(
+        QueuedFileSink(full_log),
+        level=level,
+        filter=DebugSampler(debug_sampling),
+        serialize=json,
+    )
+    logger.add(QueuedFileSink(warnings_log), level="WARNING")
+
+
+def _rotating_by_size(path: Path, max_bytes: int) -> RotatingFileHandler:
+    """
+    Return a handler that compresses the file after `max_bytes`.
+
+    Every rotated file is kept, named after the time of the rotation like
+    loguru names them. The handler only rotates with a backup count, one
+    backup makes it rotate without shifting or deleting the older archives.
+
+    Args:
+        path (Path): Path of the log file.
+        max_bytes (int): Size of the file to rotate it at.
+
+    Returns:
+        RotatingFileHandler: The handler.
+    """
+    handler = RotatingFileHandler(
+        path,
+        maxBytes=max_bytes,
+        backupCount=1,
+        encoding="utf-8",
+    )
+    handler.namer = _timestamped_zip_name
+    handler.rotator = _zip_rotator
+    return handler
+
+
+def _timestamped_zip_name(name: str) -> str:
+    """Return the compressed name of the rotated file, like `name.<time>.log.zip`."""
+    path = Path(name.removesuffix(".1"))
+    time = datetime.now().astimezone().strftime("%Y-%m-%d_%H-%M-%S_%f")
+    return str(path.with_name(f"{path.stem}.{time}{path.suffix}.zip"))
+
+
+def _zip_name(name: str) -> str:
+    """Return the name of the compressed rotated log file."""
+    return f"{name}.zip"
+
+
+def _zip_rotator(source: str, destination: str) -> None:
+    """Compress the rotated log file into the `destination` archive."""
+    with zipfile.ZipFile(destination, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.write(source, arcname=Path(destination).stem)
+    os.remove(source)  # noqa: PTH107
@@ -0,0 +1,546 @@
+import functools
+import itertools
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from contextvars import ContextVar
+from typing import Any, NamedTuple, ParamSpec, TypeVar
+
+from loguru import logger
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import Pool
+from telegram.ext import Application, BaseHandler, ConversationHandler
+
+from app.db import pool_metrics
+from app.db.pool_metrics import Histogram
+
+P = ParamSpec("P")
+R = TypeVar("R")
+Labels = tuple[str, ...]
+
+# Upper bounds of the latency buckets in seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Sample(NamedTuple):
+    """One line of the Prometheus text format."""
+
+    name: str
+    labels: dict[str, str]
+    value: float
+
+
+class Counter:
+    """Counter with a value for every combination of labels."""
+
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: Labels) -> None:
+        """
+        Initialize the counter.
+
+        Args:
+            name (str): Name of the metric, ends with `_total`.
+            documentation (str): Help text of the metric.
+            label_names (Labels): Names of the labels.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._values: dict[Labels, float] = {}
+
+    def inc(self, *labels: str, amount: float = 1) -> None:
+        """
+        Increase the value of the labels.
+
+        Args:
+            *labels (str): Values of the labels in the order of their names.
+            amount (float): The increase.
+
+        Returns:
+            None
+        """
+        self._values[labels] = self._values.get(labels, 0) + amount
+
+    async def samples(self) -> list[Sample]:
+        """
+        Return the values of all labels.
+
+        Returns:
+            list[Sample]: The samples.
+        """
+        return [
+            Sample(self.name, dict(zip(self.label_names, labels, strict=True)), value)
+            for labels, value in self._values.items()
+        ]
+
+
+class LatencyHistogram:
+    """Histogram with fixed buckets for every combination of labels."""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Name of the metric, ends with `_seconds`.
+            documentation (str): Help text of the metric.
+            label_names (Labels): Names of the labels.
+            buckets (tuple[float, ...]): Sorted upper bounds of the buckets.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.buckets = buckets
+        self._histograms: dict[Labels, Histogram] = {}
+
+    def observe(self, seconds: float, *labels: str) -> None:
+        """
+        Add the value to the histogram of the labels.
+
+        Args:
+            seconds (float): The observed value.
+            *labels (str): Values of the labels in the order of their names.
+
+        Returns:
+            None
+        """
+        histogram = self._histograms.get(labels)
+        if histogram is None:
+            histogram = self._histograms[labels] = Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def track(self, histogram: Histogram, *labels: str) -> None:
+        """
+        Export a histogram observed elsewhere as the histogram of the labels.
+
+        Args:
+            histogram (Histogram): The histogram, with the buckets of this one.
+            *labels (str): Values of the labels in the order of their names.
+
+        Returns:
+            None
+        """
+        self._histograms[labels] = histogram
+
+    async def samples(self) -> list[Sample]:
+        """
+        Return buckets, sum and count of all labels.
+
+        Returns:
+            list[Sample]: The samples.
+        """
+        result = []
+        for labels, histogram in self._histograms.items():
+            named = dict(zip(self.label_names, labels, strict=True))
+            result.extend(
+                Sample(f"{self.name}_bucket", {**named, "le": _format(bound)}, count)
+                for bound, count in histogram.cumulative()
+            )
+            result.append(Sample(f"{self.name}_sum", named, histogram.total))
+            result.append(Sample(f"{self.name}_count", named, histogram.count))
+        return result
+
+
+class Gauge:
+    """Gauge whose values are read when the metrics are scraped."""
+
+    type_name = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels,
+        read: Callable[[], Awaitable[Mapping[Labels, float]]],
+    ) -> None:
+        """
+        Initialize the gauge.
+
+        Args:
+            name (str): Name of the metric.
+            documentation (str): Help text of the metric.
+            label_names (Labels): Names of the labels.
+            read (Callable[[], Awaitable[Mapping[Labels, float]]]): Returns
+            the current values by labels.
+
+        Returns:
+            None
+        """
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._read = read
+
+    async def samples(self) -> list[Sample]:
+        """
+        Read the current values.
+
+        Returns:
+            list[Sample]: The samples.
+        """
+        return [
+            Sample(self.name, dict(zip(self.label_names, labels, strict=True)), value)
+            for labels, value in (await self._read()).items()
+        ]
+
+
+Metric = Counter | LatencyHistogram | Gauge
+M = TypeVar("M", Counter, LatencyHistogram, Gauge)
+
+
+class Registry:
+    """Metrics rendered together in the Prometheus text format."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._metrics: dict[str, Metric] = {}
+
+    def counter(self, name: str, documentation: str, label_names: Labels) -> Counter:
+        """
+        Create and register a counter, see `Counter`.
+
+        Returns:
+            Counter: The counter.
+        """
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ) -> LatencyHistogram:
+        """
+        Create and register a latency histogram, see `LatencyHistogram`.
+
+        Returns:
+            LatencyHistogram: The histogram.
+        """
+        return self._register(
+            LatencyHistogram(name, documentation, label_names, buckets),
+        )
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        label_names: Labels,
+        read: Callable[[], Awaitable[Mapping[Labels, float]]],
+    ) -> Gauge:
+        """
+        Create and register a gauge, see `Gauge`.
+
+        Returns:
+            Gauge: The gauge.
+        """
+        return self._register(Gauge(name, documentation, label_names, read))
+
+    async def render(self) -> str:
+        """
+        Render all metrics.
+
+        A metric that failed to read its values is skipped and logged.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
+        lines = []
+        for metric in self._metrics.values():
+            try:
+                samples = await metric.samples()
+            except Exception:  # noqa: BLE001
+                logger.exception(f"Не удалось получить метрику {metric.name}")
+                continue
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.type_name}")
+            lines.extend(_render_sample(sample) for sample in samples)
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: M) -> M:
+        """
+        Add the metric to the registry.
+
+        Raises:
+            ValueError: If a metric with the same name is registered.
+
+        Returns:
+            M: The metric.
+        """
+        if metric.name in self._metrics:
+            msg = f"Metric {metric.name} is already registered!"
+            raise ValueError(msg)
+        self._metrics[metric.name] = metric
+        return metric
+
+
+def _render_sample(sample: Sample) -> str:
+    """Return the line of the sample."""
+    if not sample.labels:
+        return f"{sample.name} {_format(sample.value)}"
+    labels = ",".join(
+        f'{name}="{_escape(value)}"' for name, value in sample.labels.items()
+    )
+    return f"{sample.name}{{{labels}}} {_format(sample.value)}"
+
+
+def _escape(value: str) -> str:
+    """Escape the label value."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    """Format the value like Prometheus clients do."""
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+registry = Registry()
+handler_duration = registry.histogram(
+    "bot_handler_duration_seconds",
+    "Time to handle an update by handler.",
+    ("handler",),
+)
+handler_errors = registry.counter(
+    "bot_handler_errors_total",
+    "Updates whose handler raised an exception.",
+    ("handler",),
+)
+handler_db = registry.histogram(
+    "bot_handler_db_seconds",
+    "Time of database queries while handling an update.",
+    ("handler",),
+)
+handler_telegram = registry.histogram(
+    "bot_handler_telegram_seconds",
+    "Time of Bot API requests while handling an update, "
+    "concurrent requests are summed.",
+    ("handler",),
+)
+service_duration = registry.histogram(
+    "bot_service_duration_seconds",
+    "Time of a service call.",
+    ("service",),
+)
+service_errors = registry.counter(
+    "bot_service_errors_total",
+    "Service calls that raised an exception.",
+    ("service",),
+)
+telegram_duration = registry.histogram(
+    "bot_telegram_request_duration_seconds",
+    "Time of a Bot API request, without waiting for the rate limiter.",
+    ("method",),
+)
+telegram_errors = registry.counter(
+    "bot_telegram_request_errors_total",
+    "Bot API requests that failed or were not successful.",
+    ("method",),
+)
+query_duration = registry.histogram(
+    "bot_db_query_duration_seconds",
+    "Time of a database query by statement kind.",
+    ("statement",),
+)
+
+
+class UpdateTimings:
+    """Time spent waiting for the database and Telegram by one update."""
+
+    __slots__ = ("db", "telegram")
+
+    def __init__(self) -> None:
+        """Start with no time spent."""
+        self.db = 0.0
+        self.telegram = 0.0
+
+
+# Timings of the update being handled, tasks started by the handler share them.
+_update_timings: ContextVar[UpdateTimings | None] = ContextVar(
+    "update_timings",
+    default=None,
+)
+# Start of the running query in `Connection.info`.
+_QUERY_START = "metrics_query_start"
+
+
+def observe_telegram_request(method: str, seconds: float) -> None:
+    """
+    Record a Bot API request.
+
+    Args:
+        method (str): The Bot API method, like `sendMessage`.
+        seconds (float): Time of the request.
+
+    Returns:
+        None
+    """
+    telegram_duration.observe(seconds, method)
+    timings = _update_timings.get()
+    if timings is not None:
+        timings.telegram += seconds
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Measure every query of the engine.
+
+    Args:
+        engine (AsyncEngine): The engine.
+
+    Returns:
+        None
+    """
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _before_cursor_execute(conn: Any, *args: Any) -> None:  # noqa: ANN401, ARG001
+    """Remember the start of the query, queries of a connection run one by one."""
+    conn.info[_QUERY_START] = time.perf_counter()
+
+
+def _after_cursor_execute(
+    conn: Any,  # noqa: ANN401
+    cursor: Any,  # noqa: ANN401, ARG001
+    statement: str,
+    *args: Any,  # noqa: ANN401, ARG001
+) -> None:
+    """Record the time of the query."""
+    start = conn.info.pop(_QUERY_START, None)
+    if start is None:
+        return
+    seconds = time.perf_counter() - start
+    query_duration.observe(seconds, statement.lstrip().split(None, 1)[0].upper())
+    timings = _update_timings.get()
+    if timings is not None:
+        timings.db += seconds
+
+
+def register_pool(registry: Registry, pool: Pool) -> None:
+    """
+    Export the connection pool gauges and the checkout wait histogram.
+
+    Args:
+        registry (Registry): The registry to add the metrics to.
+        pool (Pool): The pool of the engine.
+
+    Returns:
+        None
+    """
+    for name in pool_metrics.snapshot(pool):
+        registry.gauge(
+            f"bot_db_pool_{name}",
+            f"Connection pool: {name}.",
+            (),
+            functools.partial(_read_pool_gauge, pool, name),
+        )
+    registry.histogram(
+        "bot_db_pool_checkout_wait_seconds",
+        "Time to check out a connection from the pool.",
+        (),
+        pool_metrics.WAIT_BUCKETS,
+    ).track(pool_metrics.checkout_wait)
+
+
+async def _read_pool_gauge(pool: Pool, name: str) -> dict[tuple[()], float]:
+    """Return the pool gauge without labels."""
+    return {(): pool_metrics.snapshot(pool)[name]}
+
+
+def measure_service(
+    execute: Callable[P, Awaitable[R]],
+) -> Callable[P, Awaitable[R]]:
+    """
+    Measure calls of the `execute` method of a service.
+
+    Args:
+        execute (Callable[P, Awaitable[R]]): The method.
+
+    Returns:
+        Callable[P, Awaitable[R]]: The measured method.
+    """
+    service = execute.__qualname__.split(".", 1)[0]
+
+    @functools.wraps(execute)
+    async def measured(*args: P.args, **kwargs: P.kwargs) -> R:
+        start = time.perf_counter()
+        try:
+            return await execute(*args, **kwargs)
+        except Exception:
+            service_errors.inc(service)
+            raise
+        finally:
+            service_duration.observe(time.perf_counter() - start, service)
+
+    return measured
+
+
+def instrument_handlers(application: Application) -> None:
+    """
+    Measure the callbacks of all handlers added to the application.
+
+    Handlers of conversations are measured one by one.
+
+    Args:
+        application (Application): The application.
+
+    Returns:
+        None
+    """
+    for handler in itertools.chain.from_iterable(application.handlers.values()):
+        _instrument_handler(handler)
+
+
+def _instrument_handler(handler: BaseHandler) -> None:
+    """Replace the callback of the handler with the measured one."""
+    if isinstance(handler, ConversationHandler):
+        for inner in itertools.chain(
+            handler.entry_points,
+            itertools.chain.from_iterable(handler.states.values()),
+            handler.fallbacks,
+        ):
+            _instrument_handler(inner)
+        return
+    handler.callback = _measure_handler(handler.callback)
+
+
+def _measure_handler(
+    callback: Callable[[Any, Any], Awaitable[R]],
+) -> Callable[[Any, Any], Awaitable[R]]:
+    """Return the callback recording its time, database and Telegram time."""
+    name = getattr(callback, "__name__", type(callback).__name__)
+
+    @functools.wraps(callback)
+    async def measured(update: object, context: object) -> R:
+        timings = UpdateTimings()
+        token = _update_timings.set(timings)
+        start = time.perf_counter()
+        try:
+            return await callback(update, context)
+        except Exception:
+            handler_errors.inc(name)
+            raise
+        finally:
+            _update_timings.reset(token)
+            handler_duration.observe(time.perf_counter() - start, name)
+            handler_db.observe(timings.db, name)
+            handler_telegram.observe(timings.telegram, name)
+
+    return measured
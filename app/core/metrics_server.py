@@ -0,0 +1,58 @@
+import asyncio
+from functools import partial
+
+from app.core.metrics import Registry
+
+# Seconds a client has to send the request.
+_READ_TIMEOUT = 10
+_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+async def start(registry: Registry, host: str, port: int) -> asyncio.Server:
+    """
+    Start the HTTP server answering `GET /metrics` with the registry.
+
+    Args:
+        registry (Registry): The metrics.
+        host (str): The address to listen on.
+        port (int): The port to listen on.
+
+    Returns:
+        asyncio.Server: The started server, `serve_forever` keeps it running.
+    """
+    return await asyncio.start_server(partial(_respond, registry), host, port)
+
+
+async def _respond(
+    registry: Registry,
+    reader: asyncio.StreamReader,
+    writer: asyncio.StreamWriter,
+) -> None:
+    """Answer one request and close the connection."""
+    try:
+        async with asyncio.timeout(_READ_TIMEOUT):
+            request_line = await reader.readline()
+            # Headers are not used, they end with an empty line.
+            while (await reader.readline()).strip():
+                pass
+        parts = request_line.split()
+        if len(parts) > 1 and parts[0] == b"GET" and parts[1] == b"/metrics":
+            status = "200 OK"
+            body = (await registry.render()).encode()
+        else:
+            status = "404 Not Found"
+            body = b"Not Found\n"
+        writer.write(
+            (
+                f"HTTP/1.1 {status}\r\n"
+                f"Content-Type: {_CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + body,
+        )
+        await writer.drain()
+    except (TimeoutError, ConnectionError):
+        pass
+    finally:
+        writer.close()
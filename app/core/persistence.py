@@ -0,0 +1,224 @@
+import asyncio
+from collections import Counter
+from typing import Any
+
+from loguru import logger
+from telegram.ext import BasePersistence, PersistenceInput
+
+from app.db.engine import UnitOfWork
+from app.db.repositories.persistence import ConversationKey
+
+ConversationDict = dict[ConversationKey, object]
+
+
+class DatabasePersistence(BasePersistence[dict[str, Any], dict, dict]):
+    """
+    Keeps `user_data` and conversation states in our database.
+
+    `Application` hands the changed data over every `update_interval` seconds.
+    The changes are kept in memory and written by a background task in one
+    transaction, so handlers never wait for the database. Changes that came
+    in while a batch was written go into the next batch, a batch that failed
+    is merged back and written with the next one. The data must be JSON
+    serializable: store IDs, not Telegram objects.
+    """
+
+    def __init__(self, uow: UnitOfWork, update_interval: float) -> None:
+        """
+        Initialize the persistence.
+
+        Args:
+            uow (UnitOfWork): The unit of work used only by the persistence.
+            update_interval (float): Seconds between hand-overs of changes.
+
+        Returns:
+            None
+        """
+        super().__init__(
+            store_data=PersistenceInput(
+                bot_data=False,
+                chat_data=False,
+                user_data=True,
+                callback_data=False,
+            ),
+            update_interval=update_interval,
+        )
+        self._uow = uow
+        self._conversations: dict[str, ConversationDict] = {}
+        self._user_data_changes: dict[int, dict[str, Any] | None] = {}
+        self._conversation_changes: dict[tuple[str, ConversationKey], object] = {}
+        self._lock = asyncio.Lock()
+        self._writer: asyncio.Task[None] | None = None
+
+    async def get_user_data(self) -> dict[int, dict[str, Any]]:
+        """
+        Load the data of all users.
+
+        Returns:
+            dict[int, dict[str, Any]]: The data by Telegram ID of the user.
+        """
+        async with self._uow(read_only=True):
+            return await self._uow.persistence.list_user_data()
+
+    async def get_conversations(self, name: str) -> ConversationDict:
+        """
+        Load the states of a conversation handler.
+
+        Args:
+            name (str): The name of the conversation handler.
+
+        Returns:
+            ConversationDict: The states by conversation key.
+        """
+        if name not in self._conversations:
+            async with self._uow(read_only=True):
+                self._conversations[name] = (
+                    await self._uow.persistence.list_conversations(name)
+                )
+        return self._conversations[name].copy()
+
+    async def update_user_data(self, user_id: int, data: dict[str, Any]) -> None:
+        """
+        Schedule writing the data of the user.
+
+        Args:
+            user_id (int): Telegram ID of the user.
+            data (dict[str, Any]): The data.
+
+        Returns:
+            None
+        """
+        self._user_data_changes[user_id] = data
+        self._schedule_write()
+
+    async def drop_user_data(self, user_id: int) -> None:
+        """
+        Schedule removing the data of the user.
+
+        Args:
+            user_id (int): Telegram ID of the user.
+
+        Returns:
+            None
+        """
+        self._user_data_changes[user_id] = None
+        self._schedule_write()
+
+    async def update_conversation(
+        self,
+        name: str,
+        key: ConversationKey,
+        new_state: object | None,
+    ) -> None:
+        """
+        Schedule writing the state of the conversation.
+
+        Args:
+            name (str): The name of the conversation handler.
+            key (ConversationKey): The conversation key.
+            new_state (object | None): The new state, `None` if the
+            conversation ended.
+
+        Returns:
+            None
+        """
+        conversations = self._conversations.setdefault(name, {})
+        if conversations.get(key) == new_state:
+            return
+        if new_state is None:
+            conversations.pop(key, None)
+        else:
+            conversations[key] = new_state
+        self._conversation_changes[(name, key)] = new_state
+        self._schedule_write()
+
+    async def count_states(self) -> dict[tuple[str, str], int]:
+        """
+        Count conversations in every state.
+
+        Returns:
+            dict[tuple[str, str], int]: The number of conversations by name
+            of the conversation handler and state.
+        """
+        return Counter(
+            (name, str(state))
+            for name, conversations in self._conversations.items()
+            for state in conversations.values()
+        )
+
+    async def flush(self) -> None:
+        """Write all scheduled changes, called on shutdown."""
+        if self._writer is not None:
+            await self._writer
+        await self._write()
+
+    def _schedule_write(self) -> None:
+        """
+        Start the writer unless it is running.
+
+        `Application` hands all changes over at once, the writer starts after
+        that and writes them together.
+        """
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._write())
+
+    async def _write(self) -> None:
+        """Write scheduled changes in batches until none are left."""
+        async with self._lock:
+            while self._user_data_changes or self._conversation_changes:
+                user_data = self._user_data_changes
+                conversations = self._conversation_changes
+                self._user_data_changes = {}
+                self._conversation_changes = {}
+                try:
+                    async with self._uow():
+                        await self._uow.persistence.save_user_data(user_data)
+                        await self._uow.persistence.save_conversations(conversations)
+                        await self._uow.commit()
+                except Exception:  # noqa: BLE001
+                    logger.exception(
+                        "Не удалось сохранить данные пользователей и диалогов",
+                    )
+                    # Newer changes win over the failed ones.
+                    self._user_data_changes = user_data | self._user_data_changes
+                    self._conversation_changes = (
+                        conversations | self._conversation_changes
+                    )
+                    return
+                logger.debug(
+                    "Сохранено: user_data={}, диалоги={}",
+                    len(user_data),
+                    len(conversations),
+                )
+
+    async def get_chat_data(self) -> dict[int, dict]:
+        """Chat data is not stored."""
+        return {}
+
+    async def get_bot_data(self) -> dict:
+        """Bot data is not stored."""
+        return {}
+
+    async def get_callback_data(self) -> None:
+        """Callback data is not stored."""
+
+    async def update_chat_data(self, chat_id: int, data: dict) -> None:
+        """Chat data is not stored."""
+
+    async def update_bot_data(self, data: dict) -> None:
+        """Bot data is not stored."""
+
+    async def update_callback_data(self, data: object) -> None:
+        """Callback data is not stored."""
+
+    async def drop_chat_data(self, chat_id: int) -> None:
+        """Chat data is not stored."""
+
+    async def refresh_user_data(self, user_id: int, user_data: dict[str, Any]) -> None:
+        """The data in memory is always the latest."""
+
+    async def refresh_chat_data(self, chat_id: int, chat_data: dict) -> None:
+        """Chat data is not stored."""
+
+    async def refresh_bot_data(self, bot_data: dict) -> None:
+        """Bot data is not stored."""
@@ -0,0 +1,101 @@
+import asyncio
+from collections.abc import Awaitable
+from typing import Any
+
+from telegram import Update
+from telegram.ext import BaseUpdateProcessor
+
+
+class PerUserUpdateProcessor(BaseUpdateProcessor):
+    """
+    Process updates concurrently, but one at a time per user.
+
+    Updates of the same user (or of the same chat if there is no user) are
+    handled in the order they were received, so conversation states change
+    as if updates were processed sequentially. `max_concurrent_updates`
+    limits updates in flight, including those waiting for the previous update
+    of their user, `workers` limits handlers running at the same time. This
+    way a user sending many updates does not take the workers of others.
+    """
+
+    def __init__(self, workers: int, max_concurrent_updates: int) -> None:
+        """
+        Initialize the update processor.
+
+        Args:
+            workers (int): The number of handlers running at the same time.
+            max_concurrent_updates (int): The number of updates in flight.
+
+        Raises:
+            ValueError: If a limit is not positive.
+
+        Returns:
+            None
+        """
+        if workers < 1:
+            msg = "`workers` must be a positive integer!"
+            raise ValueError(msg)
+        super().__init__(max(max_concurrent_updates, workers))
+        self._workers = asyncio.BoundedSemaphore(workers)
+        # Lock and number of updates in flight by user or chat ID.
+        self._locks: dict[int, tuple[asyncio.Lock, int]] = {}
+
+    async def do_process_update(
+        self,
+        update: object,
+        coroutine: Awaitable[Any],
+    ) -> None:
+        """
+        Wait for the previous update of the user and a free worker, then process.
+
+        Args:
+            update (object): The update to process.
+            coroutine (Awaitable[Any]): The coroutine processing the update.
+
+        Returns:
+            None
+        """
+        key = self._get_key(update)
+        if key is None:
+            async with self._workers:
+                await coroutine
+            return
+        lock = self._acquire_lock(key)
+        try:
+            async with lock, self._workers:
+                await coroutine
+        finally:
+            self._release_lock(key)
+
+    async def initialize(self) -> None:
+        """Nothing to initialize."""
+
+    async def shutdown(self) -> None:
+        """Nothing to shut down."""
+
+    def _acquire_lock(self, key: int) -> asyncio.Lock:
+        """Return the lock of the key and count the update in."""
+        lock, pending = self._locks.get(key, (None, 0))
+        if lock is None:
+            lock = asyncio.Lock()
+        self._locks[key] = (lock, pending + 1)
+        return lock
+
+    def _release_lock(self, key: int) -> None:
+        """Count the update out and forget the lock of the key if unused."""
+        lock, pending = self._locks[key]
+        if pending == 1:
+            del self._locks[key]
+        else:
+            self._locks[key] = (lock, pending - 1)
+
+    @staticmethod
+    def _get_key(update: object) -> int | None:
+        """Return the ID updates are serialized by, None to not serialize."""
+        if not isinstance(update, Update):
+            return None
+        if update.effective_user is not None:
+            return update.effective_user.id
+        if update.effective_chat is not None:
+            return update.effective_chat.id
+        return None
@@ -0,0 +1,37 @@
+from typing import Any
+
+from app.core.config import Settings
+
+
+class WebhookSecretTokenNotSetError(Exception):
+    """Raised when the webhook is configured without a secret token."""
+
+
+def get_webhook_options(config: Settings) -> dict[str, Any]:
+    """
+    Return keyword arguments for `run_webhook`/`start_webhook` of the bot.
+
+    The local server listens on `WEBHOOK_LISTEN:WEBHOOK_PORT` at
+    `/WEBHOOK_PATH` and accepts only requests carrying the secret token, the
+    public URL is registered with Telegram on start.
+
+    Args:
+        config (Settings): The settings.
+
+    Raises:
+        WebhookSecretTokenNotSetError: If `WEBHOOK_SECRET_TOKEN` is not set.
+
+    Returns:
+        dict[str, Any]: The keyword arguments.
+    """
+    if not config.WEBHOOK_SECRET_TOKEN:
+        raise WebhookSecretTokenNotSetError
+    url_path = config.WEBHOOK_PATH.strip("/")
+    return {
+        "listen": config.WEBHOOK_LISTEN,
+        "port": config.WEBHOOK_PORT,
+        "url_path": url_path,
+        "webhook_url": f"{str(config.WEBHOOK_URL).rstrip('/')}/{url_path}",
+        "secret_token": config.WEBHOOK_SECRET_TOKEN,
+        "drop_pending_updates": True,
+    }
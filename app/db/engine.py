@@ -1,6 +1,12 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from types import TracebackType
+from typing import TypeVar
 
+from loguru import logger
 from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
@@ -8,11 +14,17 @@ from sqlalchemy.ext.asyncio import (
 )
 
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncPool
 from app.db.repositories import ApplicationRepository
+from app.db.repositories.abstract import Repository
 from app.db.repositories.admin_processing_application import (
     AdminProcessingApplicationRepository,
 )
 from app.db.repositories.application_answer import ApplicationAnswerRepository
+from app.db.repositories.broadcast import BroadcastRepository
+from app.db.repositories.invite_link import InviteLinkRepository
+from app.db.repositories.outbox import OutboxRepository
+from app.db.repositories.persistence import PersistenceRepository
 from app.db.repositories.user import UserRepository
 
 
@@ -26,45 +38,108 @@ def _create_db_engine() -> AsyncEngine:
     return create_async_engine(
         str(settings.SQLALCHEMY_DATABASE_URI),
         echo=settings.SQLALCHEMY_ECHO,
+        poolclass=InstrumentedAsyncPool,
+        pool_size=settings.SQLALCHEMY_POOL_SIZE,
+        max_overflow=settings.SQLALCHEMY_MAX_OVERFLOW,
+        pool_timeout=settings.SQLALCHEMY_POOL_TIMEOUT,
+        pool_recycle=settings.SQLALCHEMY_POOL_RECYCLE,
+        pool_pre_ping=settings.SQLALCHEMY_POOL_PRE_PING,
+        query_cache_size=settings.SQLALCHEMY_QUERY_CACHE_SIZE,
+        connect_args={
+            "prepared_statement_cache_size": (
+                settings.SQLALCHEMY_PREPARED_STATEMENT_CACHE_SIZE
+            ),
+        },
     )
 
 
-session_factory: async_sessionmaker = async_sessionmaker(_create_db_engine())
+async def warm_up_pool(db_engine: AsyncEngine, connections: int) -> None:
+    """
+    Open connections at once and return them to the pool.
+
+    A failed connection is only logged, the pool opens it again on demand.
+
+    Args:
+        db_engine (AsyncEngine): The engine.
+        connections (int): The number of connections to open.
+
+    Returns:
+        None
+    """
+    results = await asyncio.gather(
+        *(db_engine.connect().start() for _ in range(connections)),
+        return_exceptions=True,
+    )
+    opened = 0
+    for result in results:
+        if isinstance(result, AsyncConnection):
+            await result.close()
+            opened += 1
+        else:
+            logger.warning(f"Не удалось открыть соединение с БД заранее: {result!r}")
+    logger.debug(f"Открыто соединений с БД заранее: {opened}")
+
+
+engine = _create_db_engine()
+session_factory: async_sessionmaker = async_sessionmaker(engine)
+# Autocommit sessions do not wrap reads into BEGIN ... ROLLBACK.
+read_only_session_factory: async_sessionmaker = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+)
+
+RepositoryT = TypeVar("RepositoryT", bound=Repository)
+
+
+class ReadOnlyUnitOfWorkError(Exception):
+    """Raised when a read-only unit of work is committed."""
 
 
 class UnitOfWork:
-    """Provide a unit of work pattern for the database."""
+    """
+    Provide a unit of work pattern for the database.
+
+    The session and repositories are created lazily, so a unit of work that
+    never touches a repository does not check out a connection.
+
+    Inside `scope()` all `async with uow()` blocks share one session, so
+    entities loaded by one service are reused by the next one. Every block
+    ends its transaction on exit, so the connection is not held between the
+    blocks.
+    """
 
     def __init__(self) -> None:
         """Initialize the unit of work instance."""
         self._session_factory = session_factory
+        self._read_only_session_factory = read_only_session_factory
+        self._read_only = False
+        self._scoped = False
+        self._session: AsyncSession | None = None
+        self._repositories: dict[type[Repository], Repository] = {}
 
-    def __call__(self) -> "UnitOfWork":
+    def __call__(self, *, read_only: bool = False) -> "UnitOfWork":
         """
         Call the unit of work.
 
+        Args:
+            read_only (bool): Run without an explicit transaction. Commit is
+            forbidden in this mode.
+
         Returns:
             UnitOfWork: The unit of work instance.
         """
+        self._read_only = read_only
         return self
 
     async def __aenter__(self) -> "UnitOfWork":
         """
         Enter the unit of work.
 
-        Initialize the session and repositories.
-
         Returns:
             UnitOfWork: The unit of work instance.
         """
-        self._session: AsyncSession = self._session_factory()
-
-        self.application = ApplicationRepository(self._session)
-        self.application_answer = ApplicationAnswerRepository(self._session)
-        self.admin_processing_application = AdminProcessingApplicationRepository(
-            self._session,
-        )
-        self.user = UserRepository(self._session)
+        if not self._scoped:
+            self._session = None
+            self._repositories = {}
         return self
 
     # TODO: Add exception handling
@@ -85,13 +160,121 @@ class UnitOfWork:
         Returns:
             None
         """
-        await self.rollback()
-        await self._session.close()
+        read_only = self._read_only
+        self._read_only = False
+        if not self._scoped:
+            await self._close()
+        elif self._session is not None and self._session.in_transaction():
+            if read_only:
+                # End the transaction of the reads, so the connection goes
+                # back to the pool while the handler waits for Telegram. The
+                # session keeps its info, the loaded entities are reused.
+                await self._session.rollback()
+            else:
+                # Discard what the block did not commit, keep the session.
+                await self.rollback()
+
+    @asynccontextmanager
+    async def scope(self) -> AsyncIterator["UnitOfWork"]:
+        """
+        Share one session between all units of work entered inside.
+
+        Yields:
+            UnitOfWork: The unit of work instance.
+        """
+        self._scoped = True
+        self._session = None
+        self._repositories = {}
+        try:
+            yield self
+        finally:
+            self._scoped = False
+            await self._close()
+
+    @property
+    def application(self) -> ApplicationRepository:
+        """Return the application repository."""
+        return self._repository(ApplicationRepository)
+
+    @property
+    def application_answer(self) -> ApplicationAnswerRepository:
+        """Return the application answer repository."""
+        return self._repository(ApplicationAnswerRepository)
+
+    @property
+    def admin_processing_application(self) -> AdminProcessingApplicationRepository:
+        """Return the admin processing application repository."""
+        return self._repository(AdminProcessingApplicationRepository)
+
+    @property
+    def user(self) -> UserRepository:
+        """Return the user repository."""
+        return self._repository(UserRepository)
+
+    @property
+    def broadcast(self) -> BroadcastRepository:
+        """Return the broadcast repository."""
+        return self._repository(BroadcastRepository)
+
+    @property
+    def invite_link(self) -> InviteLinkRepository:
+        """Return the invite link repository."""
+        return self._repository(InviteLinkRepository)
+
+    @property
+    def outbox(self) -> OutboxRepository:
+        """Return the outbox repository."""
+        return self._repository(OutboxRepository)
+
+    @property
+    def persistence(self) -> PersistenceRepository:
+        """Return the persistence repository."""
+        return self._repository(PersistenceRepository)
 
     async def commit(self) -> None:
-        """Commit the changes to the database."""
-        await self._session.commit()
+        """
+        Commit the changes to the database.
+
+        Raises:
+            ReadOnlyUnitOfWorkError: If the unit of work is read-only.
+        """
+        if self._read_only:
+            raise ReadOnlyUnitOfWorkError
+        if self._session is not None:
+            await self._session.commit()
 
     async def rollback(self) -> None:
-        """Rollback the changes to the database."""
-        await self._session.rollback()
+        """Rollback the changes and forget the entities loaded by repositories."""
+        if self._session is not None:
+            await self._session.rollback()
+            self._session.info.clear()
+
+    async def _close(self) -> None:
+        """Rollback and close the session if it was created."""
+        session = self._session
+        self._session = None
+        self._repositories = {}
+        if session is None:
+            return
+        await session.rollback()
+        await session.close()
+
+    def _repository(self, repository_type: type[RepositoryT]) -> RepositoryT:
+        """Return the repository, creating the session on first access."""
+        repository = self._repositories.get(repository_type)
+        if repository is None:
+            repository = repository_type(self._get_session())
+            self._repositories[repository_type] = repository
+        return repository  # type: ignore[return-value]
+
+    def _get_session(self) -> AsyncSession:
+        """Return the current session, creating it on first access."""
+        if self._session is None:
+            # A shared session may be written to by the next blocks.
+            factory = (
+                self._read_only_session_factory
+                if self._read_only and not self._scoped
+                else self._session_factory
+            )
+            self._session = factory()
+        return self._session
@@ -0,0 +1,123 @@
+import asyncio
+import bisect
+import time
+
+from loguru import logger
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, PoolProxiedConnection
+
+# Upper bounds of the checkout wait buckets in seconds.
+WAIT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+class Histogram:
+    """Histogram with fixed bucket bounds."""
+
+    def __init__(self, buckets: tuple[float, ...] = WAIT_BUCKETS) -> None:
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets (tuple[float, ...]): Sorted upper bounds of the buckets.
+
+        Returns:
+            None
+        """
+        self.buckets = buckets
+        # The last counter is for values above the last bound.
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """
+        Add the value to the histogram.
+
+        Args:
+            value (float): The observed value.
+
+        Returns:
+            None
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def cumulative(self) -> list[tuple[float, int]]:
+        """
+        Return the number of values less than or equal to every bound.
+
+        Returns:
+            list[tuple[float, int]]: Pairs of bound and count, the last bound
+            is infinity.
+        """
+        result = []
+        running = 0
+        bounds = (*self.buckets, float("inf"))
+        for bound, count in zip(bounds, self.counts, strict=True):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+checkout_wait = Histogram()
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """Async queue pool that measures how long a checkout waits."""
+
+    def connect(self) -> PoolProxiedConnection:
+        """
+        Check out a connection and record the wait time.
+
+        Returns:
+            PoolProxiedConnection: The connection.
+        """
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            checkout_wait.observe(time.perf_counter() - start)
+
+
+def snapshot(pool: Pool) -> dict[str, float]:
+    """
+    Return the current pool gauges.
+
+    Args:
+        pool (Pool): The pool of the engine.
+
+    Returns:
+        dict[str, float]: Gauge values by name.
+    """
+    gauges: dict[str, float] = {}
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        gauges.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+        )
+    return gauges
+
+
+async def report_periodically(pool: Pool, interval: float) -> None:
+    """
+    Log the pool gauges every `interval` seconds.
+
+    Args:
+        pool (Pool): The pool of the engine.
+        interval (float): Seconds between the reports.
+
+    Returns:
+        None
+    """
+    while True:
+        await asyncio.sleep(interval)
+        buckets = ", ".join(
+            f"<={bound}s:{count}" for bound, count in checkout_wait.cumulative()
+        )
+        logger.info(
+            f"Состояние пула соединений: {snapshot(pool)}; "
+            f"ожидание: {checkout_wait.count} за {checkout_wait.total:.3f}s, "
+            f"{buckets}",
+        )
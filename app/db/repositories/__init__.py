@@ -4,6 +4,9 @@ from app.db.repositories.admin_processing_application import (
 )
 from app.db.repositories.application import ApplicationRepository
 from app.db.repositories.application_answer import ApplicationAnswerRepository
+from app.db.repositories.broadcast import BroadcastRepository
+from app.db.repositories.invite_link import InviteLinkRepository
+from app.db.repositories.outbox import OutboxRepository
 from app.db.repositories.user import UserRepository
 
 __all__ = [
@@ -12,4 +15,7 @@ __all__ = [
     "ApplicationRepository",
     "ApplicationAnswerRepository",
     "AdminProcessingApplicationRepository",
+    "BroadcastRepository",
+    "InviteLinkRepository",
+    "OutboxRepository",
 ]
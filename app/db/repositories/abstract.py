@@ -1,10 +1,73 @@
+from collections.abc import Iterable, Sequence
 from typing import Generic, TypeVar
 
+from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models import Base
 
 AbstractModel = TypeVar("AbstractModel", bound=Base)
+DTO = TypeVar("DTO", bound=BaseModel)
+
+# Repositories build their statements once at import with bound parameters,
+# so a call only passes the values and SQLAlchemy reuses the memoized cache
+# key and compiled SQL. Rows read by the statements become DTOs through
+# `RowMapper`.
+
+class RowMapper(Generic[DTO]):
+    """
+    Build DTOs from rows read from our database without validation.
+
+    The columns already have the types of the DTO fields, so validation only
+    costs time, and reading row values by name costs more than the DTO itself.
+    The mapper resolves the positions of the fields once and then builds the
+    DTO with `model_construct` from the values read by position. Fields
+    without a column get their defaults. Data coming from Telegram must still
+    be validated.
+    """
+
+    def __init__(self, dto_type: type[DTO], keys: Iterable[str]) -> None:
+        """
+        Initialize the mapper.
+
+        Args:
+            dto_type (type[DTO]): The DTO class.
+            keys (Iterable[str]): Leading column names of the mapped rows.
+
+        Raises:
+            ValueError: If a required DTO field has no column.
+
+        Returns:
+            None
+        """
+        keys = list(keys)
+        self._dto_type = dto_type
+        self._fields = tuple(name for name in dto_type.model_fields if name in keys)
+        self._fields_set = frozenset(self._fields)
+        self._positions = tuple(keys.index(name) for name in self._fields)
+        for name, field in dto_type.model_fields.items():
+            if name not in self._fields_set and field.is_required():
+                msg = f"{dto_type.__name__}.{name} has no column"
+                raise ValueError(msg)
+
+    def __call__(self, row: Sequence[object]) -> DTO:
+        """
+        Build the DTO from the row.
+
+        Args:
+            row (Sequence[object]): The row.
+
+        Returns:
+            DTO: The DTO.
+        """
+        values = {
+            name: row[position]
+            for name, position in zip(self._fields, self._positions, strict=True)
+        }
+        return self._dto_type.model_construct(
+            _fields_set=set(self._fields_set),
+            **values,
+        )
 
 
 class Repository(Generic[AbstractModel]):
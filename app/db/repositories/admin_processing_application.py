@@ -1,9 +1,9 @@
 from loguru import logger
-from sqlalchemy import delete, insert, select
+from sqlalchemy import Row, bindparam, delete, insert, select
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.repositories.abstract import Repository
+from app.db.repositories.abstract import Repository, RowMapper
 from app.domain.admin_processing_application.dto import AdminProcessingApplicationDTO
 from app.domain.admin_processing_application.entities import (
     AdminProcessingApplication as AdminProcessingApplicationEntity,
@@ -14,6 +14,17 @@ from app.domain.admin_processing_application.exceptions import (
 )
 from app.models import AdminProcessingApplication
 
+_table = AdminProcessingApplication.__table__
+_to_dto = RowMapper(AdminProcessingApplicationDTO, _table.columns.keys())
+_CREATE = insert(_table)
+_GET_BY_ADMIN_ID = select(*_table.columns).where(
+    _table.c.admin_id == bindparam("admin_id"),
+)
+_DELETE = delete(_table).where(
+    _table.c.admin_id == bindparam("admin_id"),
+    _table.c.application_id == bindparam("application_id"),
+)
+
 
 class AdminProcessingApplicationRepository(Repository[AdminProcessingApplication]):
     """
@@ -47,12 +58,8 @@ class AdminProcessingApplicationRepository(Repository[AdminProcessingApplication
         Returns:
             AdminProcessingApplicationEntity: The inserted entity.
         """
-        query = insert(self.model).values(
-            admin_id=entity.admin_id,
-            application_id=entity.application_id,
-        )
         try:
-            await self.session.execute(query)
+            await self.session.execute(_CREATE, self._get_params(entity))
         except IntegrityError as e:
             raise ApplicationAlreadyProcessedError from e
         return entity
@@ -70,10 +77,11 @@ class AdminProcessingApplicationRepository(Repository[AdminProcessingApplication
         Returns:
             AdminProcessingApplicationEntity | None: The entity if found, else None.
         """
-        logger.debug(f"Получение обрабатываемой админом {admin_id=} заявки")
-        query = select(self.model).filter_by(admin_id=admin_id)
+        logger.debug("Получение обрабатываемой админом admin_id={} заявки", admin_id)
         try:
-            res = (await self.session.execute(query)).scalar_one()
+            res = (
+                await self.session.execute(_GET_BY_ADMIN_ID, {"admin_id": admin_id})
+            ).one()
         except NoResultFound as e:
             raise AdminProcessingApplicationDoesNotExistError from e
         return self._get_entity(res)
@@ -88,25 +96,36 @@ class AdminProcessingApplicationRepository(Repository[AdminProcessingApplication
         Returns:
             None
         """
-        query = delete(self.model).filter_by(
-            admin_id=entity.admin_id,
-            application_id=entity.application_id,
-        )
-        await self.session.execute(query)
+        await self.session.execute(_DELETE, self._get_params(entity))
 
-    def _get_entity(
+    def _get_params(
         self,
-        obj: AdminProcessingApplication,
-    ) -> AdminProcessingApplicationEntity:
+        entity: AdminProcessingApplicationEntity,
+    ) -> dict[str, object]:
+        """
+        Return the column values of the entity.
+
+        Args:
+            entity (AdminProcessingApplicationEntity): The entity.
+
+        Returns:
+            dict[str, object]: Values by column name.
+        """
+        return {
+            "admin_id": entity.admin_id,
+            "application_id": entity.application_id,
+        }
+
+    def _get_entity(self, row: Row) -> AdminProcessingApplicationEntity:
         """
-        Convert an database object to an AdminProcessingApplicationEntity.
+        Convert a database row to an AdminProcessingApplicationEntity.
 
         Args:
-            obj (AdminProcessingApplication): The object to convert.
+            row (Row): The row to convert.
 
         Returns:
             AdminProcessingApplicationEntity: The converted entity.
         """
         return AdminProcessingApplicationEntity(
-            data=AdminProcessingApplicationDTO.model_validate(obj),
+            data=_to_dto(row),
         )
@@ -1,20 +1,179 @@
-from sqlalchemy import delete, select, update
+from collections.abc import Sequence
+from datetime import datetime
+
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    FromClause,
+    Row,
+    Select,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.db.repositories.abstract import Repository
+from app.db.repositories.abstract import Repository, RowMapper
+from app.domain.admin_processing_application.exceptions import (
+    AdminAlreadyProcessedApplicationError,
+)
 from app.domain.application.dto import ApplicationDTO
 from app.domain.application.entities import Application as ApplicationEntity
 from app.domain.application.exceptions import (
     ApplicationAlreadyExistsError,
     ApplicationDoesNotExistError,
 )
-from app.domain.application_answers.dto import AnswerDTO
-from app.domain.application_answers.entities import ApplicationAnswer
-from app.models import Application
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.application_answers.entities import ApplicationAnswers
+from app.models import AdminProcessingApplication, Application, User
 from app.models import ApplicationAnswer as ApplicationAnswerModel
 
+# Key of the loaded applications in `AsyncSession.info`.
+IDENTITY_MAP_KEY = "applications"
+
+_table = Application.__table__
+# Every statement reading applications returns the table columns first.
+_to_application_dto = RowMapper(ApplicationDTO, _table.columns.keys())
+_CREATE = insert(_table).returning(*_table.columns)
+_LAST_BY_USER = (
+    select(*_table.columns)
+    .where(_table.c.user_id == bindparam("user_id"))
+    .order_by(_table.c.created_at.desc())
+    .limit(1)
+)
+_RETRIEVE_LAST_ROW = _LAST_BY_USER
+_RETRIEVE_LAST_ID = _LAST_BY_USER.with_only_columns(_table.c.id)
+_RETRIEVE_LAST_STATUS_AND_BAN = _LAST_BY_USER.with_only_columns(
+    _table.c.status,
+    User.is_banned,
+).join_from(_table, User, User.id == _table.c.user_id)
+# The last application of every user, served by the (user_id, created_at) index.
+_RETRIEVE_LAST_MANY = (
+    select(*_table.columns)
+    .where(_table.c.user_id == any_(bindparam("user_ids", type_=ARRAY(BigInteger))))
+    .order_by(_table.c.user_id, _table.c.created_at.desc())
+    .distinct(_table.c.user_id)
+)
+_COUNT_BY_STATUS = select(_table.c.status, func.count()).group_by(_table.c.status)
+# SET values are taken from the parameters named after the columns.
+_UPDATE = update(_table).where(_table.c.id == bindparam("application_id"))
+# A message ID that is not passed keeps its value.
+_SET_MESSAGES = (
+    update(_table)
+    .where(_table.c.id == bindparam("application_id"))
+    .values(
+        admin_chat_message_id=func.coalesce(
+            bindparam("new_admin_chat_message_id", type_=BigInteger),
+            _table.c.admin_chat_message_id,
+        ),
+        review_message_id=func.coalesce(
+            bindparam("new_review_message_id", type_=BigInteger),
+            _table.c.review_message_id,
+        ),
+    )
+    .returning(_table.c.id)
+)
+_DELETE_ANSWERS = delete(ApplicationAnswerModel.__table__).where(
+    ApplicationAnswerModel.application_id == bindparam("application_id"),
+)
+
+
+def _select_with_answers(application: FromClause) -> Select:
+    """
+    Select rows of the application joined with its answers.
+
+    Args:
+        application (FromClause): Table, subquery or data-modifying CTE
+        with application columns.
+
+    Returns:
+        Select: One row per answer, or one row if there are no answers.
+    """
+    return select(
+        application,
+        ApplicationAnswerModel.question_number,
+        ApplicationAnswerModel.answer_text,
+    ).outerjoin(
+        ApplicationAnswerModel,
+        ApplicationAnswerModel.application_id == application.c.id,
+    )
+
+
+_GET_BY_ID = _select_with_answers(_table).where(
+    _table.c.id == bindparam("application_id"),
+)
+_RETRIEVE_LAST = _select_with_answers(_LAST_BY_USER.subquery("last"))
+
+
+def _take_statement() -> Select:
+    """
+    Build the statement that takes a waiting application.
+
+    Returns:
+        Select: The statement with `application_id` and `admin_id` parameters.
+    """
+    taken = (
+        update(Application)
+        .where(
+            Application.id == bindparam("application_id"),
+            Application.status == ApplicationEntity.TAKEABLE_STATUS,
+        )
+        .values(status=ApplicationStatusEnum.PROCESSING)
+        .returning(*_table.columns)
+        .cte("taken")
+    )
+    assign = insert(AdminProcessingApplication).from_select(
+        ["admin_id", "application_id"],
+        select(bindparam("admin_id", type_=BigInteger), taken.c.id),
+    )
+    return _select_with_answers(taken).add_cte(assign.cte("assigned"))
+
+
+def _decide_statement(*columns: str) -> Select:
+    """
+    Build the statement that releases the application and updates it.
+
+    Args:
+        *columns (str): Columns to set, the values are passed as parameters
+        named `new_<column>`.
+
+    Returns:
+        Select: The statement with `application_id` and `admin_id` parameters.
+    """
+    released = (
+        delete(AdminProcessingApplication)
+        .where(
+            AdminProcessingApplication.admin_id == bindparam("admin_id"),
+            AdminProcessingApplication.application_id == bindparam("application_id"),
+        )
+        .returning(AdminProcessingApplication.application_id)
+        .cte("released")
+    )
+    decided = (
+        update(Application)
+        .where(
+            Application.id == released.c.application_id,
+            Application.status == ApplicationEntity.DECIDABLE_STATUS,
+        )
+        .values(
+            status=bindparam("new_status"),
+            **{column: bindparam(f"new_{column}") for column in columns},
+        )
+        .returning(*_table.columns)
+        .cte("decided")
+    )
+    return _select_with_answers(decided)
+
+
+_TAKE = _take_statement()
+_ACCEPT = _decide_statement("invite_link")
+_REJECT = _decide_statement("rejection_reason", "decision_date")
+
 
 class ApplicationRepository(Repository[Application]):
     """
@@ -45,15 +204,14 @@ class ApplicationRepository(Repository[Application]):
         Returns:
             ApplicationEntity: The created application.
         """
-        application = Application(user_id=user_id)
         try:
-            self.session.add(application)
-            await self.session.flush()
+            row = (
+                await self.session.execute(_CREATE, {"user_id": user_id})
+            ).one()
         except IntegrityError as e:
             raise ApplicationAlreadyExistsError from e
 
-        application_dto = ApplicationDTO.model_validate(application)
-        return ApplicationEntity(data=application_dto)
+        return ApplicationEntity(data=_to_application_dto(row))
 
     async def get_by_id(self, application_id: int) -> ApplicationEntity:
         """
@@ -65,23 +223,29 @@ class ApplicationRepository(Repository[Application]):
         Returns:
             ApplicationEntity: The application.
         """
-        stmt = (
-            select(Application)
-            .options(selectinload(Application.answers))
-            .filter_by(id=application_id)
-        )
-        try:
-            res = (await self.session.execute(stmt)).scalar_one()
-        except NoResultFound as e:
-            raise ApplicationDoesNotExistError from e
-        return self._get_application_entity(res)
+        application = self._identity_map.get(application_id)
+        if application is not None:
+            return application
+        rows = (
+            await self.session.execute(_GET_BY_ID, {"application_id": application_id})
+        ).all()
+        if not rows:
+            raise ApplicationDoesNotExistError
+        return self._remember(self._get_application_entity_from_rows(rows))
 
-    async def retrieve_last(self, user_id: int) -> ApplicationEntity:
+    async def retrieve_last(
+        self,
+        user_id: int,
+        *,
+        with_answers: bool = True,
+    ) -> ApplicationEntity:
         """
         Retrieve last user application.
 
         Args:
             user_id (int): The user id.
+            with_answers (bool, optional): Whether to load the answers.
+            Skipping them saves a query. Defaults to True.
 
         Raises:
             ApplicationDoesNotExistError: If the application does not exist.
@@ -89,44 +253,262 @@ class ApplicationRepository(Repository[Application]):
         Returns:
             ApplicationEntity: The application.
         """
-        stmt = (
-            select(Application)
-            .options(selectinload(Application.answers))
-            .where(Application.user_id == user_id)
-            .order_by(
-                Application.created_at.desc(),
+        params = {"user_id": user_id}
+        if not with_answers:
+            try:
+                row = (await self.session.execute(_RETRIEVE_LAST_ROW, params)).one()
+            except NoResultFound as e:
+                raise ApplicationDoesNotExistError from e
+            return ApplicationEntity(data=_to_application_dto(row))
+        rows = (await self.session.execute(_RETRIEVE_LAST, params)).all()
+        if not rows:
+            raise ApplicationDoesNotExistError
+        return self._remember(self._get_application_entity_from_rows(rows))
+
+    async def retrieve_last_many(
+        self,
+        user_ids: Sequence[int],
+    ) -> dict[int, ApplicationEntity]:
+        """
+        Retrieve last applications of the users by one query, without answers.
+
+        Args:
+            user_ids (Sequence[int]): Telegram IDs of the users.
+
+        Returns:
+            dict[int, ApplicationEntity]: Applications by user id, users
+            without applications are missing.
+        """
+        rows = (
+            await self.session.execute(
+                _RETRIEVE_LAST_MANY,
+                {"user_ids": list(user_ids)},
             )
-            .limit(1)
-        )
+        ).all()
+        return {
+            row.user_id: ApplicationEntity(data=_to_application_dto(row))
+            for row in rows
+        }
+
+    async def retrieve_last_id(self, user_id: int) -> int:
+        """
+        Retrieve id of the last user application without loading it.
+
+        Args:
+            user_id (int): The user id.
+
+        Raises:
+            ApplicationDoesNotExistError: If the application does not exist.
+
+        Returns:
+            int: The application id.
+        """
+        try:
+            return (
+                await self.session.execute(_RETRIEVE_LAST_ID, {"user_id": user_id})
+            ).scalar_one()
+        except NoResultFound as e:
+            raise ApplicationDoesNotExistError from e
+
+    async def retrieve_last_status_and_ban(
+        self,
+        user_id: int,
+    ) -> tuple[ApplicationStatusEnum, bool]:
+        """
+        Retrieve status of the last user application and the user ban at once.
+
+        Args:
+            user_id (int): The user id.
+
+        Raises:
+            ApplicationDoesNotExistError: If the application does not exist.
+
+        Returns:
+            tuple[ApplicationStatusEnum, bool]: The application status and
+            whether the user is banned.
+        """
         try:
-            application = (await self.session.execute(stmt)).scalar_one()
+            row = (
+                await self.session.execute(
+                    _RETRIEVE_LAST_STATUS_AND_BAN,
+                    {"user_id": user_id},
+                )
+            ).one()
         except NoResultFound as e:
             raise ApplicationDoesNotExistError from e
-        return self._get_application_entity(application)
+        return row.status, row.is_banned
+
+    async def count_by_status(self) -> dict[ApplicationStatusEnum, int]:
+        """
+        Count applications of every status.
+
+        Returns:
+            dict[ApplicationStatusEnum, int]: The number of applications by
+            status, statuses without applications are missing.
+        """
+        rows = await self.session.execute(_COUNT_BY_STATUS)
+        return dict(rows.tuples().all())
 
     async def update(self, application: ApplicationEntity) -> ApplicationEntity:
         """
         Update application in the database.
 
+        The application is kept in the identity map, so it must be loaded
+        with its answers.
+
         Args:
             application (ApplicationEntity): The application to update.
 
         Returns:
             ApplicationEntity: The updated application.
         """
-        query = (
-            update(Application)
-            .filter_by(id=application.id)
-            .values(
-                invite_link=application.invite_link,
-                decision_date=application.decision_date,
-                rejection_reason=application.rejection_reason,
-                status=application.status,
-            )
+        await self.session.execute(
+            _UPDATE,
+            {
+                "application_id": application.id,
+                "invite_link": application.invite_link,
+                "decision_date": application.decision_date,
+                "rejection_reason": application.rejection_reason,
+                "status": application.status,
+            },
         )
-        await self.session.execute(query)
+        return self._remember(application)
 
-        return application
+    async def take(
+        self,
+        application_id: int,
+        admin_id: int,
+    ) -> ApplicationEntity | None:
+        """
+        Move a waiting application to processing and assign it to the admin.
+
+        The status check, the status change and the admin assignment are
+        executed as a single statement, so concurrent takes are resolved
+        by the database. The answers are returned by the same statement.
+
+        Args:
+            application_id (int): The application id.
+            admin_id (int): Telegram ID of the admin.
+
+        Raises:
+            AdminAlreadyProcessedApplicationError: If the admin already
+            processes another application.
+
+        Returns:
+            ApplicationEntity | None: The taken application, or None if the
+            application does not exist or can not be taken.
+        """
+        params = {"application_id": application_id, "admin_id": admin_id}
+        try:
+            rows = (await self.session.execute(_TAKE, params)).all()
+        except IntegrityError as e:
+            raise AdminAlreadyProcessedApplicationError from e
+        if not rows:
+            return None
+        application = self._get_application_entity_from_rows(rows)
+        application.admin_id = admin_id
+        return self._remember(application)
+
+    async def accept(
+        self,
+        application_id: int,
+        admin_id: int,
+        invite_link: str | None,
+    ) -> ApplicationEntity | None:
+        """
+        Accept an application processed by the admin.
+
+        Releases the application from the admin, changes its status and
+        returns it with the answers in a single statement.
+
+        Args:
+            application_id (int): The application id.
+            admin_id (int): Telegram ID of the admin.
+            invite_link (str | None): The invite link, None if the user
+            joins by a join request.
+
+        Returns:
+            ApplicationEntity | None: The accepted application, or None if the
+            application is not processed by the admin or can not be accepted.
+        """
+        return await self._decide(
+            _ACCEPT,
+            application_id,
+            admin_id,
+            new_status=ApplicationStatusEnum.ACCEPTED,
+            new_invite_link=invite_link,
+        )
+
+    async def reject(
+        self,
+        application_id: int,
+        admin_id: int,
+        rejection_reason: str | None,
+        decision_date: datetime,
+    ) -> ApplicationEntity | None:
+        """
+        Reject an application processed by the admin.
+
+        Releases the application from the admin, changes its status and
+        returns it with the answers in a single statement.
+
+        Args:
+            application_id (int): The application id.
+            admin_id (int): Telegram ID of the admin.
+            rejection_reason (str | None): The reason for rejection.
+            decision_date (datetime): The date of the decision.
+
+        Returns:
+            ApplicationEntity | None: The rejected application, or None if the
+            application is not processed by the admin or can not be rejected.
+        """
+        return await self._decide(
+            _REJECT,
+            application_id,
+            admin_id,
+            new_status=ApplicationStatusEnum.REJECTED,
+            new_rejection_reason=rejection_reason,
+            new_decision_date=decision_date,
+        )
+
+    async def set_messages(
+        self,
+        application_id: int,
+        admin_chat_message_id: int | None = None,
+        review_message_id: int | None = None,
+    ) -> None:
+        """
+        Remember the messages showing the application to admins.
+
+        Args:
+            application_id (int): The application id.
+            admin_chat_message_id (int | None): ID of the post in the admin
+            chat, None keeps the current one.
+            review_message_id (int | None): ID of the review message in the
+            private chat of the admin, None keeps the current one.
+
+        Raises:
+            ApplicationDoesNotExistError: If the application does not exist.
+
+        Returns:
+            None
+        """
+        result = await self.session.execute(
+            _SET_MESSAGES,
+            {
+                "application_id": application_id,
+                "new_admin_chat_message_id": admin_chat_message_id,
+                "new_review_message_id": review_message_id,
+            },
+        )
+        if result.scalar_one_or_none() is None:
+            raise ApplicationDoesNotExistError
+        application = self._identity_map.get(application_id)
+        if application is not None:
+            if admin_chat_message_id is not None:
+                application.admin_chat_message_id = admin_chat_message_id
+            if review_message_id is not None:
+                application.review_message_id = review_message_id
 
     async def delete_answers(self, application_id: int) -> None:
         """
@@ -138,28 +520,71 @@ class ApplicationRepository(Repository[Application]):
         Returns:
             None
         """
-        query = delete(ApplicationAnswerModel).filter_by(
-            application_id=application_id,
+        await self.session.execute(
+            _DELETE_ANSWERS,
+            {"application_id": application_id},
         )
-        await self.session.execute(query)
+        application = self._identity_map.get(application_id)
+        if application is not None:
+            application.answers.clear()
 
-    def _get_application_entity(self, application: Application) -> ApplicationEntity:
+    async def _decide(
+        self,
+        statement: Select,
+        application_id: int,
+        admin_id: int,
+        **values: object,
+    ) -> ApplicationEntity | None:
         """
-        Convert application model to application entity.
+        Release the application from the admin and update it with given values.
 
         Args:
-            application (Application): The application model.
+            statement (Select): Statement built by `_decide_statement`.
+            application_id (int): The application id.
+            admin_id (int): Telegram ID of the admin.
+            **values: Values of the `new_<column>` parameters.
+
+        Returns:
+            ApplicationEntity | None: The updated application or None.
+        """
+        params = {"application_id": application_id, "admin_id": admin_id, **values}
+        rows = (await self.session.execute(statement, params)).all()
+        if not rows:
+            return None
+        return self._remember(self._get_application_entity_from_rows(rows))
+
+    @property
+    def _identity_map(self) -> dict[int, ApplicationEntity]:
+        """Applications loaded or changed in the current session by id."""
+        return self.session.info.setdefault(IDENTITY_MAP_KEY, {})
+
+    def _remember(self, application: ApplicationEntity) -> ApplicationEntity:
+        """Put the application into the identity map and return it."""
+        self._identity_map[application.id] = application
+        return application
+
+    def _get_application_entity_from_rows(
+        self,
+        rows: Sequence[Row],
+    ) -> ApplicationEntity:
+        """
+        Convert rows of `_select_with_answers` to application entity.
+
+        Args:
+            rows (Sequence[Row]): The rows of a single application.
 
         Returns:
             ApplicationEntity: The application entity.
         """
-        application_dto = ApplicationDTO.model_validate(application)
+        application_dto = _to_application_dto(rows[0])
         return ApplicationEntity(
             data=application_dto,
-            answers={
-                a.question_number: ApplicationAnswer(
-                    data=AnswerDTO.model_validate(a),
-                )
-                for a in application.answers
-            },
+            answers=ApplicationAnswers(
+                application_dto.id,
+                {
+                    row.question_number: row.answer_text
+                    for row in rows
+                    if row.question_number is not None
+                },
+            ),
         )
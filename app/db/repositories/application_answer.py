@@ -1,12 +1,27 @@
-from sqlalchemy import insert, update
+from sqlalchemy import bindparam, insert, literal_column, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repositories.abstract import Repository
+from app.db.repositories.application import IDENTITY_MAP_KEY
 from app.domain.application_answers.entities import (
     ApplicationAnswer as ApplicationAnswerEntity,
 )
 from app.models import ApplicationAnswer
 
+# The values are passed as parameters named after the columns.
+_table = ApplicationAnswer.__table__
+_ADD = insert(_table)
+_UPDATE = update(_table).where(
+    _table.c.application_id == bindparam("answer_application_id"),
+    _table.c.question_number == bindparam("answer_question_number"),
+)
+_upsert = pg_insert(_table)
+_UPSERT = _upsert.on_conflict_do_update(
+    index_elements=[_table.c.application_id, _table.c.question_number],
+    set_={"answer_text": _upsert.excluded.answer_text},
+).returning(literal_column("xmax = 0"))
+
 
 class ApplicationAnswerRepository(Repository[ApplicationAnswer]):
     """
@@ -40,12 +55,8 @@ class ApplicationAnswerRepository(Repository[ApplicationAnswer]):
         Returns:
             ApplicationAnswerEntity: The inserted answer.
         """
-        query = insert(self.model).values(
-            application_id=answer.application_id,
-            question_number=answer.question_number,
-            answer_text=answer.answer_text,
-        )
-        await self.session.execute(query)
+        await self.session.execute(_ADD, self._get_params(answer))
+        self._forget_application(answer.application_id)
         return answer
 
     async def update_answer(
@@ -61,12 +72,49 @@ class ApplicationAnswerRepository(Repository[ApplicationAnswer]):
         Returns:
             ApplicationAnswerEntity: The updated answer.
         """
-        statement = (
-            update(ApplicationAnswer)
-            .where(ApplicationAnswer.application_id == answer.application_id)
-            .where(ApplicationAnswer.question_number == answer.question_number)
-            .values(answer_text=answer.answer_text)
+        await self.session.execute(
+            _UPDATE,
+            {
+                "answer_application_id": answer.application_id,
+                "answer_question_number": answer.question_number,
+                "answer_text": answer.answer_text,
+            },
         )
-        await self.session.execute(statement)
-
+        self._forget_application(answer.application_id)
         return answer
+
+    async def upsert_answer(self, answer: ApplicationAnswerEntity) -> bool:
+        """
+        Insert the answer or replace the existing answer to the same question.
+
+        Args:
+            answer (ApplicationAnswerEntity): The answer to save.
+
+        Returns:
+            bool: True if the answer is new, False if an existing one was updated.
+        """
+        is_new = (
+            await self.session.execute(_UPSERT, self._get_params(answer))
+        ).scalar_one()
+        self._forget_application(answer.application_id)
+        return is_new
+
+    def _get_params(self, answer: ApplicationAnswerEntity) -> dict[str, object]:
+        """
+        Return the column values of the answer.
+
+        Args:
+            answer (ApplicationAnswerEntity): The answer.
+
+        Returns:
+            dict[str, object]: Values by column name.
+        """
+        return {
+            "application_id": answer.application_id,
+            "question_number": answer.question_number,
+            "answer_text": answer.answer_text,
+        }
+
+    def _forget_application(self, application_id: int) -> None:
+        """Drop the application with changed answers from the identity map."""
+        self.session.info.get(IDENTITY_MAP_KEY, {}).pop(application_id, None)
@@ -0,0 +1,209 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import (
+    TIMESTAMP,
+    Row,
+    Select,
+    bindparam,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.abstract import Repository, RowMapper
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.broadcast.dto import BroadcastDTO
+from app.domain.broadcast.entities import Broadcast as BroadcastEntity
+from app.domain.broadcast.value_objects import BroadcastAudienceEnum
+from app.models import Application, Broadcast, User
+
+_table = Broadcast.__table__
+_to_broadcast_dto = RowMapper(BroadcastDTO, _table.columns.keys())
+_CREATE = insert(_table).returning(*_table.columns)
+# SET values are taken from the parameters named after the columns.
+_UPDATE = update(_table).where(_table.c.id == bindparam("broadcast_id"))
+_LIST_UNFINISHED = (
+    select(*_table.columns).where(_table.c.is_finished.is_(False)).order_by(_table.c.id)
+)
+
+
+def _recipients_statement(audience: BroadcastAudienceEnum) -> Select:
+    """
+    Build the statement that selects recipients of the audience.
+
+    Args:
+        audience (BroadcastAudienceEnum): The audience.
+
+    Returns:
+        Select: IDs of not banned users after the `after` parameter in
+        ascending order. `created_at` is the creation time of the broadcast.
+    """
+    statement = (
+        select(User.id)
+        .where(User.is_banned.is_(False), User.id > bindparam("after"))
+        .order_by(User.id)
+    )
+    if audience == BroadcastAudienceEnum.ACCEPTED:
+        statement = statement.where(
+            exists().where(
+                Application.user_id == User.id,
+                Application.status == ApplicationStatusEnum.ACCEPTED,
+            ),
+        )
+    elif audience == BroadcastAudienceEnum.REJECTED_THIS_MONTH:
+        # The month of the broadcast, so a resumed broadcast keeps recipients.
+        month_start = func.date_trunc(
+            "month",
+            bindparam("created_at", type_=TIMESTAMP(timezone=True)),
+        )
+        # Only the last application counts, a user who applied again after
+        # the rejection is not rejected. Applications created in one
+        # transaction have the same time, the later ID is the last.
+        last_application = (
+            select(Application.user_id, Application.status, Application.decision_date)
+            .where(Application.user_id > bindparam("after"))
+            .order_by(
+                Application.user_id,
+                Application.created_at.desc(),
+                Application.id.desc(),
+            )
+            .distinct(Application.user_id)
+            .subquery("last_application")
+        )
+        statement = statement.join(
+            last_application,
+            last_application.c.user_id == User.id,
+        ).where(
+            last_application.c.status == ApplicationStatusEnum.REJECTED,
+            last_application.c.decision_date >= month_start,
+        )
+    return statement
+
+
+_RECIPIENTS = {
+    audience: _recipients_statement(audience) for audience in BroadcastAudienceEnum
+}
+
+
+class BroadcastRepository(Repository[Broadcast]):
+    """
+    Responsible for working with the database.
+
+    Manages operations on Broadcast objects.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            None
+        """
+        super().__init__(type_model=Broadcast, session=session)
+
+    async def create(
+        self,
+        admin_id: int,
+        audience: BroadcastAudienceEnum,
+        message: str,
+    ) -> BroadcastEntity:
+        """
+        Create a new broadcast.
+
+        Args:
+            admin_id (int): Telegram ID of the admin who started it.
+            audience (BroadcastAudienceEnum): The recipients.
+            message (str): The message.
+
+        Returns:
+            BroadcastEntity: The created broadcast.
+        """
+        row = (
+            await self.session.execute(
+                _CREATE,
+                {"admin_id": admin_id, "audience": audience, "message": message},
+            )
+        ).one()
+        return self._get_broadcast(row)
+
+    async def update(self, broadcast: BroadcastEntity) -> BroadcastEntity:
+        """
+        Save the progress of the broadcast.
+
+        Args:
+            broadcast (BroadcastEntity): The broadcast.
+
+        Returns:
+            BroadcastEntity: The saved broadcast.
+        """
+        await self.session.execute(
+            _UPDATE,
+            {
+                "broadcast_id": broadcast.id,
+                "last_user_id": broadcast.last_user_id,
+                "delivered": broadcast.delivered,
+                "failed": broadcast.failed,
+                "blocked": broadcast.blocked,
+                "is_finished": broadcast.is_finished,
+                "finished_at": broadcast.finished_at,
+            },
+        )
+        return broadcast
+
+    async def list_unfinished(self) -> list[BroadcastEntity]:
+        """
+        Return broadcasts that were not sent to all recipients.
+
+        Returns:
+            list[BroadcastEntity]: The broadcasts in order of creation.
+        """
+        rows = (await self.session.execute(_LIST_UNFINISHED)).all()
+        return [self._get_broadcast(row) for row in rows]
+
+    async def iter_recipients(
+        self,
+        broadcast: BroadcastEntity,
+        batch_size: int,
+    ) -> AsyncIterator[list[int]]:
+        """
+        Stream IDs of the recipients after `last_user_id` in batches.
+
+        All recipients are read by one query with a server-side cursor, so
+        the session keeps its connection until the iterator is exhausted or
+        closed.
+
+        Args:
+            broadcast (BroadcastEntity): The broadcast.
+            batch_size (int): Rows fetched at once.
+
+        Yields:
+            list[int]: Telegram IDs of the next recipients in ascending order.
+        """
+        result = await self.session.stream_scalars(
+            _RECIPIENTS[broadcast.audience],
+            {"after": broadcast.last_user_id, "created_at": broadcast.created_at},
+            execution_options={"yield_per": batch_size},
+        )
+        try:
+            async for batch in result.partitions():
+                yield list(batch)
+        finally:
+            await result.close()
+
+    def _get_broadcast(self, row: Row) -> BroadcastEntity:
+        """
+        Convert database row to BroadcastEntity.
+
+        Args:
+            row (Row): The row to convert.
+
+        Returns:
+            BroadcastEntity: The converted broadcast.
+        """
+        return BroadcastEntity(_to_broadcast_dto(row))
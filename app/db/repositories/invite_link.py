@@ -0,0 +1,94 @@
+from datetime import datetime
+
+from sqlalchemy import bindparam, delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.abstract import Repository
+from app.models import InviteLink
+
+_table = InviteLink.__table__
+_ADD = insert(_table)
+# The oldest link by primary key, concurrent accepts skip each other's.
+_oldest = (
+    select(_table.c.id)
+    .order_by(_table.c.id)
+    .limit(1)
+    .with_for_update(skip_locked=True)
+    .scalar_subquery()
+)
+_TAKE = delete(_table).where(_table.c.id == _oldest).returning(_table.c.link)
+_COUNT = select(func.count()).select_from(_table)
+_REMOVE_STALE = (
+    delete(_table)
+    .where(_table.c.created_at <= bindparam("fresh_after"))
+    .returning(_table.c.link)
+)
+
+
+class InviteLinkRepository(Repository[InviteLink]):
+    """
+    Responsible for working with the database.
+
+    Manages the pool of invite links that are not given to users yet.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            None
+        """
+        super().__init__(type_model=InviteLink, session=session)
+
+    async def add(self, links: list[str]) -> None:
+        """
+        Put new invite links into the pool.
+
+        Args:
+            links (list[str]): The invite links.
+
+        Returns:
+            None
+        """
+        if links:
+            await self.session.execute(_ADD, [{"link": link} for link in links])
+
+    async def take(self) -> str | None:
+        """
+        Remove the oldest invite link from the pool and return it.
+
+        The link is returned to the pool if the transaction is rolled back.
+
+        Returns:
+            str | None: The invite link, or None if the pool is empty.
+        """
+        return (await self.session.execute(_TAKE)).scalar_one_or_none()
+
+    async def count(self) -> int:
+        """
+        Return the number of invite links in the pool.
+
+        Returns:
+            int: The number of links.
+        """
+        return (await self.session.execute(_COUNT)).scalar_one()
+
+    async def remove_stale(self, fresh_after: datetime) -> list[str]:
+        """
+        Remove stale invite links from the pool.
+
+        Args:
+            fresh_after (datetime): Links created earlier are stale.
+
+        Returns:
+            list[str]: The removed links, they still have to be revoked.
+        """
+        return list(
+            (
+                await self.session.execute(_REMOVE_STALE, {"fresh_after": fresh_after})
+            ).scalars(),
+        )
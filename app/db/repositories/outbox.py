@@ -0,0 +1,212 @@
+from collections.abc import Sequence
+from datetime import timedelta
+
+from sqlalchemy import (
+    ARRAY,
+    Integer,
+    Interval,
+    any_,
+    bindparam,
+    delete,
+    exists,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.abstract import Repository, RowMapper
+from app.domain.outbox.dto import OutboxMessageDTO
+from app.domain.outbox.entities import OutboxMessage as OutboxMessageEntity
+from app.models import OutboxMessage
+
+_table = OutboxMessage.__table__
+_to_dto = RowMapper(OutboxMessageDTO, _table.columns.keys())
+_ids = bindparam("message_ids", type_=ARRAY(Integer))
+_ADD = insert(_table)
+# A chat is claimed as a whole by locking its oldest pending message, the
+# head. A chat is due when its head is due, so messages written later wait
+# for a retried or leased head, even if another worker would take them.
+# Claimed messages are hidden from other workers until the lease ends, so a
+# worker that stopped mid-batch does not lose them.
+_earlier = _table.alias("earlier")
+_due_chats = (
+    select(_table.c.chat_id)
+    .where(
+        _table.c.failed_at.is_(None),
+        _table.c.available_at <= func.now(),
+        ~exists().where(
+            _earlier.c.chat_id == _table.c.chat_id,
+            _earlier.c.failed_at.is_(None),
+            _earlier.c.id < _table.c.id,
+        ),
+    )
+    .order_by(_table.c.id)
+    .limit(bindparam("limit"))
+    .with_for_update(of=_table, skip_locked=True)
+)
+_lease_end = func.now() + bindparam("lease", type_=Interval)
+_CLAIM = (
+    update(_table)
+    .where(
+        _table.c.failed_at.is_(None),
+        _table.c.chat_id.in_(_due_chats.scalar_subquery()),
+    )
+    .values(available_at=_lease_end)
+    .returning(*_table.columns)
+)
+_EXTEND_LEASE = (
+    update(_table)
+    .where(_table.c.id == any_(_ids), _table.c.failed_at.is_(None))
+    .values(available_at=_lease_end)
+)
+_DELETE = delete(_table).where(_table.c.id == any_(_ids))
+_RESCHEDULE = (
+    update(_table)
+    .where(_table.c.id == bindparam("message_id"))
+    .values(
+        attempts=bindparam("new_attempts"),
+        available_at=func.now() + bindparam("delay", type_=Interval),
+    )
+)
+_FAIL = (
+    update(_table)
+    .where(_table.c.id == any_(_ids))
+    .values(failed_at=func.now(), attempts=_table.c.attempts + 1)
+)
+
+
+class OutboxRepository(Repository[OutboxMessage]):
+    """
+    Responsible for working with the database.
+
+    Manages the messages waiting to be sent after the commit.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            None
+        """
+        super().__init__(type_model=OutboxMessage, session=session)
+
+    async def add(self, chat_id: int, messages: Sequence[str]) -> None:
+        """
+        Write messages to the outbox, they are sent if the transaction commits.
+
+        Args:
+            chat_id (int): Telegram ID of the chat.
+            messages (Sequence[str]): Texts of the messages in the order to
+            send them.
+
+        Returns:
+            None
+        """
+        await self.session.execute(
+            _ADD,
+            [{"chat_id": chat_id, "message": message} for message in messages],
+        )
+
+    async def claim(self, limit: int, lease: timedelta) -> list[OutboxMessageEntity]:
+        """
+        Take all pending messages of the chats that are due and hide them.
+
+        Chats are taken in the order of their oldest message. A chat whose
+        oldest pending message is retried later or claimed by another worker
+        is not due.
+
+        Args:
+            limit (int): The maximum number of chats.
+            lease (timedelta): Time to send the messages.
+
+        Returns:
+            list[OutboxMessageEntity]: The messages in the order they were written.
+        """
+        rows = (
+            await self.session.execute(_CLAIM, {"limit": limit, "lease": lease})
+        ).all()
+        messages = [OutboxMessageEntity(_to_dto(row)) for row in rows]
+        messages.sort(key=lambda message: message.id)
+        return messages
+
+    async def extend_lease(
+        self,
+        message_ids: Sequence[int],
+        lease: timedelta,
+    ) -> None:
+        """
+        Hide claimed messages from other workers for another lease.
+
+        Args:
+            message_ids (Sequence[int]): IDs of the messages.
+            lease (timedelta): Time to send the messages from now.
+
+        Returns:
+            None
+        """
+        if message_ids:
+            await self.session.execute(
+                _EXTEND_LEASE,
+                {"message_ids": list(message_ids), "lease": lease},
+            )
+
+    async def delete(self, message_ids: Sequence[int]) -> None:
+        """
+        Remove sent messages.
+
+        Args:
+            message_ids (Sequence[int]): IDs of the messages.
+
+        Returns:
+            None
+        """
+        if message_ids:
+            await self.session.execute(_DELETE, {"message_ids": list(message_ids)})
+
+    async def reschedule(
+        self,
+        messages: Sequence[OutboxMessageEntity],
+        delays: Sequence[timedelta],
+    ) -> None:
+        """
+        Make the messages due again after the delays.
+
+        Args:
+            messages (Sequence[OutboxMessageEntity]): The messages with
+            updated attempts.
+            delays (Sequence[timedelta]): The delay of every message.
+
+        Returns:
+            None
+        """
+        if messages:
+            await self.session.execute(
+                _RESCHEDULE,
+                [
+                    {
+                        "message_id": message.id,
+                        "new_attempts": message.attempts,
+                        "delay": delay,
+                    }
+                    for message, delay in zip(messages, delays, strict=True)
+                ],
+            )
+
+    async def fail(self, message_ids: Sequence[int]) -> None:
+        """
+        Stop sending the messages, they are kept for inspection.
+
+        Args:
+            message_ids (Sequence[int]): IDs of the messages.
+
+        Returns:
+            None
+        """
+        if message_ids:
+            await self.session.execute(_FAIL, {"message_ids": list(message_ids)})
@@ -0,0 +1,141 @@
+from collections.abc import Mapping
+from typing import Any
+
+from sqlalchemy import (
+    ARRAY,
+    BigInteger,
+    any_,
+    bindparam,
+    delete,
+    func,
+    select,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repositories.abstract import Repository
+from app.models import ConversationState, UserData
+
+_user_data = UserData.__table__
+_conversations = ConversationState.__table__
+_LIST_USER_DATA = select(_user_data.c.user_id, _user_data.c.data)
+_upsert_user_data = insert(_user_data)
+_SAVE_USER_DATA = _upsert_user_data.on_conflict_do_update(
+    index_elements=[_user_data.c.user_id],
+    set_={"data": _upsert_user_data.excluded.data, "updated_at": func.now()},
+)
+_DROP_USER_DATA = delete(_user_data).where(
+    _user_data.c.user_id == any_(bindparam("user_ids", type_=ARRAY(BigInteger))),
+)
+_LIST_CONVERSATIONS = select(_conversations.c.key, _conversations.c.state).where(
+    _conversations.c.name == bindparam("name"),
+)
+_upsert_conversation = insert(_conversations)
+_SAVE_CONVERSATION = _upsert_conversation.on_conflict_do_update(
+    index_elements=[_conversations.c.name, _conversations.c.key],
+    set_={"state": _upsert_conversation.excluded.state, "updated_at": func.now()},
+)
+_END_CONVERSATION = delete(_conversations).where(
+    tuple_(_conversations.c.name, _conversations.c.key)
+    == tuple_(bindparam("name"), bindparam("key", type_=ARRAY(BigInteger))),
+)
+
+ConversationKey = tuple[int, ...]
+
+
+class PersistenceRepository(Repository[UserData]):
+    """
+    Responsible for working with the database.
+
+    Manages the data of `telegram.ext.Application` kept between restarts.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        """
+        Initialize the repository.
+
+        Args:
+            session (AsyncSession): The database session.
+
+        Returns:
+            None
+        """
+        super().__init__(type_model=UserData, session=session)
+
+    async def list_user_data(self) -> dict[int, dict[str, Any]]:
+        """
+        Retrieve the data of all users.
+
+        Returns:
+            dict[int, dict[str, Any]]: The data by Telegram ID of the user.
+        """
+        rows = (await self.session.execute(_LIST_USER_DATA)).all()
+        return dict(rows)
+
+    async def save_user_data(
+        self,
+        changes: Mapping[int, dict[str, Any] | None],
+    ) -> None:
+        """
+        Write the data of the users, `None` removes the data of the user.
+
+        Args:
+            changes (Mapping[int, dict[str, Any] | None]): The new data by
+            Telegram ID of the user.
+
+        Returns:
+            None
+        """
+        saved = [
+            {"user_id": user_id, "data": data}
+            for user_id, data in changes.items()
+            if data is not None
+        ]
+        dropped = [user_id for user_id, data in changes.items() if data is None]
+        if saved:
+            await self.session.execute(_SAVE_USER_DATA, saved)
+        if dropped:
+            await self.session.execute(_DROP_USER_DATA, {"user_ids": dropped})
+
+    async def list_conversations(self, name: str) -> dict[ConversationKey, Any]:
+        """
+        Retrieve the states of a conversation handler.
+
+        Args:
+            name (str): The name of the conversation handler.
+
+        Returns:
+            dict[ConversationKey, Any]: The states by conversation key.
+        """
+        rows = (await self.session.execute(_LIST_CONVERSATIONS, {"name": name})).all()
+        return {tuple(key): state for key, state in rows}
+
+    async def save_conversations(
+        self,
+        changes: Mapping[tuple[str, ConversationKey], Any],
+    ) -> None:
+        """
+        Write the states of conversations, `None` ends the conversation.
+
+        Args:
+            changes (Mapping[tuple[str, ConversationKey], Any]): The new
+            states by name of the conversation handler and conversation key.
+
+        Returns:
+            None
+        """
+        saved = [
+            {"name": name, "key": list(key), "state": state}
+            for (name, key), state in changes.items()
+            if state is not None
+        ]
+        ended = [
+            {"name": name, "key": list(key)}
+            for (name, key), state in changes.items()
+            if state is None
+        ]
+        if saved:
+            await self.session.execute(_SAVE_CONVERSATION, saved)
+        if ended:
+            await self.session.execute(_END_CONVERSATION, ended)
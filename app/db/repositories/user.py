@@ -1,14 +1,31 @@
 from loguru import logger
-from sqlalchemy import insert, select, update
+from sqlalchemy import Row, bindparam, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import IntegrityError, NoResultFound
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.repositories.abstract import Repository
+from app.db.repositories.abstract import Repository, RowMapper
 from app.domain.user.dto import UserDTO
 from app.domain.user.entities import User as UserEntity
 from app.domain.user.exceptions import UserAlreadyExistsError, UserNotFoundError
 from app.models import User as UserModel
 
+# The values are passed as parameters named after the columns.
+_table = UserModel.__table__
+_to_user_dto = RowMapper(UserDTO, _table.columns.keys())
+_CREATE = insert(_table)
+_upsert = pg_insert(_table)
+_UPSERT = _upsert.on_conflict_do_update(
+    index_elements=[_table.c.id],
+    set_={
+        "username": _upsert.excluded.username,
+        "first_name": _upsert.excluded.first_name,
+        "last_name": _upsert.excluded.last_name,
+    },
+).returning(*_table.columns)
+_UPDATE = update(_table).where(_table.c.id == bindparam("user_id"))
+_RETRIEVE = select(*_table.columns).where(_table.c.id == bindparam("user_id"))
+
 
 class UserRepository(Repository[UserModel]):
     """
@@ -39,21 +56,29 @@ class UserRepository(Repository[UserModel]):
         Returns:
             UserEntity: The created user.
         """
-        logger.debug(f"Создание пользователя с id={user.id}")
-        query = insert(self.model).values(
-            id=user.id,
-            username=user.username,
-            first_name=user.first_name,
-            last_name=user.last_name,
-            is_banned=user.is_banned,
-        )
+        logger.debug("Создание пользователя с id={}", user.id)
         try:
-            await self.session.execute(query)
+            await self.session.execute(_CREATE, self._get_params(user))
         except IntegrityError as e:
             raise UserAlreadyExistsError from e
-        logger.debug(f"Создан пользователь с id={user.id}")
+        logger.debug("Создан пользователь с id={}", user.id)
         return user
 
+    async def upsert(self, user: UserEntity) -> UserEntity:
+        """
+        Create the user or refresh the profile data of the existing one.
+
+        The ban status of an existing user is kept as is.
+
+        Args:
+            user (UserEntity): The user entity instance.
+
+        Returns:
+            UserEntity: The stored user.
+        """
+        res = (await self.session.execute(_UPSERT, self._get_params(user))).one()
+        return self._get_user(res)
+
     async def update(self, user: UserEntity) -> UserEntity:
         """
         Update the user data in the database based on the provided user.
@@ -64,17 +89,9 @@ class UserRepository(Repository[UserModel]):
         Returns:
             UserEntity: The updated user.
         """
-        query = (
-            update(self.model)
-            .filter_by(id=user.id)
-            .values(
-                username=user.username,
-                first_name=user.first_name,
-                last_name=user.last_name,
-                is_banned=user.is_banned,
-            )
-        )
-        await self.session.execute(query)
+        params = self._get_params(user)
+        params["user_id"] = params.pop("id")
+        await self.session.execute(_UPDATE, params)
 
         return user
 
@@ -89,23 +106,42 @@ class UserRepository(Repository[UserModel]):
             UserEntity: The user.
 
         """
-        stmt = select(self.model).filter_by(id=user_id)
         try:
-            res = (await self.session.execute(stmt)).scalar_one()
+            res = (
+                await self.session.execute(_RETRIEVE, {"user_id": user_id})
+            ).one()
         except NoResultFound as e:
             raise UserNotFoundError from e
 
         return self._get_user(res)
 
-    def _get_user(self, obj: UserModel) -> UserEntity:
+    def _get_params(self, user: UserEntity) -> dict[str, object]:
+        """
+        Return the column values of the user.
+
+        Args:
+            user (UserEntity): The user.
+
+        Returns:
+            dict[str, object]: Values by column name.
+        """
+        return {
+            "id": user.id,
+            "username": user.username,
+            "first_name": user.first_name,
+            "last_name": user.last_name,
+            "is_banned": user.is_banned,
+        }
+
+    def _get_user(self, row: Row) -> UserEntity:
         """
-        Convert database object to UserEntity.
+        Convert database row to UserEntity.
 
         Args:
-            obj (UserModel): The object to convert.
+            row (Row): The row to convert.
 
         Returns:
             UserEntity: The converted user.
         """
-        data = UserDTO.model_validate(obj)
+        data = _to_user_dto(row)
         return UserEntity(data)
@@ -4,6 +4,8 @@ from app.domain.admin_processing_application.dto import AdminProcessingApplicati
 class AdminProcessingApplication:
     """Represents an application being processed by an admin."""
 
+    __slots__ = ("admin_id", "application_id")
+
     def __init__(self, data: AdminProcessingApplicationDTO) -> None:
         """
         Initialize the admin processing application instance.
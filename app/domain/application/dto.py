@@ -16,4 +16,6 @@ class ApplicationDTO(BaseModel):
     rejection_reason: str | None = None
     admin_id: int | None = None
     invite_link: str | None = None
+    admin_chat_message_id: int | None = None
+    review_message_id: int | None = None
     status: ApplicationStatusEnum
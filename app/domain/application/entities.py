@@ -8,11 +8,11 @@ from app.domain.application.exceptions import (
     ApplicationDoesNotCompeteError,
     ChangeApplicationStatusError,
 )
-from app.domain.application.value_objects import (
-    ApplicationQuestionEnum,
-    ApplicationStatusEnum,
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.application_answers.entities import (
+    ApplicationAnswer,
+    ApplicationAnswers,
 )
-from app.domain.application_answers.entities import ApplicationAnswer
 
 
 class Application:
@@ -22,17 +22,34 @@ class Application:
     Provides methods to change status, manage the answers.
     """
 
+    __slots__ = (
+        "admin_chat_message_id",
+        "admin_id",
+        "answers",
+        "decision_date",
+        "id",
+        "invite_link",
+        "rejection_reason",
+        "review_message_id",
+        "status",
+        "user_id",
+    )
+
+    # Statuses required by `take` and by `accept`/`reject` respectively.
+    TAKEABLE_STATUS = ApplicationStatusEnum.WAITING
+    DECIDABLE_STATUS = ApplicationStatusEnum.PROCESSING
+
     def __init__(
         self,
         data: ApplicationDTO,
-        answers: dict[int, ApplicationAnswer] | None = None,
+        answers: ApplicationAnswers | None = None,
     ) -> None:
         """
         Initialize the application instance.
 
         Args:
             data (ApplicationDTO): The data of the application.
-            answers (dict[int, ApplicationAnswer], optional): Answers.
+            answers (ApplicationAnswers, optional): Answers.
         """
         self.id = data.id
         self.user_id = data.user_id
@@ -40,8 +57,10 @@ class Application:
         self.decision_date = data.decision_date
         self.invite_link = data.invite_link
         self.rejection_reason = data.rejection_reason
-        self.answers = answers if answers else {}
+        self.answers = answers if answers is not None else ApplicationAnswers(data.id)
         self.admin_id = data.admin_id
+        self.admin_chat_message_id = data.admin_chat_message_id
+        self.review_message_id = data.review_message_id
 
     def add_new_answer(self, answer: ApplicationAnswer) -> None:
         """
@@ -56,7 +75,7 @@ class Application:
         if answer.question_number in self.answers:
             raise ApplicationAnswerAlreadyExistError
 
-        self.answers[answer.question_number] = answer
+        self.answers.put(answer)
 
     def update_answer(self, answer: ApplicationAnswer) -> None:
         """
@@ -71,14 +90,14 @@ class Application:
         if answer.question_number not in self.answers:
             raise ApplicationAnswerDoesNotExistError
 
-        self.answers[answer.question_number] = answer
+        self.answers.put(answer)
 
     def clear(self) -> None:
         """Remove all answers from the application."""
         if self.status != ApplicationStatusEnum.IN_PROGRESS:
             raise ApplicationAlreadyCompleteError
 
-        self.answers = {}
+        self.answers.clear()
 
     def complete(self) -> None:
         """Change the application status to 'WAITING'."""
@@ -100,23 +119,23 @@ class Application:
         Returns:
             None
         """
-        if self.status != ApplicationStatusEnum.WAITING:
+        if self.status != self.TAKEABLE_STATUS:
             raise ChangeApplicationStatusError
 
         self.admin_id = admin_id
         self.status = ApplicationStatusEnum.PROCESSING
 
-    def accept(self, invite_link: str) -> None:
+    def accept(self, invite_link: str | None) -> None:
         """
         Change the application status to 'ACCEPTED'.
 
         Args:
-            invite_link (str): The invite link of the application.
+            invite_link (str | None): The invite link of the application.
 
         Returns:
             None
         """
-        if self.status != ApplicationStatusEnum.PROCESSING:
+        if self.status != self.DECIDABLE_STATUS:
             raise ChangeApplicationStatusError
 
         self.status = ApplicationStatusEnum.ACCEPTED
@@ -133,7 +152,7 @@ class Application:
         Returns:
             None
         """
-        if self.status != ApplicationStatusEnum.PROCESSING:
+        if self.status != self.DECIDABLE_STATUS:
             raise ChangeApplicationStatusError
 
         self.status = ApplicationStatusEnum.REJECTED
@@ -143,4 +162,4 @@ class Application:
 
     def _check_is_all_answers_filled(self) -> bool:
         """Check if all answers are filled."""
-        return set(self.answers.keys()) == set(ApplicationQuestionEnum.all_ids())
+        return self.answers.is_complete()
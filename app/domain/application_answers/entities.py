@@ -1,9 +1,18 @@
+from collections.abc import Iterator, Mapping
+
+from app.domain.application.value_objects import ApplicationQuestionEnum
 from app.domain.application_answers.dto import AnswerDTO
 
+_QUESTIONS = tuple(ApplicationQuestionEnum)
+# Slot of the answer text by question number.
+_SLOTS = {question: index for index, question in enumerate(_QUESTIONS)}
+
 
 class ApplicationAnswer:
     """Represents an application answer domain object."""
 
+    __slots__ = ("answer_text", "application_id", "question_number")
+
     def __init__(self, data: AnswerDTO) -> None:
         """
         Initialize the application answer instance.
@@ -17,3 +26,100 @@ class ApplicationAnswer:
         self.application_id = data.application_id
         self.answer_text = data.answer_text
         self.question_number = data.question_number
+
+    def __eq__(self, other: object) -> bool:
+        """Compare answers by value."""
+        if not isinstance(other, ApplicationAnswer):
+            return NotImplemented
+        return (
+            self.application_id == other.application_id
+            and self.question_number == other.question_number
+            and self.answer_text == other.answer_text
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+
+class ApplicationAnswers(Mapping[ApplicationQuestionEnum, ApplicationAnswer]):
+    """
+    Answers of one application indexed by the question.
+
+    Only the answer texts are stored, one slot per question, the answer
+    entities are built on access.
+    """
+
+    __slots__ = ("_application_id", "_texts")
+
+    def __init__(
+        self,
+        application_id: int,
+        texts: Mapping[int, str] | None = None,
+    ) -> None:
+        """
+        Initialize the answers.
+
+        Args:
+            application_id (int): The ID of the application.
+            texts (Mapping[int, str], optional): Answer texts by question number.
+
+        Returns:
+            None
+        """
+        self._application_id = application_id
+        self._texts: list[str | None] = [None] * len(_QUESTIONS)
+        if texts:
+            for question_number, answer_text in texts.items():
+                self._texts[_SLOTS[question_number]] = answer_text
+
+    def __getitem__(self, question_number: int) -> ApplicationAnswer:
+        """Return the answer to the question."""
+        answer_text = self._texts[_SLOTS[question_number]]
+        if answer_text is None:
+            raise KeyError(question_number)
+        return ApplicationAnswer(
+            AnswerDTO.model_construct(
+                application_id=self._application_id,
+                question_number=question_number,
+                answer_text=answer_text,
+            ),
+        )
+
+    def __iter__(self) -> Iterator[ApplicationQuestionEnum]:
+        """Iterate over the answered questions in order."""
+        return (
+            question
+            for question, answer_text in zip(_QUESTIONS, self._texts, strict=True)
+            if answer_text is not None
+        )
+
+    def __len__(self) -> int:
+        """Return the number of answered questions."""
+        return len(self._texts) - self._texts.count(None)
+
+    @property
+    def texts(self) -> tuple[str | None, ...]:
+        """Answer texts in the order of the questions, None if not answered."""
+        return tuple(self._texts)
+
+    def put(self, answer: ApplicationAnswer) -> None:
+        """
+        Set the answer to its question.
+
+        Args:
+            answer (ApplicationAnswer): The answer.
+
+        Raises:
+            KeyError: If there is no such question.
+
+        Returns:
+            None
+        """
+        self._texts[_SLOTS[answer.question_number]] = answer.answer_text
+
+    def clear(self) -> None:
+        """Remove all answers."""
+        self._texts = [None] * len(_QUESTIONS)
+
+    def is_complete(self) -> bool:
+        """Check if all questions are answered."""
+        return None not in self._texts
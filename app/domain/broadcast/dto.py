@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from pydantic import BaseModel, ConfigDict
+
+from app.domain.broadcast.value_objects import BroadcastAudienceEnum
+
+
+class BroadcastDTO(BaseModel):
+    """Data transfer object for a broadcast."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    admin_id: int
+    audience: BroadcastAudienceEnum
+    message: str
+    last_user_id: int = 0
+    delivered: int = 0
+    failed: int = 0
+    blocked: int = 0
+    is_finished: bool = False
+    created_at: datetime
+    finished_at: datetime | None = None
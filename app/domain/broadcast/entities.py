@@ -0,0 +1,89 @@
+from datetime import datetime, timezone
+
+from app.domain.broadcast.dto import BroadcastDTO
+from app.domain.broadcast.exceptions import BroadcastAlreadyFinishedError
+from app.domain.broadcast.value_objects import DeliveryStatusEnum
+
+
+class Broadcast:
+    """
+    Represents a broadcast domain object.
+
+    Recipients are users ordered by ID, `last_user_id` is the last one whose
+    result is counted, so a stopped broadcast continues after it.
+    """
+
+    __slots__ = (
+        "admin_id",
+        "audience",
+        "blocked",
+        "created_at",
+        "delivered",
+        "failed",
+        "finished_at",
+        "id",
+        "is_finished",
+        "last_user_id",
+        "message",
+    )
+
+    def __init__(self, data: BroadcastDTO) -> None:
+        """
+        Initialize the broadcast instance.
+
+        Args:
+            data (BroadcastDTO): The data of the broadcast.
+
+        Returns:
+            None
+        """
+        self.id = data.id
+        self.admin_id = data.admin_id
+        self.audience = data.audience
+        self.message = data.message
+        self.last_user_id = data.last_user_id
+        self.delivered = data.delivered
+        self.failed = data.failed
+        self.blocked = data.blocked
+        self.is_finished = data.is_finished
+        self.created_at = data.created_at
+        self.finished_at = data.finished_at
+
+    def record(self, user_id: int, status: DeliveryStatusEnum) -> None:
+        """
+        Count the result of sending the message to the user.
+
+        Args:
+            user_id (int): Telegram ID of the user.
+            status (DeliveryStatusEnum): The result.
+
+        Raises:
+            BroadcastAlreadyFinishedError: If the broadcast is finished.
+
+        Returns:
+            None
+        """
+        if self.is_finished:
+            raise BroadcastAlreadyFinishedError
+        if status == DeliveryStatusEnum.DELIVERED:
+            self.delivered += 1
+        elif status == DeliveryStatusEnum.BLOCKED:
+            self.blocked += 1
+        else:
+            self.failed += 1
+        self.last_user_id = max(self.last_user_id, user_id)
+
+    def finish(self) -> None:
+        """
+        Mark the broadcast as sent to all recipients.
+
+        Raises:
+            BroadcastAlreadyFinishedError: If the broadcast is finished.
+
+        Returns:
+            None
+        """
+        if self.is_finished:
+            raise BroadcastAlreadyFinishedError
+        self.is_finished = True
+        self.finished_at = datetime.now(tz=timezone.utc)
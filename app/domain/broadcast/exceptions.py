@@ -0,0 +1,10 @@
+class BaseBroadcastError(Exception):
+    """Base exception for the broadcast domain."""
+
+
+class BroadcastDoesNotExistError(BaseBroadcastError):
+    """Exception for when a broadcast does not exist."""
+
+
+class BroadcastAlreadyFinishedError(BaseBroadcastError):
+    """Exception for when a broadcast is already finished."""
@@ -0,0 +1,17 @@
+from enum import StrEnum
+
+
+class BroadcastAudienceEnum(StrEnum):
+    """Recipients of a broadcast, the values are the command arguments."""
+
+    ALL = "all"
+    ACCEPTED = "accepted"
+    REJECTED_THIS_MONTH = "rejected"
+
+
+class DeliveryStatusEnum(StrEnum):
+    """Result of sending a broadcast message to a user."""
+
+    DELIVERED = "Доставлено"
+    FAILED = "Не доставлено"
+    BLOCKED = "Бот заблокирован"
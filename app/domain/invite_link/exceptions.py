@@ -0,0 +1,6 @@
+class BaseInviteLinkError(Exception):
+    """Base exception for the invite link domain."""
+
+
+class InviteLinkPoolIsEmptyError(BaseInviteLinkError):
+    """Exception for when there is no fresh invite link in the pool."""
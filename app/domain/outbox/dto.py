@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class OutboxMessageDTO(BaseModel):
+    """Data transfer object for an outbox message."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    chat_id: int
+    message: str
+    attempts: int = 0
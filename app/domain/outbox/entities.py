@@ -0,0 +1,22 @@
+from app.domain.outbox.dto import OutboxMessageDTO
+
+
+class OutboxMessage:
+    """Represents a message to a chat that is sent after the commit."""
+
+    __slots__ = ("attempts", "chat_id", "id", "message")
+
+    def __init__(self, data: OutboxMessageDTO) -> None:
+        """
+        Initialize the outbox message instance.
+
+        Args:
+            data (OutboxMessageDTO): The data of the message.
+
+        Returns:
+            None
+        """
+        self.id = data.id
+        self.chat_id = data.chat_id
+        self.message = data.message
+        self.attempts = data.attempts
@@ -5,6 +5,8 @@ from app.domain.user.exceptions import UserIsBannedError, UserIsNotBannedError
 class User:
     """Represents a user domain object."""
 
+    __slots__ = ("first_name", "id", "is_banned", "last_name", "username")
+
     def __init__(self, data: UserDTO) -> None:
         """
         Initialize the user instance.
@@ -1,9 +1,10 @@
-from handlers.admins import register_admin_handlers
-from handlers.chat import register_chat_handlers
-from handlers.empty import unknown_handler
 from telegram.ext import Application, MessageHandler, filters
 
+from app.core import metrics
+from app.handlers.admins import register_admin_handlers
 from app.handlers.application import register_application_handlers
+from app.handlers.chat import register_chat_handlers
+from app.handlers.empty import unknown_handler
 
 
 def add_all_handlers(application: Application) -> None:
@@ -12,3 +13,4 @@ def add_all_handlers(application: Application) -> None:
     register_application_handlers(application)
     register_admin_handlers(application)
     application.add_handler(MessageHandler(filters.ALL, unknown_handler))
+    metrics.instrument_handlers(application)
@@ -16,6 +16,7 @@ from app.handlers.admins.applications.reject import (
     reject_without_reason_hander,
 )
 from app.handlers.admins.applications.take import take_application_handler
+from app.handlers.admins.broadcasts.broadcast import broadcast_command
 from app.handlers.admins.shutdown import shutdown_handler
 from app.handlers.admins.users.ban import ban_user
 from app.handlers.admins.users.unban import unban_user
@@ -61,6 +62,8 @@ def register_admin_handlers(application: Application) -> None:
             ],
         },
         fallbacks=[],
+        name="reject_application",
+        persistent=True,
     )
 
     application.add_handler(conv_hander)
@@ -70,6 +73,9 @@ def register_admin_handlers(application: Application) -> None:
     application.add_handler(
         CommandHandler(command="unban", callback=unban_user, has_args=1),
     )
+    application.add_handler(
+        CommandHandler(command="broadcast", callback=broadcast_command),
+    )
     application.add_handler(
         CommandHandler(
             command="shutdown",
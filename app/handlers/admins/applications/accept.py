@@ -2,14 +2,17 @@ from loguru import logger
 from telegram import CallbackQuery, Chat, ChatInviteLink
 from telegram.ext import ContextTypes, ExtBot
 
+from app import middlewares
 from app.core.config import settings
 from app.db.engine import UnitOfWork
-from app.decorators import updates
 from app.domain.admin_processing_application.exceptions import (
     ApplicationAlreadyProcessedError,
     WrongAdminError,
 )
+from app.domain.application.entities import Application
 from app.domain.application.exceptions import ChangeApplicationStatusError
+from app.domain.invite_link.exceptions import InviteLinkPoolIsEmptyError
+from app.infra.messaging.fan_out import fan_out
 from app.services.applications.application_admin_accept import (
     ApplicationAdminAcceptService,
 )
@@ -18,11 +21,16 @@ from app.services.applications.application_formatting import (
 )
 
 
-@updates.check_update_and_provide_data(need_callback=True)
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UpdateDataMiddleware(need_callback=True),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def accept_application(
     callback: CallbackQuery,
     chat: Chat,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> None:
     """
     Handle application accept.
@@ -31,6 +39,7 @@ async def accept_application(
         callback (CallbackQuery): The callback query.
         chat (Chat): The chat.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         None
@@ -43,11 +52,14 @@ async def accept_application(
     application_id = int(callback.data.split(":")[-1])
     logger.info(f"Принятие заявки application_id={application_id}.")
     admin_id = callback.from_user.id
-    link = await _generate_invite_link(context.application.bot)
-    uow = UnitOfWork()
     accept_service = ApplicationAdminAcceptService(uow)
     try:
-        application = await accept_service.execute(admin_id, application_id, link)
+        application = await _accept(
+            accept_service,
+            context.application.bot,
+            admin_id,
+            application_id,
+        )
     except ApplicationAlreadyProcessedError:
         await callback.answer(
             text="Данная заявка уже принята!",
@@ -66,44 +78,68 @@ async def accept_application(
             show_alert=True,
         )
         return
-    await callback.answer()
     formatting_service = ApplicationFormattingService(uow)
     formatted_application = await formatting_service.execute(application_id)
-    await context.bot.edit_message_text(
-        chat_id=chat.id,
-        message_id=callback.message.message_id,  # type: ignore[reportOptionalMemberAccess]
-        text=formatted_application,
-        parse_mode="MarkdownV2",
-    )
-    await context.application.bot.edit_message_text(
-        text=formatted_application,
-        chat_id=settings.ADMIN_CHAT_ID,
-        message_id=context.user_data["application_message_id"],  # type: ignore[reportOptionalSubscript]
-        parse_mode="MarkdownV2",
-    )
-    await chat.send_message(f"Заявка №{application_id} принята.")
-    logger.debug(
-        (
-            f"Заявка application_id={application_id} принята, "
-            "уведомляем пользователя и отправляем инвайт"
-        ),
-    )
-    await context.bot.send_message(
-        chat_id=application.user_id,
-        text=(
-            f"Ваша заявка принята!\n"
-            f"Ваша персональная ссылка: {application.invite_link}"
-        ),
-    )
-    await context.bot.send_message(
-        chat_id=application.user_id,
-        text=(
-            "Если у вас есть какие-то вопросы или предложения по улучшению, "
-            "напишите @RBFManager"
+    calls = {
+        "answer": callback.answer(),
+        "review_message_edit": context.bot.edit_message_text(
+            chat_id=chat.id,
+            message_id=callback.message.message_id,  # type: ignore[reportOptionalMemberAccess]
+            text=formatted_application,
+            parse_mode="MarkdownV2",
         ),
+        "confirmation": chat.send_message(f"Заявка №{application_id} принята."),
+    }
+    if application.admin_chat_message_id is not None:
+        calls["admin_chat_edit"] = context.application.bot.edit_message_text(
+            text=formatted_application,
+            chat_id=settings.ADMIN_CHAT_ID,
+            message_id=application.admin_chat_message_id,
+            parse_mode="MarkdownV2",
+        )
+    # The calls do not depend on each other, a failed edit still lets the
+    # admin see the confirmation.
+    await fan_out(**calls)
+    logger.debug(
+        "Заявка application_id={} принята, уведомление в outbox",
+        application_id,
     )
 
 
+async def _accept(
+    accept_service: ApplicationAdminAcceptService,
+    bot: ExtBot,
+    admin_id: int,
+    application_id: int,
+) -> Application:
+    """
+    Accept the application with the join request link or a single-use link.
+
+    The single-use link is taken from the pool, or created if it is empty.
+
+    Args:
+        accept_service (ApplicationAdminAcceptService): The accept service.
+        bot (ExtBot): The bot instance.
+        admin_id (int): Telegram ID of the admin.
+        application_id (int): The application id.
+
+    Returns:
+        Application: The accepted application.
+    """
+    if settings.CLAN_CHAT_JOIN_LINK:
+        return await accept_service.execute(
+            admin_id,
+            application_id,
+            join_link=settings.CLAN_CHAT_JOIN_LINK,
+        )
+    try:
+        return await accept_service.execute(admin_id, application_id)
+    except InviteLinkPoolIsEmptyError:
+        logger.warning("Пул пригласительных ссылок пуст, создаем ссылку.")
+    link = await _generate_invite_link(bot)
+    return await accept_service.execute(admin_id, application_id, link)
+
+
 async def _generate_invite_link(bot: ExtBot) -> str:
     """
     Generate invite link for clan chat.
@@ -1,21 +1,20 @@
-from datetime import timedelta
-
 from loguru import logger
 from telegram import CallbackQuery, Chat, Message
 from telegram.ext import CallbackContext, ContextTypes, ConversationHandler
 
-from app import keyboards
+from app import keyboards, middlewares
 from app.core.config import settings
 from app.db.engine import UnitOfWork
-from app.decorators import updates
 from app.domain.admin_processing_application.exceptions import (
     ApplicationAlreadyProcessedError,
     WrongAdminError,
 )
+from app.domain.application.entities import Application
 from app.domain.application.exceptions import (
     ChangeApplicationStatusError,
 )
 from app.handlers.config import DeclineUserStates
+from app.infra.messaging.fan_out import fan_out
 from app.services.applications.application_admin_reject import (
     ApplicationAdminRejectService,
 )
@@ -24,7 +23,10 @@ from app.services.applications.application_formatting import (
 )
 
 
-@updates.check_update_and_provide_data(need_callback=True)
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UpdateDataMiddleware(need_callback=True),
+)
 async def reject_application_start(
     callback: CallbackQuery,
     chat: Chat,
@@ -47,12 +49,10 @@ async def reject_application_start(
         )
         return ConversationHandler.END
     await callback.answer()
-    context.user_data["message"] = callback.message  # type: ignore[reportOptionalSubscript]
-    logger.debug(f"Сохранение переменной message={callback.message}.")
     application_id = int(callback.data.split(":")[-1])
     logger.info(f"Отклонение заявки application_id={application_id}.")
     context.user_data["application_id"] = application_id  # type: ignore[reportOptionalSubscript]
-    logger.debug(f"Сохранение переменной application_id={application_id}.")
+    logger.debug("Сохранение переменной application_id={}.", application_id)
     await callback.edit_message_reply_markup(
         keyboards.ADMIN_DECLINE_KEYBOARD(application_id),
     )
@@ -66,11 +66,16 @@ async def reject_application_start(
     return DeclineUserStates.DECLINE_REASON_STATE
 
 
-@updates.check_update_and_provide_data(need_message=True)
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UpdateDataMiddleware(need_message=True),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def reject_reason_hander(
     message: Message,
     chat: Chat,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle reject reason.
@@ -79,6 +84,7 @@ async def reject_reason_hander(
         message (Message): The message.
         chat (Chat): The chat.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -97,7 +103,6 @@ async def reject_reason_hander(
     await chat.send_message(
         f"Причина отказа для Заявки №{application_id}:\n{message.text}.",
     )
-    uow = UnitOfWork()
     reject_service = ApplicationAdminRejectService(uow)
     try:
         application = await reject_service.execute(
@@ -120,56 +125,24 @@ async def reject_reason_hander(
             "Неверный статус заявки.",
         )
         return ConversationHandler.END
-    message_to_update: Message = context.user_data["message"]  # type: ignore[reportOptionalSubscript]
-    formatting_service = ApplicationFormattingService(uow)
-    formatted_application = await formatting_service.execute(application_id)
-    await message_to_update.edit_text(
-        text=formatted_application,
-        reply_markup=keyboards.REMOVE_INLINE_KEYBOARD,
-        parse_mode="MarkdownV2",
-    )
-    await context.application.bot.edit_message_text(
-        formatted_application,
-        chat_id=settings.ADMIN_CHAT_ID,
-        message_id=context.user_data["application_message_id"],  # type: ignore[reportOptionalSubscript]
-        parse_mode="MarkdownV2",
-    )
-    logger.debug("Текст заявки обновлен.")
-    await chat.send_message(f"Заявка №{application_id} отклонена.")
+    await _show_rejected(context, chat, uow, application)
     logger.debug(
-        (
-            f"Заявка application_id={application_id} отклонена, "
-            "уведомляем пользователя и отправляем причину отказа"
-        ),
-    )
-    await context.bot.send_message(
-        chat_id=application.user_id,
-        text=(
-            "Ваша заявка отклонена.\n"
-            "Причина отказа: {}.\n"
-            "Попробуйте снова {} (UTC+0)."
-        ).format(
-            application.rejection_reason,
-            (timedelta(days=30) + application.decision_date).strftime(  # type: ignore[reportOperatorIssue]
-                "%d.%m.%Y %H:%M %Z",
-            ),
-        ),
-    )
-    await context.bot.send_message(
-        chat_id=application.user_id,
-        text=(
-            "Если у вас есть какие-то вопросы или предложения по улучшению, "
-            "напишите @RBFManager"
-        ),
+        "Заявка application_id={} отклонена, уведомление в outbox",
+        application_id,
     )
     return ConversationHandler.END
 
 
-@updates.check_update_and_provide_data(need_callback=True)
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UpdateDataMiddleware(need_callback=True),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def reject_without_reason_hander(
     callback: CallbackQuery,
     chat: Chat,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle reject without reason.
@@ -178,6 +151,7 @@ async def reject_without_reason_hander(
         callback (CallbackQuery): The callback.
         chat (Chat): The chat.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -196,7 +170,6 @@ async def reject_without_reason_hander(
     await chat.send_message(
         f"Пустая причина отказа для Заявки №{application_id}.",
     )
-    uow = UnitOfWork()
     reject_service = ApplicationAdminRejectService(uow)
     try:
         application = await reject_service.execute(
@@ -218,47 +191,18 @@ async def reject_without_reason_hander(
             "Неверный статус заявки.",
         )
         return ConversationHandler.END
-    message_to_update: Message = context.user_data["message"]  # type: ignore[reportOptionalSubscript]
-    formatting_service = ApplicationFormattingService(uow)
-    formatted_application = await formatting_service.execute(application_id)
-    await message_to_update.edit_text(
-        text=formatted_application,
-        reply_markup=keyboards.REMOVE_INLINE_KEYBOARD,
-        parse_mode="MarkdownV2",
-    )
-    await context.application.bot.edit_message_text(
-        formatted_application,
-        chat_id=settings.ADMIN_CHAT_ID,
-        message_id=context.user_data["application_message_id"],  # type: ignore[reportOptionalSubscript]
-        parse_mode="MarkdownV2",
-    )
-    logger.debug("Текст заявки обновлен.")
-    await chat.send_message(f"Заявка №{application_id} отклонена.")
+    await _show_rejected(context, chat, uow, application)
     logger.debug(
-        (
-            f"Заявка application_id={application_id} отклонена, "
-            "уведомляем пользователя и отправляем причину отказа"
-        ),
-    )
-    await context.bot.send_message(
-        chat_id=application.user_id,
-        text=("Ваша заявка отклонена.\nПопробуйте снова {} (UTC+0).").format(
-            (timedelta(days=30) + application.decision_date).strftime(  # type: ignore[reportOperatorIssue]
-                "%d.%m.%Y %H:%M %Z",
-            ),
-        ),
-    )
-    await context.bot.send_message(
-        chat_id=application.user_id,
-        text=(
-            "Если у вас есть какие-то вопросы или предложения по улучшению, "
-            "напишите @RBFManager"
-        ),
+        "Заявка application_id={} отклонена, уведомление в outbox",
+        application_id,
     )
     return ConversationHandler.END
 
 
-@updates.check_update_and_provide_data(need_callback=True)
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UpdateDataMiddleware(need_callback=True),
+)
 async def reject_back_button_handler(
     callback: CallbackQuery,
     chat: Chat,  # noqa: ARG001
@@ -279,8 +223,53 @@ async def reject_back_button_handler(
     logger.debug("In decline back handler.")
     logger.info("Возврат к выбору действий для Заявки.")
     application_id = context.user_data["application_id"]  # type: ignore[reportOptionalSubscript]
-    logger.debug(f"Возврат к выбору действий для Заявки №{application_id}")
+    logger.debug("Возврат к выбору действий для Заявки №{}", application_id)
     await callback.edit_message_reply_markup(
         keyboards.ADMIN_DECISION_KEYBOARD(application_id),
     )
     return ConversationHandler.END
+
+
+async def _show_rejected(
+    context: ContextTypes.DEFAULT_TYPE,
+    chat: Chat,
+    uow: UnitOfWork,
+    application: Application,
+) -> None:
+    """
+    Show the rejected application in the review message and the admin chat.
+
+    The edits and the confirmation to the admin are sent at the same time,
+    a failed call does not stop the others.
+
+    Args:
+        context (ContextTypes.DEFAULT_TYPE): The context.
+        chat (Chat): The private chat of the admin.
+        uow (UnitOfWork): The unit of work of the update.
+        application (Application): The rejected application.
+
+    Returns:
+        None
+    """
+    formatting_service = ApplicationFormattingService(uow)
+    formatted_application = await formatting_service.execute(application.id)
+    calls = {
+        "confirmation": chat.send_message(f"Заявка №{application.id} отклонена."),
+    }
+    if application.review_message_id is not None:
+        calls["review_message_edit"] = context.bot.edit_message_text(
+            text=formatted_application,
+            chat_id=chat.id,
+            message_id=application.review_message_id,
+            reply_markup=keyboards.REMOVE_INLINE_KEYBOARD,
+            parse_mode="MarkdownV2",
+        )
+    if application.admin_chat_message_id is not None:
+        calls["admin_chat_edit"] = context.bot.edit_message_text(
+            formatted_application,
+            chat_id=settings.ADMIN_CHAT_ID,
+            message_id=application.admin_chat_message_id,
+            parse_mode="MarkdownV2",
+        )
+    await fan_out(**calls)
+    logger.debug("Текст заявки обновлен.")
@@ -2,28 +2,38 @@ from loguru import logger
 from telegram import CallbackQuery, Chat
 from telegram.ext import ContextTypes, ConversationHandler
 
-from app import keyboards
+from app import keyboards, middlewares
 from app.db.engine import UnitOfWork
-from app.decorators import updates
 from app.domain.admin_processing_application.exceptions import (
     AdminAlreadyProcessedApplicationError,
     ApplicationAlreadyProcessedError,
 )
-from app.domain.application.exceptions import ApplicationWrongStatusError
+from app.domain.application.exceptions import (
+    ApplicationWrongStatusError,
+    ChangeApplicationStatusError,
+)
 from app.services.applications.application_admin_take import (
     ApplicationAdminTakeService,
 )
 from app.services.applications.application_formatting import (
     ApplicationFormattingService,
 )
+from app.services.applications.application_messages import (
+    ApplicationMessagesService,
+)
 
 
 # TODO: Переименовать функцию
-@updates.check_update_and_provide_data(need_callback=True)
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UpdateDataMiddleware(need_callback=True),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def take_application_handler(
     callback: CallbackQuery,
     chat: Chat,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int | None:
     """
     Handle application take.
@@ -32,6 +42,7 @@ async def take_application_handler(
         callback (CallbackQuery): The callback query.
         chat (Chat): The chat.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int | None: The next state or None.
@@ -54,7 +65,6 @@ async def take_application_handler(
         return ConversationHandler.END
     application_id = int(callback_data.split(":")[-1])
     logger.info(f"Администратор {admin_id=} взял заявку {application_id=} в обработку.")
-    uow = UnitOfWork()
     service = ApplicationAdminTakeService(uow)
     try:
         await service.execute(admin_id, application_id)
@@ -70,7 +80,7 @@ async def take_application_handler(
             show_alert=True,
         )
         return ConversationHandler.END
-    except ApplicationWrongStatusError:
+    except (ApplicationWrongStatusError, ChangeApplicationStatusError):
         await callback.answer(
             text="Невозможно взять в обработку заявку",
             show_alert=True,
@@ -85,13 +95,19 @@ async def take_application_handler(
         text=formatted_application,
         parse_mode="MarkdownV2",
     )
-    await context.application.bot.send_message(
+    review_message = await context.application.bot.send_message(
         chat_id=admin_id,
         text=formatted_application,
         reply_markup=keyboards.ADMIN_DECISION_KEYBOARD(application_id),
         parse_mode="MarkdownV2",
     )
-    context.user_data["application_message_id"] = application_message.message_id  # type: ignore[reportOptionalSubscript]
+    # The post is remembered here too for applications sent before the
+    # message IDs were stored.
+    await ApplicationMessagesService(uow).execute(
+        application_id,
+        admin_chat_message_id=application_message.message_id,
+        review_message_id=review_message.message_id,
+    )
     await callback.answer(
         text=(
             "Заявка взята в обработку! "
@@ -0,0 +1,137 @@
+import asyncio
+
+from loguru import logger
+from telegram import Update
+from telegram.ext import Application, ContextTypes
+
+from app import middlewares
+from app.core.config import settings
+from app.db.engine import UnitOfWork
+from app.domain.broadcast.entities import Broadcast
+from app.domain.broadcast.value_objects import BroadcastAudienceEnum
+from app.services.broadcasts.broadcast_send import BroadcastSendService
+from app.services.broadcasts.broadcast_start import BroadcastStartService
+from app.services.broadcasts.broadcast_unfinished import BroadcastUnfinishedService
+
+# Running broadcasts, they are stopped with the bot and resumed on start.
+_tasks: set[asyncio.Task] = set()
+
+USAGE = (
+    "Использование: /broadcast <получатели> <текст>\n"
+    "Получатели: all - все пользователи, accepted - принятые, "
+    "rejected - получившие отказ в этом месяце."
+)
+
+
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
+async def broadcast_command(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
+) -> None:
+    """
+    Handle the broadcast command.
+
+    Args:
+        update (Update): The update.
+        context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
+
+    Returns:
+        None
+    """
+    chat = update.effective_chat
+    user = update.effective_user
+    if not update.message or not update.message.text or not chat or not user:
+        logger.error("Получен некорректный update при попытке запуска рассылки.")
+        return
+    if chat.id != settings.ADMIN_CHAT_ID:
+        logger.warning("Вызов команды рассылки не в чате администратора.")
+        return
+    try:
+        _, audience_arg, message = update.message.text.split(maxsplit=2)
+        audience = BroadcastAudienceEnum(audience_arg)
+    except ValueError:
+        await chat.send_message(USAGE)
+        return
+    broadcast = await BroadcastStartService(uow).execute(
+        admin_id=user.id,
+        audience=audience,
+        message=message,
+    )
+    await chat.send_message(f"Рассылка {broadcast.id} запущена.")
+    start_broadcast(context.application, broadcast)
+
+
+def start_broadcast(application: Application, broadcast: Broadcast) -> None:
+    """
+    Send the broadcast in the background.
+
+    Args:
+        application (Application): The application.
+        broadcast (Broadcast): The unfinished broadcast.
+
+    Returns:
+        None
+    """
+    task = asyncio.create_task(_run(application, broadcast))
+    _tasks.add(task)
+    task.add_done_callback(_tasks.discard)
+
+
+async def resume_broadcasts(application: Application) -> None:
+    """
+    Continue the broadcasts stopped with the bot.
+
+    Args:
+        application (Application): The application.
+
+    Returns:
+        None
+    """
+    for broadcast in await BroadcastUnfinishedService(UnitOfWork()).execute():
+        start_broadcast(application, broadcast)
+
+
+def stop_broadcasts() -> None:
+    """Stop the running broadcasts, their progress is already saved."""
+    for task in _tasks:
+        task.cancel()
+    _tasks.clear()
+
+
+async def _run(application: Application, broadcast: Broadcast) -> None:
+    """
+    Send the broadcast and report the result to the admin chat.
+
+    Args:
+        application (Application): The application.
+        broadcast (Broadcast): The unfinished broadcast.
+
+    Returns:
+        None
+    """
+    service = BroadcastSendService(
+        UnitOfWork(),
+        UnitOfWork(),
+        application.bot,
+        settings.BROADCAST_WORKERS,
+        settings.BROADCAST_BATCH_SIZE,
+    )
+    try:
+        await service.execute(broadcast)
+    except Exception:  # noqa: BLE001
+        logger.exception(f"Рассылка {broadcast.id} остановлена с ошибкой")
+        return
+    await application.bot.send_message(
+        chat_id=settings.ADMIN_CHAT_ID,
+        text=(
+            f"Рассылка {broadcast.id} завершена.\n"
+            f"Доставлено: {broadcast.delivered}\n"
+            f"Не доставлено: {broadcast.failed}\n"
+            f"Заблокировали бота: {broadcast.blocked}"
+        ),
+    )
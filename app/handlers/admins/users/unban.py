@@ -2,6 +2,7 @@ from loguru import logger
 from telegram import Update
 from telegram.ext import ContextTypes, ConversationHandler
 
+from app import middlewares
 from app.core.config import settings
 from app.db.engine import UnitOfWork
 from app.domain.user.exceptions import UserIsNotBannedError, UserNotFoundError
@@ -9,9 +10,14 @@ from app.services.users.user_unban import UserUnbanService
 from app.validators import question_validators
 
 
+@middlewares.use(
+    middlewares.AdminPriorityMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def unban_user(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,  # noqa: ARG001
+    uow: UnitOfWork,
 ) -> int | None:
     """
     Handle unban user.
@@ -19,6 +25,7 @@ async def unban_user(
     Args:
         update (Update): The update.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int | None: The next state or None.
@@ -39,7 +46,6 @@ async def unban_user(
     if not question_validators.is_only_numbers(user_id):
         await chat.send_message("Неверный ID пользователя.")
         return ConversationHandler.END
-    uow = UnitOfWork()
     unban_service = UserUnbanService(uow)
     try:
         await unban_service.execute(int(user_id))
@@ -47,5 +47,7 @@ def register_application_handlers(application: Application) -> None:
         # TODO: Добавить хендлеры обработки ошибок
         # (пользователь оправил некорректные данные)
         fallbacks=[MessageHandler(filters.ALL, fallback_handler)],
+        name="application",
+        persistent=True,
     )
     application.add_handler(conv_hander)
@@ -2,10 +2,9 @@ from loguru import logger
 from telegram import Chat, Message
 from telegram.ext import ContextTypes, ConversationHandler, ExtBot
 
-from app import keyboards
+from app import keyboards, middlewares
 from app.core.config import settings
 from app.db.engine import UnitOfWork
-from app.decorators import updates
 from app.handlers.config.states import ApplicationStates
 from app.services.applications.application_complete import (
     ApplicationCompleteService,
@@ -13,14 +12,21 @@ from app.services.applications.application_complete import (
 from app.services.applications.application_formatting import (
     ApplicationFormattingService,
 )
+from app.services.applications.application_messages import (
+    ApplicationMessagesService,
+)
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def user_decision(
     user_id: int,
     chat: Chat,
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle user decision.
@@ -30,18 +36,25 @@ async def user_decision(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
     """
     logger.info(f"Обработка варианта ответа пользователя для chat_id={chat.id}")
-    return await _handle_answer_change_request(user_id, message.text, context.bot)
+    return await _handle_answer_change_request(
+        user_id,
+        message.text,
+        context.bot,
+        uow,
+    )
 
 
 async def _handle_answer_change_request(
     user_id: int,
     decision: str | None,
     bot: ExtBot,
+    uow: UnitOfWork,
 ) -> int:
     messages = {
         "1": (
@@ -81,26 +94,30 @@ async def _handle_answer_change_request(
         message, state, keyboard = messages[decision]
         await bot.send_message(user_id, message, reply_markup=keyboard)
         return state.value
-    return await _handle_application_complete(user_id, decision, bot)
+    return await _handle_application_complete(user_id, decision, bot, uow)
 
 
 async def _handle_application_complete(
     user_id: int,
     decision: str | None,
     bot: ExtBot,
+    uow: UnitOfWork,
 ) -> int:
     if decision == "6":
-        uow = UnitOfWork()
         application_complete_service = ApplicationCompleteService(uow)
         application = await application_complete_service.execute(user_id)
         formatting_service = ApplicationFormattingService(uow)
         formatted_application = await formatting_service.execute(application.id)
-        await bot.send_message(
+        post = await bot.send_message(
             text=formatted_application,
             chat_id=settings.ADMIN_CHAT_ID,
             reply_markup=keyboards.ADMIN_HANDLE_APPLICATION_KEYBOARD(application.id),
             parse_mode="MarkdownV2",
         )
+        await ApplicationMessagesService(uow).execute(
+            application.id,
+            admin_chat_message_id=post.message_id,
+        )
         await bot.send_message(
             user_id,
             "Заявка отправлена, ожидай ответа!",
@@ -1,17 +1,22 @@
 from telegram import Chat, Message
 from telegram.ext import ContextTypes
 
-from app.decorators import updates
+from app import middlewares
+from app.db.engine import UnitOfWork
 from app.handlers.application.questions.universal.base import handle_question
 from app.handlers.application.questions.universal.dto import QuestionResponseDTO
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def about_skip(
     user_id: int,
     chat: Chat,  # noqa: ARG001
     message: Message,  # noqa: ARG001
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle about skip.
@@ -21,6 +26,7 @@ async def about_skip(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -32,15 +38,19 @@ async def about_skip(
         message_text=answer,  # type: ignore[reportArgumentType]
         question_number=5,
     )
-    return await handle_question(data)
+    return await handle_question(data, uow)
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def about(
     user_id: int,
     chat: Chat,  # noqa: ARG001
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle about.
@@ -50,6 +60,7 @@ async def about(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -60,4 +71,4 @@ async def about(
         message_text=message.text,  # type: ignore[reportArgumentType]
         question_number=5,
     )
-    return await handle_question(data)
+    return await handle_question(data, uow)
@@ -1,19 +1,23 @@
 from telegram import Chat, Message
 from telegram.ext import ContextTypes
 
-from app import keyboards
-from app.decorators import updates
+from app import keyboards, middlewares
+from app.db.engine import UnitOfWork
 from app.handlers.application.questions.universal.base import handle_question
 from app.handlers.application.questions.universal.dto import QuestionResponseDTO
 from app.handlers.config import ApplicationStates
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def activity(
     user_id: int,
     chat: Chat,  # noqa: ARG001
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle activity answer.
@@ -23,6 +27,7 @@ async def activity(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -40,4 +45,4 @@ async def activity(
         next_state=ApplicationStates.ABOUT_STATE,
         reply_markup=keyboards.USER_SKIP_KEYBOARD,
     )
-    return await handle_question(data)
+    return await handle_question(data, uow)
@@ -2,19 +2,24 @@ from loguru import logger
 from telegram import Chat, Message
 from telegram.ext import ContextTypes
 
-from app.decorators import updates
+from app import middlewares
+from app.db.engine import UnitOfWork
 from app.handlers.application.questions.universal.base import handle_question
 from app.handlers.application.questions.universal.dto import QuestionResponseDTO
 from app.handlers.config import ApplicationStates
 from app.validators import question_validators
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def age(
     user_id: int,
     chat: Chat,
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle age answer.
@@ -24,13 +29,16 @@ async def age(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
     """
     if not question_validators.is_digit_between(start=1, end=100, value=message.text):
         logger.debug(
-            f"Получен некорректный age={message.text} в чате chat_id={chat.id}.",
+            "Получен некорректный age={} в чате chat_id={}.",
+            message.text,
+            chat.id,
         )
         await chat.send_message(
             (
@@ -50,4 +58,4 @@ async def age(
         ),
         next_state=ApplicationStates.GAME_MODES_STATE,
     )
-    return await handle_question(data)
+    return await handle_question(data, uow)
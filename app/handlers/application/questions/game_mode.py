@@ -1,18 +1,23 @@
 from telegram import Chat, Message
 from telegram.ext import ContextTypes
 
-from app.decorators import updates
+from app import middlewares
+from app.db.engine import UnitOfWork
 from app.handlers.application.questions.universal.base import handle_question
 from app.handlers.application.questions.universal.dto import QuestionResponseDTO
 from app.handlers.config import ApplicationStates
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def game_mode(
     user_id: int,
     chat: Chat,  # noqa: ARG001
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle game mode answer.
@@ -22,6 +27,7 @@ async def game_mode(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -37,4 +43,4 @@ async def game_mode(
         ),
         next_state=ApplicationStates.ACTIVITY_STATE,
     )
-    return await handle_question(data)
+    return await handle_question(data, uow)
@@ -2,19 +2,24 @@ from loguru import logger
 from telegram import Chat, Message
 from telegram.ext import ContextTypes
 
-from app.decorators import updates
+from app import middlewares
+from app.db.engine import UnitOfWork
 from app.handlers.application.questions.universal.base import handle_question
 from app.handlers.application.questions.universal.dto import QuestionResponseDTO
 from app.handlers.config import ApplicationStates
 from app.validators import question_validators
 
 
-@updates.check_application_update()
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(),
+    middlewares.UnitOfWorkMiddleware(),
+)
 async def pubg_id(
     user_id: int,
     chat: Chat,
     message: Message,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> int:
     """
     Handle pubg id answer.
@@ -24,6 +29,7 @@ async def pubg_id(
         chat (Chat): The chat.
         message (Message): The message.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
@@ -31,7 +37,9 @@ async def pubg_id(
     # TODO: Replace with pydantic validator
     if not question_validators.is_only_numbers(message.text):
         logger.debug(
-            f"Получен некорректный pubg_id={message.text} в чате chat_id={chat.id}.",
+            "Получен некорректный pubg_id={} в чате chat_id={}.",
+            message.text,
+            chat.id,
         )
         await chat.send_message(
             (
@@ -49,4 +57,4 @@ async def pubg_id(
         next_question_text="Сколько тебе полных лет?",
         next_state=ApplicationStates.AGE_STATE,
     )
-    return await handle_question(data)
+    return await handle_question(data, uow)
@@ -11,17 +11,17 @@ from app.services.applications.dto import (
 
 
 # TODO: Refactor this and DTO for more simplification
-async def handle_question(data: QuestionResponseDTO) -> int:
+async def handle_question(data: QuestionResponseDTO, uow: UnitOfWork) -> int:
     """
     Handle question answer.
 
     Args:
         data (QuestionResponseDTO): Answer data.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         int: The next state.
     """
-    uow = UnitOfWork()
     application_response_service = ApplicationResponseService(uow)
     response_data = ApplicationResponseInputDTO(
         user_id=data.user_id,
@@ -2,9 +2,8 @@ from loguru import logger
 from telegram import Chat, Message, User, constants
 from telegram.ext import ContextTypes, ConversationHandler
 
-from app import keyboards
+from app import keyboards, middlewares
 from app.db import UnitOfWork
-from app.decorators import updates
 from app.domain.application.exceptions import (
     ApplicationAlreadyAcceptedError,
     ApplicationAtWaitingStatusError,
@@ -16,19 +15,23 @@ from app.domain.user.exceptions import (
     UserIsBannedError,
 )
 from app.handlers.config import ApplicationStates
-from app.services.applications.application_start import ApplicationStartService
+from app.services.applications.application_user_start import (
+    UserApplicationStartService,
+)
 from app.services.users.dto import UserCreateDTO
-from app.services.users.user_create import EnsureUserExistsService
 
 
-@updates.check_application_update(
-    return_error_state=ConversationHandler.END,
-    return_full_user=True,
+@middlewares.use(
+    middlewares.ApplicationUpdateMiddleware(
+        return_error_state=ConversationHandler.END,
+    ),
+    middlewares.UnitOfWorkMiddleware(),
 )
 async def start_command(
     user: User,
     chat: Chat,
     context: ContextTypes.DEFAULT_TYPE,  # noqa: ARG001
+    uow: UnitOfWork,
     message: Message | None = None,  # noqa: ARG001
 ) -> int | None:
     """
@@ -38,6 +41,7 @@ async def start_command(
         user (User): The user.
         chat (Chat): The chat.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
         message (Message | None): The message.
 
     Returns:
@@ -52,9 +56,7 @@ async def start_command(
 
     logger.info(f"Пользователь чата chat_id={chat.id} вызвал команду /start")
 
-    uow = UnitOfWork()
-    user_service = EnsureUserExistsService(uow)
-    application_service = ApplicationStartService(uow)
+    application_service = UserApplicationStartService(uow)
     try:
         user_create_dto = UserCreateDTO(
             id=user.id,
@@ -62,8 +64,7 @@ async def start_command(
             first_name=user.first_name,
             last_name=user.last_name,
         )
-        user_entity = await user_service.execute(data=user_create_dto)
-        await application_service.execute(user_entity.id)
+        await application_service.execute(data=user_create_dto)
     except (
         ApplicationDecisionDateNotFoundError,
         ApplicationWrongStatusError,
@@ -116,7 +117,7 @@ async def _send_greeting(chat: Chat) -> None:
     Returns:
         None
     """
-    logger.debug(f"Отправляем приветственное сообщения в чат chat_id={chat.id}.")
+    logger.debug("Отправляем приветственное сообщения в чат chat_id={}.", chat.id)
     await chat.send_message(
         (
             "Приветствую!\n"
@@ -137,7 +138,7 @@ async def _ask_for_pubg_id(chat: Chat) -> None:
     Returns:
         None
     """
-    logger.debug(f"Запрашиваем ответ на pubg_id в чате chat_id={chat.id}.")
+    logger.debug("Запрашиваем ответ на pubg_id в чате chat_id={}.", chat.id)
     await chat.send_message(
         "Напиши свой PUBG ID",
         reply_markup=keyboards.REMOVE_KEYBOARD,
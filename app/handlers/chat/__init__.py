@@ -1,5 +1,7 @@
-from telegram.ext import Application, MessageHandler, filters
+from telegram.ext import Application, ChatJoinRequestHandler, MessageHandler, filters
 
+from app.core.config import settings
+from app.handlers.chat.join_request import join_request_handler
 from app.handlers.chat.new_user_joined import new_user_joined_handler
 
 
@@ -13,6 +15,15 @@ def register_chat_handlers(application: Application) -> None:
     Returns:
         None
     """
+    if settings.CLAN_CHAT_JOIN_LINK:
+        # The shared link is not revoked, requests are approved instead.
+        application.add_handler(
+            ChatJoinRequestHandler(
+                join_request_handler,
+                chat_id=settings.CLAN_CHAT_ID,
+            ),
+        )
+        return
     application.add_handler(
         MessageHandler(filters.StatusUpdate.NEW_CHAT_MEMBERS, new_user_joined_handler),
     )
@@ -0,0 +1,38 @@
+from loguru import logger
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from app import middlewares
+from app.db.engine import UnitOfWork
+from app.services.applications.application_join_request import (
+    ApplicationJoinRequestService,
+)
+
+
+@middlewares.use(middlewares.UnitOfWorkMiddleware())
+async def join_request_handler(
+    update: Update,
+    context: ContextTypes.DEFAULT_TYPE,  # noqa: ARG001
+    uow: UnitOfWork,
+) -> None:
+    """
+    Approve requests to join the clan chat of users with accepted applications.
+
+    Args:
+        update (Update): The update.
+        context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
+
+    Returns:
+        None
+    """
+    join_request = update.chat_join_request
+    if not join_request:
+        return
+    user_id = join_request.from_user.id
+    if await ApplicationJoinRequestService(uow).execute(user_id):
+        await join_request.approve()
+        logger.info(f"Заявка на вступление пользователя {user_id} одобрена")
+    else:
+        await join_request.decline()
+        logger.info(f"Заявка на вступление пользователя {user_id} отклонена")
@@ -1,23 +1,36 @@
+import asyncio
+
 from loguru import logger
-from telegram import Update
+from telegram import Update, error
 from telegram.ext import ContextTypes, ExtBot
 
+from app import middlewares
 from app.core.config import settings
 from app.db.engine import UnitOfWork
-from app.domain.application.exceptions import ApplicationDoesNotExistError
-from app.services.applications.application_retrieve import ApplicationRetrieveService
+from app.services.applications.application_retrieve_many import (
+    ApplicationRetrieveManyService,
+)
+
+# Revocations sent at the same time for one join event.
+MAX_CONCURRENT_REVOKES = 5
 
 
+@middlewares.use(middlewares.UnitOfWorkMiddleware())
 async def new_user_joined_handler(
     update: Update,
     context: ContextTypes.DEFAULT_TYPE,
+    uow: UnitOfWork,
 ) -> None:
     """
     Handle new user joined event.
 
+    The applications of all new members are read by one query, then their
+    invite links are revoked concurrently.
+
     Args:
         update (Update): The update.
         context (ContextTypes.DEFAULT_TYPE): The context.
+        uow (UnitOfWork): The unit of work of the update.
 
     Returns:
         None
@@ -26,45 +39,59 @@ async def new_user_joined_handler(
     if not message:
         return
     logger.debug("В обработчике нового пользователя")
-    new_users = message.new_chat_members
-    for new_user in new_users:
-        uow = UnitOfWork()
-        application_service = ApplicationRetrieveService(uow)
-        user_id = new_user.id
-        try:
-            application = await application_service.execute(user_id)
-        except ApplicationDoesNotExistError:
+    user_ids = [new_user.id for new_user in message.new_chat_members]
+    applications = await ApplicationRetrieveManyService(uow).execute(user_ids)
+    links: dict[int, str] = {}
+    for user_id in user_ids:
+        application = applications.get(user_id)
+        if application is None:
             logger.warning(
                 (
                     f"Пользователь {user_id} не имеет активной заявки. "
                     "Невозможно получить ссылку"
                 ),
             )
-            return
-        user_link = application.invite_link
-        if not user_link:
+            continue
+        if not application.invite_link:
             logger.warning(
                 (
                     f"Пользователь {user_id} не имеет ссылки в заявке. "
                     "Невозможно получить ссылку"
                 ),
             )
-            return
-        await _revoke_invite_link(context.application.bot, user_link)
-        logger.debug(f"Ссылка пользователя {user_id} отозвана")
+            continue
+        links[user_id] = application.invite_link
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REVOKES)
+    await asyncio.gather(
+        *(
+            _revoke_invite_link(context.application.bot, semaphore, user_id, link)
+            for user_id, link in links.items()
+        ),
+    )
 
 
-async def _revoke_invite_link(bot: ExtBot, invite_link: str) -> None:
+async def _revoke_invite_link(
+    bot: ExtBot,
+    semaphore: asyncio.Semaphore,
+    user_id: int,
+    invite_link: str,
+) -> None:
     """
-    Revoke invite link.
+    Revoke invite link, a failure is only logged.
 
     Args:
         bot (ExtBot): The bot.
+        semaphore (asyncio.Semaphore): Limits concurrent revocations.
+        user_id (int): Telegram ID of the user of the link.
         invite_link (str): The invite link.
 
     Returns:
         None
     """
-    logger.debug("In revoke invite link handler.")
-    chat_id = settings.CLAN_CHAT_ID
-    await bot.revoke_chat_invite_link(chat_id, invite_link)
+    async with semaphore:
+        try:
+            await bot.revoke_chat_invite_link(settings.CLAN_CHAT_ID, invite_link)
+        except error.TelegramError as e:
+            logger.warning(f"Не удалось отозвать ссылку пользователя {user_id}: {e}")
+            return
+    logger.debug("Ссылка пользователя {} отозвана", user_id)
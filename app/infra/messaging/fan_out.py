@@ -0,0 +1,37 @@
+import asyncio
+from collections.abc import Awaitable
+
+from loguru import logger
+from telegram.error import TelegramError
+
+
+async def fan_out(**calls: Awaitable[object]) -> dict[str, bool]:
+    """
+    Make independent Bot API calls at the same time.
+
+    The calls run in a task group, so the caller returns only when all of
+    them are done. A call failed by Telegram is logged and does not cancel
+    the others, any other error cancels the remaining calls and is raised.
+
+    Args:
+        **calls (Awaitable[object]): The calls by name used in the log.
+
+    Returns:
+        dict[str, bool]: Whether every call succeeded, by name.
+    """
+    async with asyncio.TaskGroup() as group:
+        tasks = {
+            name: group.create_task(_isolated(name, call))
+            for name, call in calls.items()
+        }
+    return {name: task.result() for name, task in tasks.items()}
+
+
+async def _isolated(name: str, call: Awaitable[object]) -> bool:
+    """Await the call and report a Telegram error instead of raising it."""
+    try:
+        await call
+    except TelegramError as e:
+        logger.warning(f"Не удалось выполнить {name}: {e}")
+        return False
+    return True
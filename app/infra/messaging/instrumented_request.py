@@ -0,0 +1,78 @@
+import time
+from http import HTTPStatus
+from typing import Any
+
+from telegram.request import BaseRequest, RequestData
+
+from app.core import metrics
+
+
+class InstrumentedRequest(BaseRequest):
+    """
+    Measure Bot API requests made by another request.
+
+    Every request is recorded by its Bot API method after the rate limiter
+    let it through, so the time is the round trip to Telegram only.
+    """
+
+    def __init__(self, request: BaseRequest) -> None:
+        """
+        Initialize the request.
+
+        Args:
+            request (BaseRequest): The request that talks to Telegram.
+
+        Returns:
+            None
+        """
+        self._request = request
+
+    @property
+    def read_timeout(self) -> float | None:
+        """Return the read timeout of the wrapped request."""
+        return self._request.read_timeout
+
+    async def initialize(self) -> None:
+        """Initialize the wrapped request."""
+        await self._request.initialize()
+
+    async def shutdown(self) -> None:
+        """Shut the wrapped request down."""
+        await self._request.shutdown()
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,
+        request_data: RequestData | None = None,
+        **timeouts: Any,  # noqa: ANN401
+    ) -> tuple[int, bytes]:
+        """
+        Make the request with the wrapped request and record it.
+
+        Args:
+            url (str): URL of the Bot API method.
+            method (str): HTTP method.
+            request_data (RequestData | None): Parameters of the request.
+            **timeouts (Any): Timeouts of the request.
+
+        Returns:
+            tuple[int, bytes]: HTTP status code and body of the response.
+        """
+        api_method = url.rsplit("/", 1)[-1]
+        start = time.perf_counter()
+        try:
+            code, payload = await self._request.do_request(
+                url,
+                method,
+                request_data,
+                **timeouts,
+            )
+        except Exception:
+            metrics.telegram_errors.inc(api_method)
+            raise
+        finally:
+            metrics.observe_telegram_request(api_method, time.perf_counter() - start)
+        if code != HTTPStatus.OK:
+            metrics.telegram_errors.inc(api_method)
+        return code, payload
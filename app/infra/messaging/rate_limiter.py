@@ -0,0 +1,243 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Callable, Coroutine
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import Any
+
+from loguru import logger
+from telegram.error import RetryAfter
+from telegram.ext import BaseRateLimiter
+
+
+class Priority(IntEnum):
+    """Order of waiting requests, lower is sent first."""
+
+    ADMIN = 0
+    USER = 1
+    BULK = 2
+
+
+# Chats of the admin whose update is being handled, see AdminPriorityMiddleware.
+admin_chats: ContextVar[frozenset[int]] = ContextVar(
+    "admin_chats",
+    default=frozenset(),
+)
+
+
+class TokenBucket:
+    """Allows `rate` requests per second on average and bursts of `capacity`."""
+
+    __slots__ = ("_tokens", "_updated_at", "capacity", "rate")
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        """
+        Initialize the bucket full.
+
+        Args:
+            rate (float): Tokens added per second.
+            capacity (float): Maximum number of tokens.
+
+        Returns:
+            None
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+
+    def delay(self, now: float) -> float:
+        """
+        Return seconds until a token is available.
+
+        Args:
+            now (float): Current `time.monotonic()`.
+
+        Returns:
+            float: The delay, 0 if a token is available.
+        """
+        self._refill(now)
+        if self._tokens >= 1:
+            return 0
+        return (1 - self._tokens) / self.rate
+
+    def take(self, now: float) -> None:
+        """
+        Take a token, the caller must check `delay` first.
+
+        Args:
+            now (float): Current `time.monotonic()`.
+
+        Returns:
+            None
+        """
+        self._refill(now)
+        self._tokens -= 1
+
+    def _refill(self, now: float) -> None:
+        """Add tokens for the time passed since the last update."""
+        elapsed = max(now - self._updated_at, 0)
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+
+class OutboundRateLimiter(BaseRateLimiter[Priority]):
+    """
+    Schedules all Bot API requests of the bot below Telegram limits.
+
+    Requests to a chat take a token of the global bucket, requests to a group
+    also take a token of the group bucket first. Requests waiting for the
+    global bucket are sent by priority: requests with `rate_limit_args` use
+    the given priority, edits, requests to the admin chat and to the chats in
+    `admin_chats` are `Priority.ADMIN`, everything else, like notifications
+    of applicants, is `Priority.USER`. Broadcasts use `Priority.BULK`, so
+    they only take the tokens left by other requests. Requests without a
+    chat, like callback answers, are not limited. On `RetryAfter` all requests
+    are paused and the request is retried.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        admin_chat_id: int,
+        messages_per_second: float,
+        group_messages_per_minute: float,
+        group_burst: int,
+        max_retries: int,
+    ) -> None:
+        """
+        Initialize the rate limiter.
+
+        Args:
+            admin_chat_id (int): Telegram ID of the admin chat.
+            messages_per_second (float): Global limit.
+            group_messages_per_minute (float): Limit per group chat.
+            group_burst (int): Requests a group chat may get at once.
+            max_retries (int): Retries of a request after `RetryAfter`.
+
+        Returns:
+            None
+        """
+        self._admin_chat_id = admin_chat_id
+        self._global = TokenBucket(messages_per_second, messages_per_second)
+        self._group_rate = group_messages_per_minute / 60
+        self._group_burst = group_burst
+        self._groups: dict[int, tuple[asyncio.Lock, TokenBucket]] = {}
+        self._max_retries = max_retries
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._order = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._paused_until = 0.0
+        self._dispatcher: asyncio.Task[None] | None = None
+
+    async def initialize(self) -> None:
+        """Start sending waiting requests."""
+        self._dispatcher = asyncio.create_task(self._dispatch())
+
+    async def shutdown(self) -> None:
+        """Stop sending waiting requests and cancel them."""
+        if self._dispatcher is not None:
+            self._dispatcher.cancel()
+            self._dispatcher = None
+        for _, _, future in self._waiters:
+            future.cancel()
+        self._waiters.clear()
+
+    async def process_request(  # noqa: PLR0913
+        self,
+        callback: Callable[..., Coroutine[Any, Any, bool | dict[str, Any] | None]],
+        args: Any,  # noqa: ANN401
+        kwargs: dict[str, Any],
+        endpoint: str,
+        data: dict[str, Any],
+        rate_limit_args: Priority | None,
+    ) -> bool | dict[str, Any] | None:
+        """
+        Wait for the turn of the request and make it.
+
+        Args:
+            callback (Callable): Makes the request.
+            args (Any): Positional arguments of the callback.
+            kwargs (dict[str, Any]): Keyword arguments of the callback.
+            endpoint (str): The Bot API method.
+            data (dict[str, Any]): Parameters of the method.
+            rate_limit_args (Priority | None): Priority of the request.
+
+        Raises:
+            RetryAfter: If Telegram still limits the bot after all retries.
+
+        Returns:
+            bool | dict[str, Any] | None: The result of the callback.
+        """
+        chat_id = data.get("chat_id")
+        if not isinstance(chat_id, int):
+            return await callback(*args, **kwargs)
+        priority = (
+            rate_limit_args
+            if rate_limit_args is not None
+            else self._get_priority(endpoint, chat_id)
+        )
+        retries = 0
+        while True:
+            await self._wait_for_turn(chat_id, priority)
+            try:
+                return await callback(*args, **kwargs)
+            except RetryAfter as e:
+                if retries == self._max_retries:
+                    raise
+                retries += 1
+                logger.warning(
+                    f"Telegram ограничил отправку на {e.retry_after} с., "
+                    f"{endpoint=} {chat_id=}",
+                )
+                self._paused_until = max(
+                    self._paused_until,
+                    time.monotonic() + e.retry_after,
+                )
+
+    def _get_priority(self, endpoint: str, chat_id: int) -> Priority:
+        """Return the default priority of the request."""
+        if (
+            chat_id == self._admin_chat_id
+            or chat_id in admin_chats.get()
+            or endpoint.startswith("edit")
+        ):
+            return Priority.ADMIN
+        return Priority.USER
+
+    async def _wait_for_turn(self, chat_id: int, priority: Priority) -> None:
+        """Wait for the group bucket of the chat and then for the global one."""
+        if chat_id < 0:
+            if chat_id not in self._groups:
+                self._groups[chat_id] = (
+                    asyncio.Lock(),
+                    TokenBucket(self._group_rate, self._group_burst),
+                )
+            lock, bucket = self._groups[chat_id]
+            async with lock:
+                while (delay := bucket.delay(time.monotonic())) > 0:
+                    await asyncio.sleep(delay)
+                bucket.take(time.monotonic())
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._order), future))
+        self._wakeup.set()
+        await future
+
+    async def _dispatch(self) -> None:
+        """Let waiting requests go by priority as the global bucket allows."""
+        while True:
+            if not self._waiters:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+            now = time.monotonic()
+            delay = max(self._paused_until - now, self._global.delay(now))
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue
+            self._global.take(now)
+            future.set_result(None)
@@ -1,12 +1,34 @@
+import asyncio
+from datetime import timedelta
 from pathlib import Path
 
 import uvloop
 from loguru import logger
 from telegram.ext import Application, ApplicationBuilder
+from telegram.request import HTTPXRequest
 
 from app import handlers
+from app.core import metrics, metrics_server
 from app.core.config import settings
+from app.core.logs import setup_logging
+from app.core.persistence import DatabasePersistence
+from app.core.update_processor import PerUserUpdateProcessor
+from app.core.webhook import get_webhook_options
+from app.db import pool_metrics
+from app.db.engine import UnitOfWork, engine, warm_up_pool
 from app.handlers import error
+from app.handlers.admins.broadcasts import broadcast
+from app.infra.messaging.instrumented_request import InstrumentedRequest
+from app.infra.messaging.rate_limiter import OutboundRateLimiter
+from app.services.applications.application_status_count import (
+    ApplicationStatusCountService,
+)
+from app.services.invite_links.invite_link_pool_refill import (
+    InviteLinkPoolRefillService,
+)
+from app.services.outbox.outbox_send import OutboxSendService
+
+_background_tasks: set[asyncio.Task] = set()
 
 
 def main() -> None:
@@ -18,24 +40,11 @@ def main() -> None:
 
 def _loguru_setup() -> None:
     """Loguru setup."""
-    logger.remove()
-    current_file_path = Path(__file__).resolve()
-    app_directory = current_file_path.parent
-    logs_directory = app_directory / "logs"
-    Path.mkdir(logs_directory, exist_ok=True)
-    full_log_path = logs_directory / "full_log.log"
-    warnings_log_path = logs_directory / "warnings_and_above.log"
-    logger.add(
-        sink=full_log_path,
-        level="DEBUG",
-        rotation="1 day",
-        compression="zip",
-    )
-    logger.add(
-        sink=warnings_log_path,
-        level="WARNING",
-        rotation="10 MB",
-        compression="zip",
+    setup_logging(
+        Path(__file__).resolve().parent / "logs",
+        settings.LOG_LEVEL,
+        settings.LOG_JSON,
+        settings.LOG_DEBUG_SAMPLING,
     )
     logger.info("Настройка логгера прошла успешно.")
 
@@ -48,7 +57,7 @@ def _install_uvloop() -> None:
 
 async def post_init(application: Application) -> None:
     """
-    Set bot commands.
+    Set bot commands, warm up the pool and start background tasks.
 
     Args:
         application (Application): The application.
@@ -57,19 +66,181 @@ async def post_init(application: Application) -> None:
         None
     """
     await application.bot.set_my_commands([("start", "Подать заявку")])
+    await warm_up_pool(
+        engine,
+        min(settings.SQLALCHEMY_POOL_WARMUP, settings.SQLALCHEMY_POOL_SIZE),
+    )
+    if settings.POOL_METRICS_INTERVAL > 0:
+        _background_tasks.add(
+            asyncio.create_task(
+                pool_metrics.report_periodically(
+                    engine.pool,
+                    settings.POOL_METRICS_INTERVAL,
+                ),
+            ),
+        )
+    if settings.METRICS_PORT:
+        _register_gauges(application)
+        server = await metrics_server.start(
+            metrics.registry,
+            settings.METRICS_LISTEN,
+            settings.METRICS_PORT,
+        )
+        _background_tasks.add(asyncio.create_task(server.serve_forever()))
+    for _ in range(settings.OUTBOX_WORKERS):
+        _background_tasks.add(asyncio.create_task(_send_outbox(application)))
+    if not settings.CLAN_CHAT_JOIN_LINK:
+        _background_tasks.add(
+            asyncio.create_task(_refill_invite_links(application)),
+        )
+    await broadcast.resume_broadcasts(application)
+
+
+def _register_gauges(application: Application) -> None:
+    """
+    Register gauges of conversations, applications and the connection pool.
+
+    Args:
+        application (Application): The application.
+
+    Returns:
+        None
+    """
+    if isinstance(application.persistence, DatabasePersistence):
+        metrics.registry.gauge(
+            "bot_conversations",
+            "Conversations in every state by conversation handler.",
+            ("conversation", "state"),
+            application.persistence.count_states,
+        )
+    metrics.registry.gauge(
+        "bot_applications",
+        "Applications by status.",
+        ("status",),
+        _count_applications,
+    )
+    metrics.register_pool(metrics.registry, engine.pool)
+
+
+async def _count_applications() -> dict[tuple[str], int]:
+    """Return the number of applications by status name."""
+    counts = await ApplicationStatusCountService(UnitOfWork()).execute()
+    return {(status.name,): count for status, count in counts.items()}
+
+
+async def _send_outbox(application: Application) -> None:
+    """
+    Send outbox messages until the bot stops.
+
+    Args:
+        application (Application): The application.
+
+    Returns:
+        None
+    """
+    service = OutboxSendService(
+        UnitOfWork(),
+        application.bot,
+        settings.OUTBOX_BATCH_SIZE,
+        settings.OUTBOX_MAX_ATTEMPTS,
+        timedelta(seconds=settings.OUTBOX_RETRY_DELAY),
+        timedelta(seconds=settings.OUTBOX_LEASE),
+    )
+    while True:
+        try:
+            claimed = await service.execute()
+        except Exception:  # noqa: BLE001
+            logger.exception("Не удалось отправить сообщения из outbox")
+            claimed = 0
+        # A full batch means more messages may be due right away.
+        if claimed < settings.OUTBOX_BATCH_SIZE:
+            await asyncio.sleep(settings.OUTBOX_POLL_INTERVAL)
+
+
+async def _refill_invite_links(application: Application) -> None:
+    """
+    Keep the pool of invite links full.
+
+    Args:
+        application (Application): The application.
+
+    Returns:
+        None
+    """
+    service = InviteLinkPoolRefillService(
+        UnitOfWork(),
+        application.bot,
+        settings.CLAN_CHAT_ID,
+        settings.INVITE_LINK_POOL_SIZE,
+        timedelta(seconds=settings.INVITE_LINK_MAX_AGE),
+    )
+    while True:
+        try:
+            await service.execute()
+        except Exception:  # noqa: BLE001
+            logger.exception("Не удалось пополнить пул пригласительных ссылок")
+        await asyncio.sleep(settings.INVITE_LINK_POOL_REFILL_INTERVAL)
+
+
+async def post_shutdown(application: Application) -> None:  # noqa: ARG001
+    """
+    Stop background tasks and broadcasts and flush the logs.
+
+    Args:
+        application (Application): The application.
+
+    Returns:
+        None
+    """
+    for task in _background_tasks:
+        task.cancel()
+    _background_tasks.clear()
+    broadcast.stop_broadcasts()
+    # Wait until the log sink threads wrote the queued records, the records
+    # logged after are written when loguru removes the sinks at exit.
+    await logger.complete()
 
 
 def _start_bot() -> None:
     """Start bot."""
     application: Application = (
-        ApplicationBuilder().token(settings.BOT_TOKEN).post_init(post_init).build()
+        ApplicationBuilder()
+        .token(settings.BOT_TOKEN)
+        # The pool size of the default request of ApplicationBuilder.
+        .request(InstrumentedRequest(HTTPXRequest(connection_pool_size=256)))
+        .concurrent_updates(
+            PerUserUpdateProcessor(
+                settings.UPDATE_WORKERS,
+                settings.MAX_CONCURRENT_UPDATES,
+            ),
+        )
+        .rate_limiter(
+            OutboundRateLimiter(
+                admin_chat_id=settings.ADMIN_CHAT_ID,
+                messages_per_second=settings.RATE_LIMIT_MESSAGES_PER_SECOND,
+                group_messages_per_minute=settings.RATE_LIMIT_GROUP_MESSAGES_PER_MINUTE,
+                group_burst=settings.RATE_LIMIT_GROUP_BURST,
+                max_retries=settings.RATE_LIMIT_MAX_RETRIES,
+            ),
+        )
+        .persistence(
+            DatabasePersistence(UnitOfWork(), settings.PERSISTENCE_UPDATE_INTERVAL),
+        )
+        .post_init(post_init)
+        .post_shutdown(post_shutdown)
+        .build()
     )
     logger.debug("Создание приложения прошло успешно.")
     handlers.add_all_handlers(application)
+    metrics.instrument_engine(engine)
     application.add_error_handler(error.error_handler)
     logger.debug("Добавление обработчиков прошло успешно.")
-    logger.info("Бот запущен")
-    application.run_polling(drop_pending_updates=True)
+    if settings.WEBHOOK_URL:
+        logger.info("Бот запущен в режиме webhook")
+        application.run_webhook(**get_webhook_options(settings))
+    else:
+        logger.info("Бот запущен")
+        application.run_polling(drop_pending_updates=True)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,13 @@
+from app.middlewares.base import BaseMiddleware, use
+from app.middlewares.priority import AdminPriorityMiddleware
+from app.middlewares.unit_of_work import UnitOfWorkMiddleware
+from app.middlewares.updates import ApplicationUpdateMiddleware, UpdateDataMiddleware
+
+__all__ = [
+    "BaseMiddleware",
+    "use",
+    "AdminPriorityMiddleware",
+    "ApplicationUpdateMiddleware",
+    "UpdateDataMiddleware",
+    "UnitOfWorkMiddleware",
+]
@@ -0,0 +1,81 @@
+import inspect
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from functools import partial, wraps
+from typing import Any
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+NextHandler = Callable[
+    [Update, ContextTypes.DEFAULT_TYPE, dict[str, Any]],
+    Awaitable[Any],
+]
+UpdateHandler = Callable[[Update, ContextTypes.DEFAULT_TYPE], Awaitable[Any]]
+
+
+class BaseMiddleware(ABC):
+    """Base class for middlewares wrapped around update handlers."""
+
+    @abstractmethod
+    async def __call__(
+        self,
+        handler: NextHandler,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """
+        Process the update and call the next handler.
+
+        Args:
+            handler (NextHandler): The next middleware or the handler itself.
+            update (Update): The update.
+            context (ContextTypes.DEFAULT_TYPE): The context.
+            data (dict[str, Any]): Data collected for the handler.
+
+        Returns:
+            Any: The result of the handler or the state to return instead.
+        """
+
+
+def use(
+    *middlewares: BaseMiddleware,
+) -> Callable[[Callable[..., Awaitable[Any]]], UpdateHandler]:
+    """
+    Wrap the handler into the middlewares.
+
+    The first middleware is the outermost one. The handler receives the data
+    collected by the middlewares as keyword arguments, limited to the ones
+    declared in its signature. `update` and `context` are always available.
+
+    Args:
+        *middlewares (BaseMiddleware): The middlewares.
+
+    Returns:
+        Callable: Decorator that makes an update handler.
+    """
+
+    def decorator(update_func: Callable[..., Awaitable[Any]]) -> UpdateHandler:
+        parameters = set(inspect.signature(update_func).parameters)
+
+        async def call_handler(
+            update: Update,  # noqa: ARG001
+            context: ContextTypes.DEFAULT_TYPE,  # noqa: ARG001
+            data: dict[str, Any],
+        ) -> Any:  # noqa: ANN401
+            return await update_func(
+                **{key: value for key, value in data.items() if key in parameters},
+            )
+
+        chain: NextHandler = call_handler
+        for middleware in reversed(middlewares):
+            chain = partial(middleware, chain)
+
+        @wraps(update_func)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE) -> Any:  # noqa: ANN401
+            return await chain(update, context, {"update": update, "context": context})
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,47 @@
+from typing import Any
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from app.infra.messaging.rate_limiter import admin_chats
+from app.middlewares.base import BaseMiddleware, NextHandler
+
+
+class AdminPriorityMiddleware(BaseMiddleware):
+    """
+    Send requests to the admin of the update before applicant notifications.
+
+    Requests to the chat of the update and to the private chat of the admin
+    get `Priority.ADMIN` in the outbound rate limiter, requests to other
+    chats keep their default priority.
+    """
+
+    async def __call__(
+        self,
+        handler: NextHandler,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """
+        Mark the chats of the admin and call the next handler.
+
+        Args:
+            handler (NextHandler): The next handler.
+            update (Update): The update.
+            context (ContextTypes.DEFAULT_TYPE): The context.
+            data (dict[str, Any]): Data collected for the handler.
+
+        Returns:
+            Any: The result of the handler.
+        """
+        chats = frozenset(
+            entity.id
+            for entity in (update.effective_chat, update.effective_user)
+            if entity is not None
+        )
+        token = admin_chats.set(chats)
+        try:
+            return await handler(update, context, data)
+        finally:
+            admin_chats.reset(token)
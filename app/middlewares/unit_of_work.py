@@ -0,0 +1,40 @@
+from typing import Any
+
+from telegram import Update
+from telegram.ext import ContextTypes
+
+from app.db.engine import UnitOfWork
+from app.middlewares.base import BaseMiddleware, NextHandler
+
+
+class UnitOfWorkMiddleware(BaseMiddleware):
+    """
+    Provide a unit of work scoped to the update as `uow`.
+
+    All services of the update share one session, so an application loaded
+    or changed by one service is not queried again by the next one.
+    """
+
+    async def __call__(
+        self,
+        handler: NextHandler,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """
+        Open the unit of work scope and call the next handler.
+
+        Args:
+            handler (NextHandler): The next handler.
+            update (Update): The update.
+            context (ContextTypes.DEFAULT_TYPE): The context.
+            data (dict[str, Any]): Data collected for the handler.
+
+        Returns:
+            Any: The result of the handler.
+        """
+        uow = UnitOfWork()
+        async with uow.scope():
+            data["uow"] = uow
+            return await handler(update, context, data)
@@ -0,0 +1,128 @@
+from typing import Any
+
+from loguru import logger
+from telegram import Update
+from telegram.ext import ContextTypes, ConversationHandler
+
+from app.middlewares.base import BaseMiddleware, NextHandler
+
+
+class ApplicationUpdateMiddleware(BaseMiddleware):
+    """
+    Check messages sent while the application is filled.
+
+    Provides `user`, `user_id`, `chat` and `message` to the handler.
+    """
+
+    def __init__(self, return_error_state: int | None = None) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            return_error_state (int | None): The state to return if the message
+            was edited.
+
+        Returns:
+            None
+        """
+        self._return_error_state = return_error_state
+
+    async def __call__(
+        self,
+        handler: NextHandler,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """
+        Check the update and call the next handler.
+
+        Args:
+            handler (NextHandler): The next handler.
+            update (Update): The update.
+            context (ContextTypes.DEFAULT_TYPE): The context.
+            data (dict[str, Any]): Data collected for the handler.
+
+        Returns:
+            Any: The result of the handler or the error state.
+        """
+        if update.edited_message:
+            logger.warning(
+                "Получено событие редактирования сообщения при заполнении анкеты. "
+                "Игнорируем его.",
+            )
+            return self._return_error_state
+        user = update.effective_user
+        chat = update.effective_chat
+        message = update.message
+        if user is None or chat is None or message is None:
+            logger.critical(
+                "Получен некорректный user или chat или message при заполнении "
+                "анкеты. Данная ошибка не должна никогда происходить!",
+            )
+            return ConversationHandler.END
+        data.update(user=user, user_id=user.id, chat=chat, message=message)
+        return await handler(update, context, data)
+
+
+class UpdateDataMiddleware(BaseMiddleware):
+    """
+    Check the update and provide its data to the handler.
+
+    Provides `chat` and, if required, `callback` and `message` to the handler.
+    """
+
+    def __init__(
+        self,
+        *,
+        need_callback: bool = False,
+        need_message: bool = False,
+    ) -> None:
+        """
+        Initialize the middleware.
+
+        Args:
+            need_callback (bool): Whether the callback query is required.
+            need_message (bool): Whether the message is required.
+
+        Returns:
+            None
+        """
+        self._need_callback = need_callback
+        self._need_message = need_message
+
+    async def __call__(
+        self,
+        handler: NextHandler,
+        update: Update,
+        context: ContextTypes.DEFAULT_TYPE,
+        data: dict[str, Any],
+    ) -> Any:  # noqa: ANN401
+        """
+        Check the update and call the next handler.
+
+        Args:
+            handler (NextHandler): The next handler.
+            update (Update): The update.
+            context (ContextTypes.DEFAULT_TYPE): The context.
+            data (dict[str, Any]): Data collected for the handler.
+
+        Returns:
+            Any: The result of the handler or `ConversationHandler.END`.
+        """
+        chat = update.effective_chat
+        if chat is None:
+            logger.critical("Получен некорректный chat при обработке update.")
+            return ConversationHandler.END
+        if self._need_callback and update.callback_query is None:
+            logger.warning("Отсутствует callback при обработке update.")
+            return ConversationHandler.END
+        if self._need_message and update.message is None:
+            logger.warning("Отсутствует message при обработке update.")
+            return ConversationHandler.END
+        data.update(
+            chat=chat,
+            callback=update.callback_query,
+            message=update.message,
+        )
+        return await handler(update, context, data)
@@ -2,6 +2,10 @@ from app.models.admin_processing_applications import AdminProcessingApplication
 from app.models.application_answers import ApplicationAnswer
 from app.models.applications import Application
 from app.models.base import Base
+from app.models.broadcasts import Broadcast
+from app.models.invite_links import InviteLink
+from app.models.outbox import OutboxMessage
+from app.models.persistence import ConversationState, UserData
 from app.models.users import User
 
 __all__ = [
@@ -10,4 +14,9 @@ __all__ = [
     "Application",
     "ApplicationAnswer",
     "AdminProcessingApplication",
+    "Broadcast",
+    "InviteLink",
+    "OutboxMessage",
+    "UserData",
+    "ConversationState",
 ]
@@ -13,6 +13,7 @@ class AdminProcessingApplication(Base):
     admin_id: Mapped[int] = mapped_column(
         ForeignKey("users.id", ondelete="CASCADE"),
         type_=BigInteger,
+        unique=True,
     )
     application_id: Mapped[int] = mapped_column(
         ForeignKey("applications.id", ondelete="CASCADE"),
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, ForeignKey, text
+from sqlalchemy import TIMESTAMP, ForeignKey, UniqueConstraint, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.models.base import Base
@@ -10,6 +10,13 @@ class ApplicationAnswer(Base):
     """ApplicationAnswer model for database table."""
 
     __tablename__ = "application_answers"
+    __table_args__ = (
+        UniqueConstraint(
+            "application_id",
+            "question_number",
+            name="uq_application_answers_application_id_question_number",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     application_id: Mapped[int] = mapped_column(
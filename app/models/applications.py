@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import TIMESTAMP, BigInteger, ForeignKey, String, text
+from sqlalchemy import TIMESTAMP, BigInteger, ForeignKey, Index, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.domain.application.value_objects import ApplicationStatusEnum
@@ -11,6 +11,9 @@ class Application(Base):
     """Application model for database table."""
 
     __tablename__ = "applications"
+    __table_args__ = (
+        Index("ix_applications_user_id_created_at", "user_id", "created_at"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     user_id: Mapped[int] = mapped_column(
@@ -27,6 +30,10 @@ class Application(Base):
     )
     rejection_reason: Mapped[str] = mapped_column(String, nullable=True)
     invite_link: Mapped[str] = mapped_column(String(255), nullable=True)
+    # The post in the admin chat and the review message in the private chat
+    # of the admin who took the application, edited after the decision.
+    admin_chat_message_id: Mapped[int] = mapped_column(BigInteger, nullable=True)
+    review_message_id: Mapped[int] = mapped_column(BigInteger, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         TIMESTAMP(timezone=True),
         server_default=text("TIMEZONE('utc', NOW())"),
@@ -0,0 +1,46 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, BigInteger, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.domain.broadcast.value_objects import BroadcastAudienceEnum
+from app.models.base import Base
+
+
+class Broadcast(Base):
+    """Broadcast model for database table."""
+
+    __tablename__ = "broadcasts"
+    __table_args__ = (
+        Index(
+            "ix_broadcasts_unfinished_id",
+            "id",
+            postgresql_where=text("NOT is_finished"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    admin_id: Mapped[int] = mapped_column(BigInteger)
+    audience: Mapped[BroadcastAudienceEnum]
+    message: Mapped[str] = mapped_column(String)
+    # Progress, saved after every batch of recipients.
+    last_user_id: Mapped[int] = mapped_column(
+        BigInteger,
+        default=0,
+        server_default="0",
+    )
+    delivered: Mapped[int] = mapped_column(default=0, server_default="0")
+    failed: Mapped[int] = mapped_column(default=0, server_default="0")
+    blocked: Mapped[int] = mapped_column(default=0, server_default="0")
+    is_finished: Mapped[bool] = mapped_column(
+        default=False,
+        server_default="false",
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("TIMEZONE('utc', NOW())"),
+    )
+    finished_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
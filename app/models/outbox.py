@@ -0,0 +1,44 @@
+from datetime import datetime
+
+from sqlalchemy import TIMESTAMP, BigInteger, Index, String, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.models.base import Base
+
+
+class OutboxMessage(Base):
+    """Message to a chat written in the transaction of the change it reports."""
+
+    __tablename__ = "outbox"
+    __table_args__ = (
+        Index(
+            "ix_outbox_pending_id",
+            "id",
+            postgresql_where=text("failed_at IS NULL"),
+        ),
+        # Finds the earlier pending messages of a chat.
+        Index(
+            "ix_outbox_pending_chat_id_id",
+            "chat_id",
+            "id",
+            postgresql_where=text("failed_at IS NULL"),
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    chat_id: Mapped[int] = mapped_column(BigInteger)
+    message: Mapped[str] = mapped_column(String)
+    attempts: Mapped[int] = mapped_column(default=0, server_default="0")
+    # The message is not claimed by a worker before this time.
+    available_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("NOW()"),
+    )
+    failed_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        nullable=True,
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True),
+        server_default=text("TIMEZONE('utc', NOW())"),
+    )
@@ -1,5 +1,8 @@
+from typing import NoReturn
+
 from loguru import logger
 
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.admin_processing_application.exceptions import (
     AdminProcessingApplicationDoesNotExistError,
@@ -7,6 +10,9 @@ from app.domain.admin_processing_application.exceptions import (
     WrongAdminError,
 )
 from app.domain.application.entities import Application
+from app.domain.application.exceptions import ChangeApplicationStatusError
+from app.domain.invite_link.exceptions import InviteLinkPoolIsEmptyError
+from app.services.applications.application_notifications import accepted_messages
 
 
 class ApplicationAdminAcceptService:
@@ -24,21 +30,31 @@ class ApplicationAdminAcceptService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(
         self,
         admin_id: int,
         application_id: int,
-        invite_link: str,
+        invite_link: str | None = None,
+        *,
+        join_link: str | None = None,
     ) -> Application:
         """
         Accept an application.
 
+        Messages to the user are written to the outbox in the same transaction.
+
         Args:
             admin_id (int): Telegram ID of the admin.
             application_id (int): Telegram ID of the application.
-            invite_link (str): The invite link.
+            invite_link (str | None): The invite link, taken from the pool
+            of invite links if neither link is given.
+            join_link (str | None): The shared join request link of the clan
+            chat. It is only sent to the user, the application keeps no link,
+            so the link is never revoked when the user joins.
 
         Raises:
+            InviteLinkPoolIsEmptyError: If no link is given and the pool is empty.
             ApplicationAlreadyProcessedError: If the application is already processed.
             WrongAdminError: If the admin is not the same as the application.
             ChangeApplicationStatusError: If the current status is wrong.
@@ -47,22 +63,58 @@ class ApplicationAdminAcceptService:
             Application: The accepted application.
         """
         async with self._uow():
-            try:
-                admin_application = (
-                    await self._uow.admin_processing_application.get_by_admin_id(
-                        admin_id,
-                    )
-                )
-            except AdminProcessingApplicationDoesNotExistError as e:
-                raise ApplicationAlreadyProcessedError from e
-            if admin_application.application_id != application_id:
-                logger.error(
-                    "Попытка принять заявку с неверным админом.",
-                )
-                raise WrongAdminError
-            application = await self._uow.application.get_by_id(application_id)
-            application.accept(invite_link)
-            await self._uow.application.update(application)
-            await self._uow.admin_processing_application.delete(admin_application)
+            if invite_link is None and join_link is None:
+                # Goes back to the pool if the application is not accepted.
+                invite_link = await self._uow.invite_link.take()
+                if invite_link is None:
+                    raise InviteLinkPoolIsEmptyError
+            application = await self._uow.application.accept(
+                application_id,
+                admin_id,
+                invite_link,
+            )
+            if application is None:
+                await self._uow.rollback()
+                await self._raise_accept_error(admin_id, application_id, invite_link)
+            await self._uow.outbox.add(
+                application.user_id,
+                accepted_messages(application, join_link),
+            )
             await self._uow.commit()
             return application
+
+    async def _raise_accept_error(
+        self,
+        admin_id: int,
+        application_id: int,
+        invite_link: str | None,
+    ) -> NoReturn:
+        """
+        Find out why the application could not be accepted and raise the error.
+
+        Args:
+            admin_id (int): Telegram ID of the admin.
+            application_id (int): Telegram ID of the application.
+            invite_link (str | None): The invite link.
+
+        Raises:
+            ApplicationAlreadyProcessedError: If the application is already processed.
+            WrongAdminError: If the admin is not the same as the application.
+            ChangeApplicationStatusError: If the current status is wrong.
+        """
+        try:
+            admin_application = (
+                await self._uow.admin_processing_application.get_by_admin_id(
+                    admin_id,
+                )
+            )
+        except AdminProcessingApplicationDoesNotExistError as e:
+            raise ApplicationAlreadyProcessedError from e
+        if admin_application.application_id != application_id:
+            logger.error(
+                "Попытка принять заявку с неверным админом.",
+            )
+            raise WrongAdminError
+        application = await self._uow.application.get_by_id(application_id)
+        application.accept(invite_link)
+        raise ChangeApplicationStatusError
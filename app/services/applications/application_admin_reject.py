@@ -1,5 +1,9 @@
+from datetime import datetime, timezone
+from typing import NoReturn
+
 from loguru import logger
 
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.admin_processing_application.exceptions import (
     AdminProcessingApplicationDoesNotExistError,
@@ -7,6 +11,8 @@ from app.domain.admin_processing_application.exceptions import (
     WrongAdminError,
 )
 from app.domain.application.entities import Application
+from app.domain.application.exceptions import ChangeApplicationStatusError
+from app.services.applications.application_notifications import rejected_messages
 
 
 class ApplicationAdminRejectService:
@@ -24,6 +30,7 @@ class ApplicationAdminRejectService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(
         self,
         admin_id: int,
@@ -33,6 +40,8 @@ class ApplicationAdminRejectService:
         """
         Reject an application.
 
+        Messages to the user are written to the outbox in the same transaction.
+
         Args:
             admin_id (int): Telegram ID of the admin.
             application_id (int): Telegram ID of the application.
@@ -47,22 +56,58 @@ class ApplicationAdminRejectService:
             Application: The rejected application.
         """
         async with self._uow():
-            try:
-                admin_application = (
-                    await self._uow.admin_processing_application.get_by_admin_id(
-                        admin_id,
-                    )
-                )
-            except AdminProcessingApplicationDoesNotExistError as e:
-                raise ApplicationAlreadyProcessedError from e
-            if admin_application.application_id != application_id:
-                logger.error(
-                    "Попытка отклонить заявку с неверным админом.",
+            application = await self._uow.application.reject(
+                application_id,
+                admin_id,
+                rejection_reason,
+                datetime.now(tz=timezone.utc),
+            )
+            if application is None:
+                await self._uow.rollback()
+                await self._raise_reject_error(
+                    admin_id,
+                    application_id,
+                    rejection_reason,
                 )
-                raise WrongAdminError
-            application = await self._uow.application.get_by_id(application_id)
-            application.reject(rejection_reason)
-            await self._uow.application.update(application)
-            await self._uow.admin_processing_application.delete(admin_application)
+            await self._uow.outbox.add(
+                application.user_id,
+                rejected_messages(application),
+            )
             await self._uow.commit()
             return application
+
+    async def _raise_reject_error(
+        self,
+        admin_id: int,
+        application_id: int,
+        rejection_reason: str | None,
+    ) -> NoReturn:
+        """
+        Find out why the application could not be rejected and raise the error.
+
+        Args:
+            admin_id (int): Telegram ID of the admin.
+            application_id (int): Telegram ID of the application.
+            rejection_reason (str | None): The reason for rejection.
+
+        Raises:
+            ApplicationAlreadyProcessedError: If the application is already processed.
+            WrongAdminError: If the admin is not the same as the application.
+            ChangeApplicationStatusError: If the current status is wrong.
+        """
+        try:
+            admin_application = (
+                await self._uow.admin_processing_application.get_by_admin_id(
+                    admin_id,
+                )
+            )
+        except AdminProcessingApplicationDoesNotExistError as e:
+            raise ApplicationAlreadyProcessedError from e
+        if admin_application.application_id != application_id:
+            logger.error(
+                "Попытка отклонить заявку с неверным админом.",
+            )
+            raise WrongAdminError
+        application = await self._uow.application.get_by_id(application_id)
+        application.reject(rejection_reason)
+        raise ChangeApplicationStatusError
@@ -1,5 +1,8 @@
+from typing import NoReturn
+
 from loguru import logger
 
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.admin_processing_application.dto import AdminProcessingApplicationDTO
 from app.domain.admin_processing_application.entities import AdminProcessingApplication
@@ -7,6 +10,7 @@ from app.domain.admin_processing_application.exceptions import (
     AdminAlreadyProcessedApplicationError,
     AdminProcessingApplicationDoesNotExistError,
 )
+from app.domain.application.exceptions import ChangeApplicationStatusError
 
 
 class ApplicationAdminTakeService:
@@ -24,6 +28,7 @@ class ApplicationAdminTakeService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(
         self,
         admin_id: int,
@@ -46,33 +51,51 @@ class ApplicationAdminTakeService:
             AdminProcessingApplication: The admin processing application.
         """
         async with self._uow():
-            application = await self._uow.application.get_by_id(application_id)
             try:
-                admin_processing_application = (
-                    await self._uow.admin_processing_application.get_by_admin_id(
-                        admin_id,
-                    )
-                )
-                logger.error(
-                    (
-                        f"Попытка взять в обработку заявку {application_id=} "
-                        f"админом {admin_id=}, который уже обрабатывает заявку"
-                    ),
-                )
-                raise AdminAlreadyProcessedApplicationError
-            except AdminProcessingApplicationDoesNotExistError:
-                application.take(admin_id)
-                await self._uow.application.update(application)
-                admin_application = AdminProcessingApplication(
-                    data=AdminProcessingApplicationDTO(
-                        admin_id=admin_id,
-                        application_id=application_id,
-                    ),
+                application = await self._uow.application.take(
+                    application_id,
+                    admin_id,
                 )
-                admin_processing_application = (
-                    await self._uow.admin_processing_application.create(
-                        admin_application,
-                    )
-                )
-                await self._uow.commit()
-                return admin_processing_application
+            except AdminAlreadyProcessedApplicationError:
+                self._log_already_processing(admin_id, application_id)
+                raise
+            if application is None:
+                await self._raise_take_error(admin_id, application_id)
+            await self._uow.commit()
+        return AdminProcessingApplication(
+            data=AdminProcessingApplicationDTO(
+                admin_id=admin_id,
+                application_id=application_id,
+            ),
+        )
+
+    async def _raise_take_error(self, admin_id: int, application_id: int) -> NoReturn:
+        """
+        Find out why the application could not be taken and raise the error.
+
+        Args:
+            admin_id (int): Telegram ID of the admin.
+            application_id (int): Telegram ID of the application.
+
+        Raises:
+            ApplicationDoesNotExistError: If the application does not exist.
+            AdminAlreadyProcessedApplicationError: If the admin already processed
+            the application.
+            ChangeApplicationStatusError: If the current status is wrong.
+        """
+        application = await self._uow.application.get_by_id(application_id)
+        try:
+            await self._uow.admin_processing_application.get_by_admin_id(admin_id)
+        except AdminProcessingApplicationDoesNotExistError:
+            application.take(admin_id)
+            raise ChangeApplicationStatusError from None
+        self._log_already_processing(admin_id, application_id)
+        raise AdminAlreadyProcessedApplicationError
+
+    def _log_already_processing(self, admin_id: int, application_id: int) -> None:
+        logger.error(
+            (
+                f"Попытка взять в обработку заявку {application_id=} "
+                f"админом {admin_id=}, который уже обрабатывает заявку"
+            ),
+        )
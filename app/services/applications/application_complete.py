@@ -1,3 +1,4 @@
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.application.entities import Application
 
@@ -17,6 +18,7 @@ class ApplicationCompleteService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, user_id: int) -> Application:
         """
         Execute the service.
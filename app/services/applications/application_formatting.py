@@ -1,7 +1,23 @@
+from collections import OrderedDict
+
 from loguru import logger
 
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.application.entities import Application
+from app.domain.application.value_objects import ApplicationStatusEnum
+
+# Characters escaped in MarkdownV2 text. The backslash goes first, so the
+# escapes added for the other characters are not escaped again.
+_MARKDOWN_SPECIAL_CHARS = tuple("\\_*[]()~`>#+-=|{}.!")
+# Rendered applications kept in memory, enough for all applications in review.
+CACHE_SIZE = 1024
+
+_RenderKey = tuple[ApplicationStatusEnum, tuple[str | None, ...]]
+# The latest text of every application by id, least recently used first.
+# The key holds the status and the answers, so a transition or a changed
+# answer renders the application again and replaces the old text.
+_cache: OrderedDict[int, tuple[_RenderKey, str]] = OrderedDict()
 
 
 class ApplicationFormattingService:
@@ -19,6 +35,7 @@ class ApplicationFormattingService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, application_id: int) -> str:
         """
         Execute the service instance.
@@ -32,61 +49,70 @@ class ApplicationFormattingService:
         Returns:
             str: Formatted application.
         """
-        async with self._uow():
+        async with self._uow(read_only=True):
             application = await self._uow.application.get_by_id(application_id)
-            return await self._format_application(application)
-
-    async def _format_application(
-        self,
-        application: Application,
-    ) -> str:
-        """Return formatted application."""
-        logger.debug(f"Форматирование заявки для application_id={application.id}")
-        status_name_escaped = self._escape_markdown(application.status)
-        answers_escaped = [
-            self._escape_markdown(answer.answer_text)
-            for key, answer in sorted(application.answers.items(), key=lambda x: x[0])
-        ]
-
-        user_display = f"[ID{application.user_id}](tg://user?id={application.user_id})"
-
-        message = (
-            f"ЗАЯВКА №{application.id} от пользователя {user_display}:\n\n"
-            f"Текущий статус заявки: {status_name_escaped}\n"
-            f"1\\) PUBG ID: {answers_escaped[0]}\n"
-            f"2\\) Возраст: {answers_escaped[1]}\n"
-            f"3\\) Режимы игры: {answers_escaped[2]}\n"
-            f"4\\) Активность: {answers_escaped[3]}\n"
-            f"5\\) О себе: {answers_escaped[4]}\n"
-        )
-        logger.debug(
-            (
-                f"Форматирование заявки для {application.id=} прошло успешно, "
-                f"возвращаем message={message}"
-            ),
-        )
-
-        return message
-
-    def _escape_markdown(self, text: str) -> str:
-        """
-        Escape special characters in text for MarkdownV2.
-
-        Args:
-            text (str): The text to escape.
-
-        Returns:
-            str: The escaped text.
-        """
-        logger.debug(f"Экранирование символов в тексте text={text} для MarkdownV2")
-        escape_chars = "_*[]()~`>#+-=|{}.!"
-        escaped_text = "".join(
-            f"\\{char}" if char in escape_chars else char for char in text
-        )
-        logger.debug(
-            (
-                f"Экранирование символов в тексте {text=} прошло успешно, "
-                f"новый text={escaped_text}"
-            ),
-        )
-        return escaped_text
+            return format_application(application)
+
+
+def format_application(application: Application) -> str:
+    """
+    Return the application as a MarkdownV2 message.
+
+    Args:
+        application (Application): The application with answers.
+
+    Returns:
+        str: Formatted application.
+    """
+    key = (application.status, application.answers.texts)
+    cached = _cache.get(application.id)
+    if cached is not None and cached[0] == key:
+        _cache.move_to_end(application.id)
+        return cached[1]
+    logger.debug("Форматирование заявки для application_id={}", application.id)
+    message = _render(application.id, application.user_id, *key)
+    _cache[application.id] = (key, message)
+    _cache.move_to_end(application.id)
+    if len(_cache) > CACHE_SIZE:
+        _cache.popitem(last=False)
+    return message
+
+
+def escape_markdown(text: str) -> str:
+    """
+    Escape special characters in text for MarkdownV2.
+
+    Args:
+        text (str): The text to escape.
+
+    Returns:
+        str: The escaped text.
+    """
+    # Faster than `str.translate` for Cyrillic text, which has no fast path
+    # for non-ASCII strings, and a character that is absent costs one scan.
+    for char in _MARKDOWN_SPECIAL_CHARS:
+        if char in text:
+            text = text.replace(char, f"\\{char}")
+    return text
+
+
+def _render(
+    application_id: int,
+    user_id: int,
+    status: ApplicationStatusEnum,
+    texts: tuple[str | None, ...],
+) -> str:
+    """Build the message of the application."""
+    pubg_id, age, game_modes, activity, about = (
+        escape_markdown(text or "") for text in texts
+    )
+    user_display = f"[ID{user_id}](tg://user?id={user_id})"
+    return (
+        f"ЗАЯВКА №{application_id} от пользователя {user_display}:\n\n"
+        f"Текущий статус заявки: {escape_markdown(status)}\n"
+        f"1\\) PUBG ID: {pubg_id}\n"
+        f"2\\) Возраст: {age}\n"
+        f"3\\) Режимы игры: {game_modes}\n"
+        f"4\\) Активность: {activity}\n"
+        f"5\\) О себе: {about}\n"
+    )
@@ -0,0 +1,40 @@
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.application.exceptions import ApplicationDoesNotExistError
+from app.domain.application.value_objects import ApplicationStatusEnum
+
+
+class ApplicationJoinRequestService:
+    """Responsible for deciding on requests to join the clan chat."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+
+    @measure_service
+    async def execute(self, user_id: int) -> bool:
+        """
+        Execute the service.
+
+        Args:
+            user_id (int): Telegram ID of the user.
+
+        Returns:
+            bool: True if the last application of the user is accepted and
+            the user is not banned.
+        """
+        async with self._uow(read_only=True):
+            try:
+                last = await self._uow.application.retrieve_last_status_and_ban(user_id)
+            except ApplicationDoesNotExistError:
+                return False
+        status, is_banned = last
+        return status == ApplicationStatusEnum.ACCEPTED and not is_banned
@@ -0,0 +1,49 @@
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+
+
+class ApplicationMessagesService:
+    """Responsible for remembering the messages showing an application to admins."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+
+    @measure_service
+    async def execute(
+        self,
+        application_id: int,
+        admin_chat_message_id: int | None = None,
+        review_message_id: int | None = None,
+    ) -> None:
+        """
+        Execute the service.
+
+        Args:
+            application_id (int): The application id.
+            admin_chat_message_id (int | None): ID of the post in the admin
+            chat, None keeps the current one.
+            review_message_id (int | None): ID of the review message in the
+            private chat of the admin, None keeps the current one.
+
+        Raises:
+            ApplicationDoesNotExistError: If the application does not exist.
+
+        Returns:
+            None
+        """
+        async with self._uow():
+            await self._uow.application.set_messages(
+                application_id,
+                admin_chat_message_id,
+                review_message_id,
+            )
+            await self._uow.commit()
@@ -0,0 +1,60 @@
+from datetime import timedelta
+
+from app.domain.application.entities import Application
+
+CONTACT_MESSAGE = (
+    "Если у вас есть какие-то вопросы или предложения по улучшению, "
+    "напишите @RBFManager"
+)
+
+
+def accepted_messages(
+    application: Application,
+    join_link: str | None = None,
+) -> list[str]:
+    """
+    Return messages to the user about the accepted application.
+
+    Args:
+        application (Application): The accepted application.
+        join_link (str | None): The join request link of the clan chat, sent
+        instead of the personal link of the application.
+
+    Returns:
+        list[str]: Texts of the messages in the order to send them.
+    """
+    if join_link:
+        acceptance = (
+            f"Ваша заявка принята!\n"
+            f"Подайте заявку на вступление в чат по ссылке: {join_link}"
+        )
+    else:
+        acceptance = (
+            f"Ваша заявка принята!\n"
+            f"Ваша персональная ссылка: {application.invite_link}"
+        )
+    return [acceptance, CONTACT_MESSAGE]
+
+
+def rejected_messages(application: Application) -> list[str]:
+    """
+    Return messages to the user about the rejected application.
+
+    Args:
+        application (Application): The rejected application.
+
+    Returns:
+        list[str]: Texts of the messages in the order to send them.
+    """
+    retry_date = (timedelta(days=30) + application.decision_date).strftime(  # type: ignore[reportOperatorIssue]
+        "%d.%m.%Y %H:%M %Z",
+    )
+    if application.rejection_reason:
+        rejection = (
+            "Ваша заявка отклонена.\n"
+            f"Причина отказа: {application.rejection_reason}.\n"
+            f"Попробуйте снова {retry_date} (UTC+0)."
+        )
+    else:
+        rejection = f"Ваша заявка отклонена.\nПопробуйте снова {retry_date} (UTC+0)."
+    return [rejection, CONTACT_MESSAGE]
@@ -1,3 +1,4 @@
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 
 
@@ -16,6 +17,7 @@ class ApplicationOverviewService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, user_id: int) -> str:
         """
         Execute the application overview service.
@@ -29,7 +31,7 @@ class ApplicationOverviewService:
         Returns:
             str: The application overview.
         """
-        async with self._uow():
+        async with self._uow(read_only=True):
             user_application = await self._uow.application.retrieve_last(user_id)
         answers = user_application.answers
         overview_parts = []
@@ -1,10 +1,8 @@
 from loguru import logger
 
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
-from app.domain.application.exceptions import (
-    ApplicationAnswerAlreadyExistError,
-    ApplicationDoesNotExistError,
-)
+from app.domain.application.exceptions import ApplicationDoesNotExistError
 from app.domain.application_answers.dto import AnswerDTO
 from app.domain.application_answers.entities import ApplicationAnswer
 from app.services.applications.dto import (
@@ -29,6 +27,7 @@ class ApplicationResponseService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(
         self,
         data: ApplicationResponseInputDTO,
@@ -47,7 +46,7 @@ class ApplicationResponseService:
         """
         async with self._uow():
             try:
-                user_application = await self._uow.application.retrieve_last(
+                application_id = await self._uow.application.retrieve_last_id(
                     data.user_id,
                 )
             except ApplicationDoesNotExistError as e:
@@ -55,20 +54,15 @@ class ApplicationResponseService:
                 raise
             answer_dto = AnswerDTO(
                 **data.model_dump(),
-                application_id=user_application.id,
+                application_id=application_id,
             )
             answer = ApplicationAnswer(answer_dto)
-            try:
-                user_application.add_new_answer(answer)
-                await self._uow.application_answer.add_answer(answer)
-                await self._uow.commit()
-                return ApplicationResponseOutputStatusDTO(
-                    status=ApplicationResponseStatusEnum.NEW,
-                )
-            except ApplicationAnswerAlreadyExistError:
-                user_application.update_answer(answer)
-                await self._uow.application_answer.update_answer(answer)
-                await self._uow.commit()
-                return ApplicationResponseOutputStatusDTO(
-                    status=ApplicationResponseStatusEnum.UPDATE,
-                )
+            is_new = await self._uow.application_answer.upsert_answer(answer)
+            await self._uow.commit()
+        return ApplicationResponseOutputStatusDTO(
+            status=(
+                ApplicationResponseStatusEnum.NEW
+                if is_new
+                else ApplicationResponseStatusEnum.UPDATE
+            ),
+        )
@@ -1,3 +1,4 @@
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.application.entities import Application
 
@@ -17,6 +18,7 @@ class ApplicationRetrieveService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, user_id: int) -> Application:
         """
         Execute the service.
@@ -30,5 +32,5 @@ class ApplicationRetrieveService:
         Returns:
             Application: Retrieved application.
         """
-        async with self._uow():
+        async with self._uow(read_only=True):
             return await self._uow.application.retrieve_last(user_id)
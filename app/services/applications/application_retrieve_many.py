@@ -0,0 +1,36 @@
+from collections.abc import Sequence
+
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.application.entities import Application
+
+
+class ApplicationRetrieveManyService:
+    """Responsible for retrieving last applications of several users."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+
+    @measure_service
+    async def execute(self, user_ids: Sequence[int]) -> dict[int, Application]:
+        """
+        Execute the service.
+
+        Args:
+            user_ids (Sequence[int]): Telegram IDs of the users.
+
+        Returns:
+            dict[int, Application]: Last applications without answers by
+            user id, users without applications are missing.
+        """
+        async with self._uow(read_only=True):
+            return await self._uow.application.retrieve_last_many(user_ids)
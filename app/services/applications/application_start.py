@@ -1,6 +1,7 @@
 import datetime as dt
 from datetime import datetime, timedelta
 
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.application.entities import Application
 from app.domain.application.exceptions import (
@@ -12,6 +13,7 @@ from app.domain.application.exceptions import (
     ApplicationWrongStatusError,
 )
 from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.user.entities import User
 from app.domain.user.exceptions import UserIsBannedError
 
 
@@ -34,7 +36,7 @@ class ApplicationStartService:
         """
         self._uow = uow
 
-    # TODO: Refactor this into small private methods
+    @measure_service
     async def execute(self, user_id: int) -> Application:
         """
         Execute the application start service.
@@ -44,6 +46,7 @@ class ApplicationStartService:
 
         Raises:
             UserNotFoundError: If the user is not found.
+            UserIsBannedError: If the user is banned.
             ApplicationAtWaitingStatusError: If the application is in 'WAITING' status.
             ApplicationAlreadyAcceptedError: If the application is in 'ACCEPTED' status.
             ApplicationDecisionDateNotFoundError: If the application decision date
@@ -56,39 +59,72 @@ class ApplicationStartService:
         """
         async with self._uow():
             user = await self._uow.user.retrieve(user_id)
-            if user.is_banned:
-                raise UserIsBannedError
-            try:
-                application = await self._uow.application.retrieve_last(
-                    user_id,
-                )
-            except ApplicationDoesNotExistError:
-                application = await self._uow.application.create(user_id)
-                await self._uow.commit()
-                return application
-            if application.status == ApplicationStatusEnum.IN_PROGRESS:
-                application.clear()
-                await self._uow.application.delete_answers(
-                    application.id,
-                )
-                await self._uow.commit()
-                return application
-            if application.status in (
-                ApplicationStatusEnum.WAITING,
-                ApplicationStatusEnum.PROCESSING,
-            ):
-                raise ApplicationAtWaitingStatusError
-            if application.status == ApplicationStatusEnum.ACCEPTED:
-                raise ApplicationAlreadyAcceptedError
-            if application.status == ApplicationStatusEnum.REJECTED:
-                now = datetime.now(tz=dt.UTC)
-                if application.decision_date is None:
-                    raise ApplicationDecisionDateNotFoundError
-                if now - application.decision_date >= timedelta(days=30):
-                    application = await self._uow.application.create(user_id)
-                    await self._uow.commit()
-                    return application
-                raise ApplicationCoolDownError(
-                    application.decision_date + timedelta(30),
-                )
-            raise ApplicationWrongStatusError
+            return await self.start(user)
+
+    async def start(self, user: User) -> Application:
+        """
+        Start the application for an already loaded user.
+
+        Must be called inside an entered unit of work. Commits the unit of work
+        if a new application is created or the current one is cleared.
+
+        Args:
+            user (User): The user.
+
+        Raises:
+            UserIsBannedError: If the user is banned.
+            ApplicationAtWaitingStatusError: If the application is in 'WAITING' status.
+            ApplicationAlreadyAcceptedError: If the application is in 'ACCEPTED' status.
+            ApplicationDecisionDateNotFoundError: If the application decision date
+            is not found.
+            ApplicationCoolDownError: If the application rejected less than 30 days ago.
+            ApplicationWrongStatusError: If the application status is wrong.
+
+        Returns:
+            Application: The application.
+        """
+        if user.is_banned:
+            raise UserIsBannedError
+        try:
+            application = await self._uow.application.retrieve_last(
+                user.id,
+                with_answers=False,
+            )
+        except ApplicationDoesNotExistError:
+            return await self._create(user.id)
+        if application.status == ApplicationStatusEnum.IN_PROGRESS:
+            return await self._clear(application)
+        if application.status in (
+            ApplicationStatusEnum.WAITING,
+            ApplicationStatusEnum.PROCESSING,
+        ):
+            raise ApplicationAtWaitingStatusError
+        if application.status == ApplicationStatusEnum.ACCEPTED:
+            raise ApplicationAlreadyAcceptedError
+        if application.status == ApplicationStatusEnum.REJECTED:
+            self._check_cooldown(application)
+            return await self._create(user.id)
+        raise ApplicationWrongStatusError
+
+    async def _create(self, user_id: int) -> Application:
+        """Create a new application and commit it."""
+        application = await self._uow.application.create(user_id)
+        await self._uow.commit()
+        return application
+
+    async def _clear(self, application: Application) -> Application:
+        """Remove all answers of the application and commit it."""
+        application.clear()
+        await self._uow.application.delete_answers(application.id)
+        await self._uow.commit()
+        return application
+
+    def _check_cooldown(self, application: Application) -> None:
+        """Check that a new application can be filled after the rejected one."""
+        if application.decision_date is None:
+            raise ApplicationDecisionDateNotFoundError
+        now = datetime.now(tz=dt.UTC)
+        if now - application.decision_date < timedelta(days=30):
+            raise ApplicationCoolDownError(
+                application.decision_date + timedelta(30),
+            )
@@ -0,0 +1,32 @@
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.application.value_objects import ApplicationStatusEnum
+
+
+class ApplicationStatusCountService:
+    """Responsible for counting applications by status."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+
+    @measure_service
+    async def execute(self) -> dict[ApplicationStatusEnum, int]:
+        """
+        Execute the service.
+
+        Returns:
+            dict[ApplicationStatusEnum, int]: The number of applications of
+            every status, including statuses without applications.
+        """
+        async with self._uow(read_only=True):
+            counts = await self._uow.application.count_by_status()
+        return {status: counts.get(status, 0) for status in ApplicationStatusEnum}
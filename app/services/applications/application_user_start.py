@@ -0,0 +1,59 @@
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.application.entities import Application
+from app.domain.application.exceptions import BaseApplicationError
+from app.domain.user.dto import UserDTO
+from app.domain.user.entities import User
+from app.domain.user.exceptions import BaseUserError
+from app.services.applications.application_start import ApplicationStartService
+from app.services.users.dto import UserCreateDTO
+
+
+class UserApplicationStartService:
+    """
+    Responsible for the /start command.
+
+    Registers the user and starts the application in a single unit of work.
+    """
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+        self._start_service = ApplicationStartService(uow)
+
+    @measure_service
+    async def execute(self, data: UserCreateDTO) -> Application:
+        """
+        Ensure that the user exists and start the application.
+
+        Args:
+            data (UserCreateDTO): The data of the user.
+
+        Raises:
+            UserIsBannedError: If the user is banned.
+            ApplicationAtWaitingStatusError: If the application is in 'WAITING' status.
+            ApplicationAlreadyAcceptedError: If the application is in 'ACCEPTED' status.
+            ApplicationDecisionDateNotFoundError: If the application decision date
+            is not found.
+            ApplicationCoolDownError: If the application rejected less than 30 days ago.
+            ApplicationWrongStatusError: If the application status is wrong.
+
+        Returns:
+            Application: The application.
+        """
+        async with self._uow():
+            user = await self._uow.user.upsert(User(data=UserDTO(**data.model_dump())))
+            try:
+                return await self._start_service.start(user)
+            except (BaseUserError, BaseApplicationError):
+                # Keep the refreshed profile data even if the start is refused.
+                await self._uow.commit()
+                raise
@@ -0,0 +1,130 @@
+import asyncio
+
+from loguru import logger
+from telegram import error
+from telegram.ext import ExtBot
+
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.broadcast.entities import Broadcast
+from app.domain.broadcast.value_objects import DeliveryStatusEnum
+from app.infra.messaging.rate_limiter import Priority
+
+
+class BroadcastSendService:
+    """
+    Responsible for sending a broadcast to its recipients.
+
+    Recipients are read by one streaming query and sent in batches by
+    `workers` concurrent senders. Messages have `Priority.BULK`, so the rate
+    limiter lets answers to users and admins go first. The progress is saved
+    by a separate unit of work after every batch, a restarted broadcast sends
+    the unfinished batch again and continues after it.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        uow: UnitOfWork,
+        progress_uow: UnitOfWork,
+        bot: ExtBot,
+        workers: int,
+        batch_size: int,
+    ) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work reading the recipients.
+            progress_uow (UnitOfWork): The unit of work saving the progress.
+            bot (ExtBot): The bot.
+            workers (int): Messages sent at the same time.
+            batch_size (int): Recipients between progress saves.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+        self._progress_uow = progress_uow
+        self._bot = bot
+        self._workers = asyncio.Semaphore(workers)
+        self._batch_size = batch_size
+
+    @measure_service
+    async def execute(self, broadcast: Broadcast) -> Broadcast:
+        """
+        Execute the service.
+
+        Args:
+            broadcast (Broadcast): The unfinished broadcast.
+
+        Raises:
+            BroadcastAlreadyFinishedError: If the broadcast is finished.
+
+        Returns:
+            Broadcast: The finished broadcast with delivery counts.
+        """
+        logger.info(
+            f"Рассылка {broadcast.id} ({broadcast.audience}) "
+            f"продолжается после пользователя {broadcast.last_user_id}",
+        )
+        async with self._uow():
+            batches = self._uow.broadcast.iter_recipients(
+                broadcast,
+                self._batch_size,
+            )
+            async for batch in batches:
+                statuses = await asyncio.gather(
+                    *(self._send(broadcast, user_id) for user_id in batch),
+                )
+                for user_id, status in zip(batch, statuses, strict=True):
+                    broadcast.record(user_id, status)
+                await self._save(broadcast)
+        broadcast.finish()
+        await self._save(broadcast)
+        logger.info(
+            f"Рассылка {broadcast.id} завершена: доставлено {broadcast.delivered}, "
+            f"не доставлено {broadcast.failed}, заблокировали {broadcast.blocked}",
+        )
+        return broadcast
+
+    async def _send(self, broadcast: Broadcast, user_id: int) -> DeliveryStatusEnum:
+        """
+        Send the message to the user.
+
+        Args:
+            broadcast (Broadcast): The broadcast.
+            user_id (int): Telegram ID of the user.
+
+        Returns:
+            DeliveryStatusEnum: The result.
+        """
+        async with self._workers:
+            try:
+                await self._bot.send_message(
+                    chat_id=user_id,
+                    text=broadcast.message,
+                    rate_limit_args=Priority.BULK,
+                )
+            except error.Forbidden:
+                return DeliveryStatusEnum.BLOCKED
+            except error.TelegramError as e:
+                logger.warning(
+                    f"Рассылка {broadcast.id}: не удалось отправить "
+                    f"пользователю {user_id}: {e}",
+                )
+                return DeliveryStatusEnum.FAILED
+        return DeliveryStatusEnum.DELIVERED
+
+    async def _save(self, broadcast: Broadcast) -> None:
+        """
+        Commit the progress of the broadcast.
+
+        Args:
+            broadcast (Broadcast): The broadcast.
+
+        Returns:
+            None
+        """
+        async with self._progress_uow():
+            await self._progress_uow.broadcast.update(broadcast)
+            await self._progress_uow.commit()
@@ -0,0 +1,43 @@
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.broadcast.entities import Broadcast
+from app.domain.broadcast.value_objects import BroadcastAudienceEnum
+
+
+class BroadcastStartService:
+    """Responsible for creating a broadcast."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+
+    @measure_service
+    async def execute(
+        self,
+        admin_id: int,
+        audience: BroadcastAudienceEnum,
+        message: str,
+    ) -> Broadcast:
+        """
+        Execute the service.
+
+        Args:
+            admin_id (int): Telegram ID of the admin.
+            audience (BroadcastAudienceEnum): The recipients.
+            message (str): The message.
+
+        Returns:
+            Broadcast: The created broadcast, nothing is sent yet.
+        """
+        async with self._uow():
+            broadcast = await self._uow.broadcast.create(admin_id, audience, message)
+            await self._uow.commit()
+        return broadcast
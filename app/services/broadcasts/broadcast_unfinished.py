@@ -0,0 +1,30 @@
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.broadcast.entities import Broadcast
+
+
+class BroadcastUnfinishedService:
+    """Responsible for finding broadcasts to resume."""
+
+    def __init__(self, uow: UnitOfWork) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+
+    @measure_service
+    async def execute(self) -> list[Broadcast]:
+        """
+        Execute the service.
+
+        Returns:
+            list[Broadcast]: Unfinished broadcasts in order of creation.
+        """
+        async with self._uow(read_only=True):
+            return await self._uow.broadcast.list_unfinished()
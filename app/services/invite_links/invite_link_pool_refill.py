@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta, timezone
+
+from loguru import logger
+from telegram import error
+from telegram.ext import ExtBot
+
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+
+
+class InviteLinkPoolRefillService:
+    """
+    Responsible for keeping the pool of invite links full.
+
+    Links are single-use links to the clan chat. Links unused for longer than
+    `max_age` are removed from the pool and revoked, then the pool is filled
+    up to `size` again.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        uow: UnitOfWork,
+        bot: ExtBot,
+        chat_id: int,
+        size: int,
+        max_age: timedelta,
+    ) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+            bot (ExtBot): The bot.
+            chat_id (int): Telegram ID of the clan chat.
+            size (int): The number of links to keep.
+            max_age (timedelta): Age of a link when it is replaced.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+        self._bot = bot
+        self._chat_id = chat_id
+        self._size = size
+        self._max_age = max_age
+
+    @measure_service
+    async def execute(self) -> int:
+        """
+        Execute the service.
+
+        Returns:
+            int: The number of links in the pool.
+        """
+        fresh_after = datetime.now(tz=timezone.utc) - self._max_age
+        async with self._uow():
+            stale = await self._uow.invite_link.remove_stale(fresh_after)
+            available = await self._uow.invite_link.count()
+            await self._uow.commit()
+        for link in stale:
+            await self._revoke(link)
+        links = await self._create(self._size - available)
+        async with self._uow():
+            await self._uow.invite_link.add(links)
+            await self._uow.commit()
+        if stale or links:
+            logger.debug(
+                "Пул ссылок: отозвано {}, создано {}",
+                len(stale),
+                len(links),
+            )
+        return available + len(links)
+
+    async def _revoke(self, link: str) -> None:
+        """
+        Revoke the invite link, a failure is only logged.
+
+        Args:
+            link (str): The invite link.
+
+        Returns:
+            None
+        """
+        try:
+            await self._bot.revoke_chat_invite_link(self._chat_id, link)
+        except error.TelegramError as e:
+            logger.warning(f"Не удалось отозвать ссылку из пула {link}: {e}")
+
+    async def _create(self, count: int) -> list[str]:
+        """
+        Create single-use invite links, stop at the first failure.
+
+        Args:
+            count (int): The number of links to create.
+
+        Returns:
+            list[str]: The created links.
+        """
+        links: list[str] = []
+        for _ in range(count):
+            try:
+                link = await self._bot.create_chat_invite_link(
+                    self._chat_id,
+                    member_limit=1,
+                )
+            except error.TelegramError as e:
+                logger.warning(f"Не удалось создать ссылку для пула: {e}")
+                break
+            links.append(link.invite_link)
+        return links
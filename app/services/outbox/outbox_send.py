@@ -0,0 +1,178 @@
+import asyncio
+from collections.abc import Sequence
+from datetime import timedelta
+from typing import NamedTuple
+
+from loguru import logger
+from telegram import error
+from telegram.ext import ExtBot
+
+from app.core.metrics import measure_service
+from app.db.engine import UnitOfWork
+from app.domain.outbox.entities import OutboxMessage
+
+
+class _ChatResult(NamedTuple):
+    """What happened to the messages of one chat."""
+
+    sent: list[int]
+    retried: list[tuple[OutboxMessage, timedelta]]
+    failed: list[int]
+
+
+class OutboxSendService:
+    """
+    Responsible for sending a batch of outbox messages.
+
+    Chats are claimed with all their pending messages, so no other worker
+    sends to a chat while this one does. Messages to one chat are sent one by
+    one in the order they were written, different chats are sent
+    concurrently. A failed message is retried after `retry_delay`, doubled
+    with every attempt, and the later messages to its chat, written before or
+    after, wait for it. After `max_attempts`, or if the user blocked the bot,
+    the message is marked as failed. The lease of the batch is renewed every
+    half of it until the batch is sent, so a slow batch is not sent twice.
+    """
+
+    def __init__(  # noqa: PLR0913
+        self,
+        uow: UnitOfWork,
+        bot: ExtBot,
+        batch_size: int,
+        max_attempts: int,
+        retry_delay: timedelta,
+        lease: timedelta,
+    ) -> None:
+        """
+        Initialize the service instance.
+
+        Args:
+            uow (UnitOfWork): The unit of work instance.
+            bot (ExtBot): The bot.
+            batch_size (int): Chats claimed at once.
+            max_attempts (int): Attempts to send a message.
+            retry_delay (timedelta): Delay before the first retry.
+            lease (timedelta): Time other workers may not claim the messages
+            of a worker that stopped.
+
+        Returns:
+            None
+        """
+        self._uow = uow
+        self._bot = bot
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._lease = lease
+
+    @measure_service
+    async def execute(self) -> int:
+        """
+        Execute the service.
+
+        Returns:
+            int: The number of claimed messages, 0 if none are due.
+        """
+        async with self._uow():
+            messages = await self._uow.outbox.claim(self._batch_size, self._lease)
+            await self._uow.commit()
+        if not messages:
+            return 0
+        chats: dict[int, list[OutboxMessage]] = {}
+        for message in messages:
+            chats.setdefault(message.chat_id, []).append(message)
+        sent_all = asyncio.Event()
+        keep_leased = asyncio.create_task(
+            self._keep_leased([message.id for message in messages], sent_all),
+        )
+        try:
+            results = await asyncio.gather(
+                *(self._send_chat(chat_messages) for chat_messages in chats.values()),
+            )
+        finally:
+            # Not cancelled, so a renewal in progress ends with its transaction.
+            sent_all.set()
+            await keep_leased
+        sent = [message_id for result in results for message_id in result.sent]
+        retried = [item for result in results for item in result.retried]
+        failed = [message_id for result in results for message_id in result.failed]
+        async with self._uow():
+            await self._uow.outbox.delete(sent)
+            await self._uow.outbox.reschedule(
+                [message for message, _ in retried],
+                [delay for _, delay in retried],
+            )
+            await self._uow.outbox.fail(failed)
+            await self._uow.commit()
+        logger.debug(
+            "Outbox: отправлено {}, отложено {}, не доставлено {}",
+            len(sent),
+            len(retried),
+            len(failed),
+        )
+        return len(messages)
+
+    async def _keep_leased(
+        self,
+        message_ids: Sequence[int],
+        sent_all: asyncio.Event,
+    ) -> None:
+        """
+        Renew the lease of the claimed messages every half of it.
+
+        Args:
+            message_ids (Sequence[int]): IDs of the claimed messages.
+            sent_all (asyncio.Event): Set when the batch is sent.
+
+        Returns:
+            None
+        """
+        interval = self._lease.total_seconds() / 2
+        while not sent_all.is_set():
+            try:
+                await asyncio.wait_for(sent_all.wait(), interval)
+            except TimeoutError:  # noqa: PERF203
+                async with self._uow():
+                    await self._uow.outbox.extend_lease(message_ids, self._lease)
+                    await self._uow.commit()
+
+    async def _send_chat(self, messages: list[OutboxMessage]) -> _ChatResult:
+        """
+        Send the messages of one chat in order.
+
+        Args:
+            messages (list[OutboxMessage]): The messages of the chat.
+
+        Returns:
+            _ChatResult: What happened to every message.
+        """
+        result = _ChatResult([], [], [])
+        for index, message in enumerate(messages):
+            try:
+                await self._bot.send_message(
+                    chat_id=message.chat_id,
+                    text=message.message,
+                )
+            except error.Forbidden:  # noqa: PERF203
+                logger.warning(f"Пользователь {message.chat_id} заблокировал бота")
+                result.failed.extend(later.id for later in messages[index:])
+                break
+            except error.TelegramError as e:
+                message.attempts += 1
+                if message.attempts >= self._max_attempts:
+                    logger.error(
+                        f"Сообщение {message.id} не отправлено "
+                        f"после {message.attempts} попыток: {e}",
+                    )
+                    result.failed.append(message.id)
+                    continue
+                delay = self._retry_delay * 2 ** (message.attempts - 1)
+                logger.warning(
+                    f"Сообщение {message.id} будет отправлено повторно "
+                    f"через {delay}: {e}",
+                )
+                result.retried.extend((later, delay) for later in messages[index:])
+                break
+            else:
+                result.sent.append(message.id)
+        return result
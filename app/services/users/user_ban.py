@@ -1,3 +1,4 @@
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.user.entities import User
 
@@ -17,6 +18,7 @@ class UserBanService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, user_id: int) -> User:
         """
         Execute the service.
@@ -1,7 +1,7 @@
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.user.dto import UserDTO
 from app.domain.user.entities import User
-from app.domain.user.exceptions import UserNotFoundError
 from app.services.users.dto import UserCreateDTO
 
 
@@ -20,30 +20,19 @@ class EnsureUserExistsService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, data: UserCreateDTO) -> User:
         """
-        Ensure that the user exists.
+        Ensure that the user exists and its profile data is up to date.
 
         Args:
             data (UserCreateDTO): The data of the user.
 
         Returns:
-            User: The retrieved or created user.
+            User: The created or updated user.
         """
-        try:
-            user = await self._get_user(data.id)
-        except UserNotFoundError:
-            user_dto = UserDTO(**data.model_dump())
-            user = await self._create_user(user_dto)
-        return user
-
-    async def _get_user(self, user_id: int) -> User:
-        async with self._uow():
-            return await self._uow.user.retrieve(user_id)
-
-    async def _create_user(self, data: UserDTO) -> User:
         async with self._uow():
-            user = User(data=data)
-            user = await self._uow.user.create(user)
+            user = User(data=UserDTO(**data.model_dump()))
+            user = await self._uow.user.upsert(user)
             await self._uow.commit()
         return user
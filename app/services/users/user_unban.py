@@ -1,3 +1,4 @@
+from app.core.metrics import measure_service
 from app.db.engine import UnitOfWork
 from app.domain.user.entities import User
 from app.domain.user.exceptions import UserNotFoundError
@@ -18,6 +19,7 @@ class UserUnbanService:
         """
         self._uow = uow
 
+    @measure_service
     async def execute(self, user_id: int) -> User:
         """
         Execute the service.
@@ -0,0 +1,179 @@
+"""
+Measure wall time of the admin decision handlers.
+
+Every application is taken by its own admin, then accepted or rejected by
+calling the handler directly. The Bot API is answered in-process after
+`--api-latency` seconds, so the time shows how many round trips a handler
+waits for one after another.
+
+Usage:
+    python -m benchmarks.admin_decision --applications 50 --api-latency 0.05
+"""
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from telegram import CallbackQuery, Chat, Message, User
+from telegram.ext import ExtBot
+
+from app.handlers.admins.applications.accept import accept_application
+from app.handlers.admins.applications.reject import reject_reason_hander
+from benchmarks import utils
+from tests.utils import BotApiRequest
+
+SERIES = "generate_series(1, CAST(:count AS integer)) AS g"
+
+
+async def _seed(engine: AsyncEngine, count: int) -> None:
+    """
+    Insert `count` applications, each taken by its own admin.
+
+    Admin `count + i` processes application `i` of user `i`, the admin chat
+    post and the review message of the application have ID `i`.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+        count (int): The number of applications.
+
+    Returns:
+        None
+    """
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, username, first_name, is_banned) "
+                "SELECT g, 'user' || g, 'name', false "
+                "FROM generate_series(1, 2 * CAST(:count AS integer)) AS g",
+            ),
+            {"count": count},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO applications "
+                "(id, user_id, status, admin_chat_message_id, review_message_id) "
+                f"SELECT g, g, 'PROCESSING', g, g FROM {SERIES}",
+            ),
+            {"count": count},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO application_answers "
+                "(application_id, question_number, answer_text) "
+                f"SELECT g, q, 'answer' FROM {SERIES} "
+                "CROSS JOIN generate_series(1, 5) AS q",
+            ),
+            {"count": count},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO admin_processing_applications (admin_id, application_id) "
+                f"SELECT CAST(:count AS integer) + g, g FROM {SERIES}",
+            ),
+            {"count": count},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO invite_links (link) "
+                f"SELECT 'https://t.me/+link' || g FROM {SERIES}",
+            ),
+            {"count": count},
+        )
+
+
+def _objects(
+    bot: ExtBot,
+    admin_id: int,
+    application_id: int,
+) -> tuple[Chat, User, Message]:
+    """Return the private chat, the admin and the review message bound to the bot."""
+    chat = Chat(id=admin_id, type=Chat.PRIVATE)
+    admin = User(id=admin_id, first_name="admin", is_bot=False)
+    message = Message(
+        message_id=application_id,
+        date=datetime.now(tz=timezone.utc),
+        chat=chat,
+        from_user=admin,
+        text="reason",
+    )
+    for telegram_object in (chat, admin, message):
+        telegram_object.set_bot(bot)
+    return chat, admin, message
+
+
+async def _accept(engine: AsyncEngine, bot: ExtBot, admin_id: int, i: int) -> None:
+    """Accept application `i` with the accept handler."""
+    chat, admin, message = _objects(bot, admin_id, i)
+    callback = CallbackQuery(
+        id=str(i),
+        from_user=admin,
+        chat_instance="instance",
+        message=message,
+        data=f"application_accept:{i}",
+    )
+    callback.set_bot(bot)
+    context = SimpleNamespace(bot=bot, application=SimpleNamespace(bot=bot))
+    await accept_application.__wrapped__(  # type: ignore[attr-defined]
+        callback=callback,
+        chat=chat,
+        context=context,
+        uow=utils.BenchUnitOfWork(engine),
+    )
+
+
+async def _reject(engine: AsyncEngine, bot: ExtBot, admin_id: int, i: int) -> None:
+    """Reject application `i` with the reject reason handler."""
+    chat, _, message = _objects(bot, admin_id, i)
+    context = SimpleNamespace(
+        bot=bot,
+        application=SimpleNamespace(bot=bot),
+        user_data={"application_id": i},
+    )
+    await reject_reason_hander.__wrapped__(  # type: ignore[attr-defined]
+        message=message,
+        chat=chat,
+        context=context,
+        uow=utils.BenchUnitOfWork(engine),
+    )
+
+
+async def main(applications: int, api_latency: float) -> None:
+    """
+    Print wall time of the accept and reject handlers.
+
+    Half of the applications are accepted, the other half is rejected.
+
+    Args:
+        applications (int): The number of applications.
+        api_latency (float): Seconds every Bot API call takes.
+
+    Returns:
+        None
+    """
+    half = applications // 2
+    async with utils.bench_database() as engine:
+        await _seed(engine, applications)
+        bot = ExtBot("1:token", request=BotApiRequest(delay=api_latency))
+        async with bot:
+            for name, handler, ids in (
+                ("accept", _accept, iter(range(1, half + 1))),
+                ("reject", _reject, iter(range(half + 1, applications + 1))),
+            ):
+
+                async def decide(handler=handler, ids=ids) -> None:  # noqa: ANN001
+                    i = next(ids)
+                    await handler(engine, bot, applications + i, i)
+
+                timings = await utils.measure(decide, half)
+                print(f"{name}: {utils.summary(timings)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=50)
+    parser.add_argument("--api-latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(main(args.applications, args.api_latency))
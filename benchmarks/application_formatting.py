@@ -0,0 +1,75 @@
+"""
+Measure formatting of applications for the admin chat.
+
+Applications with filled answers are built in memory and formatted once with
+an empty cache and then again with every application cached, like the
+repeated formatting on take, accept and reject.
+
+Usage:
+    python -m benchmarks.application_formatting --applications 10000
+"""
+
+import argparse
+import time
+
+from app.domain.application.dto import ApplicationDTO
+from app.domain.application.entities import Application
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.application_answers.entities import ApplicationAnswers
+from app.services.applications import application_formatting
+
+ANSWERS = {
+    1: "5123456789",
+    2: "23",
+    3: "Классика (TPP), арена - иногда!",
+    4: "3-4 часа в день, по выходным больше.",
+    5: "Играю с 2018 года, ищу активный клан [RU] для турниров и общения :)",
+}
+
+
+def _applications(count: int) -> list[Application]:
+    """Return applications in review with the same answers."""
+    return [
+        Application(
+            ApplicationDTO(
+                id=application_id,
+                user_id=application_id,
+                status=ApplicationStatusEnum.PROCESSING,
+            ),
+            ApplicationAnswers(application_id, ANSWERS),
+        )
+        for application_id in range(1, count + 1)
+    ]
+
+
+def _format_all(applications: list[Application]) -> float:
+    """Format every application and return the time in milliseconds."""
+    start = time.perf_counter()
+    for application in applications:
+        application_formatting.format_application(application)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(count: int) -> None:
+    """
+    Print the time to format the applications without and with the cache.
+
+    Args:
+        count (int): The number of applications.
+
+    Returns:
+        None
+    """
+    application_formatting.CACHE_SIZE = count
+    application_formatting._cache.clear()  # noqa: SLF001
+    applications = _applications(count)
+    cold = _format_all(applications)
+    warm = _format_all(applications)
+    print(f"{count} applications: render={cold:.1f}ms cached={warm:.1f}ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--applications", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.applications)
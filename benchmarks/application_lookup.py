@@ -0,0 +1,144 @@
+"""
+Measure `retrieve_last`/`get_by_id` latency while the applications table grows.
+
+Usage:
+    python -m benchmarks.application_lookup --sizes 100000 1000000
+"""
+
+import argparse
+import asyncio
+import random
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.db.repositories import ApplicationRepository
+from benchmarks import utils
+
+APPLICATIONS_PER_USER = 4
+STATUSES = "ARRAY['ACCEPTED', 'REJECTED', 'WAITING', 'IN_PROGRESS']"
+SERIES = "generate_series(CAST(:first AS integer), CAST(:stop AS integer)) AS g"
+
+
+async def _seed(engine: AsyncEngine, start: int, stop: int) -> None:
+    """
+    Insert applications with ids in `(start, stop]`, their users and answers.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+        start (int): Number of already inserted applications.
+        stop (int): Total number of applications after seeding.
+
+    Returns:
+        None
+    """
+    async with engine.begin() as conn:
+        await conn.execute(
+            text(
+                "INSERT INTO users (id, username, first_name, is_banned) "
+                "SELECT g, 'user' || g, 'name', false "
+                "FROM generate_series("
+                "CAST(:first_user AS bigint), CAST(:last_user AS bigint)"
+                ") AS g",
+            ),
+            {
+                "first_user": start // APPLICATIONS_PER_USER + 1,
+                "last_user": stop // APPLICATIONS_PER_USER,
+            },
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO applications (id, user_id, status, created_at) "
+                "SELECT g, (g - 1) / CAST(:per_user AS integer) + 1, "
+                f"({STATUSES})[g % 4 + 1]::applicationstatusenum, "
+                "now() - make_interval(mins => CAST(:stop AS integer) - g) "
+                f"FROM {SERIES}",
+            ),
+            {"per_user": APPLICATIONS_PER_USER, "first": start + 1, "stop": stop},
+        )
+        await conn.execute(
+            text(
+                "INSERT INTO application_answers "
+                "(application_id, question_number, answer_text) "
+                "SELECT g, q, 'answer' "
+                f"FROM {SERIES} "
+                "CROSS JOIN generate_series(1, 5) AS q",
+            ),
+            {"first": start + 1, "stop": stop},
+        )
+        await conn.execute(
+            text(
+                "SELECT setval(pg_get_serial_sequence('applications', 'id'), :stop)",
+            ),
+            {"stop": stop},
+        )
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(text("ANALYZE users, applications, application_answers"))
+
+
+async def _bench_size(
+    session_factory: async_sessionmaker[AsyncSession],
+    size: int,
+    repeat: int,
+) -> None:
+    """
+    Print lookup latency for the current table size.
+
+    Args:
+        session_factory (async_sessionmaker[AsyncSession]): The session factory.
+        size (int): Current number of applications.
+        repeat (int): The number of lookups per method.
+
+    Returns:
+        None
+    """
+    users = size // APPLICATIONS_PER_USER
+
+    async def retrieve_last() -> None:
+        async with session_factory() as session:
+            repository = ApplicationRepository(session)
+            await repository.retrieve_last(random.randint(1, users))
+
+    async def get_by_id() -> None:
+        async with session_factory() as session:
+            repository = ApplicationRepository(session)
+            await repository.get_by_id(random.randint(1, size))
+
+    await utils.measure(retrieve_last, repeat // 10)
+    last = utils.summary(await utils.measure(retrieve_last, repeat))
+    by_id = utils.summary(await utils.measure(get_by_id, repeat))
+    print(f"{size:>10} | retrieve_last {last} | get_by_id {by_id}")
+
+
+async def main(sizes: list[int], repeat: int) -> None:
+    """
+    Grow the applications table step by step and measure lookups at each step.
+
+    Args:
+        sizes (list[int]): Table sizes to measure at.
+        repeat (int): The number of lookups per method and size.
+
+    Returns:
+        None
+    """
+    async with utils.bench_database() as engine:
+        session_factory = utils.bench_session_factory(engine)
+        seeded = 0
+        for size in sorted(sizes):
+            await _seed(engine, seeded, size)
+            seeded = size
+            await _bench_size(session_factory, size, repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes",
+        type=int,
+        nargs="+",
+        default=[100_000, 250_000, 500_000, 1_000_000],
+    )
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.sizes, args.repeat))
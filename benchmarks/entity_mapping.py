@@ -0,0 +1,130 @@
+"""
+Measure mapping of database rows to DTOs with and without pydantic validation.
+
+Rows of a filled application and of its user are read once from the benchmark
+database, then mapped with `model_validate` like the repositories did before
+and with the `RowMapper` they use now.
+
+Usage:
+    python -m benchmarks.entity_mapping --repeat 100000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable, Sequence
+
+from pydantic import BaseModel
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.db.repositories import application as application_repository
+from app.db.repositories import user as user_repository
+from app.domain.application.dto import ApplicationDTO
+from app.domain.application_answers.dto import AnswerDTO
+from app.domain.application_answers.entities import ApplicationAnswer
+from app.domain.user.dto import UserDTO
+from app.domain.user.entities import User
+from benchmarks import utils
+
+QUESTIONS = 5
+
+
+async def fetch_rows(engine: AsyncEngine) -> tuple[Sequence[Row], Sequence[Row]]:
+    """
+    Create a filled application and read its rows and the user row.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+
+    Returns:
+        tuple[Sequence[Row], Sequence[Row]]: Application rows, one per answer,
+        and the user rows.
+    """
+    uow = utils.BenchUnitOfWork(engine)
+    async with uow():
+        await uow.user.upsert(
+            User(UserDTO(id=1, username="user", first_name="name", last_name=None)),
+        )
+        application = await uow.application.create(user_id=1)
+        for question_number in range(1, QUESTIONS + 1):
+            await uow.application_answer.add_answer(
+                ApplicationAnswer(
+                    AnswerDTO(
+                        application_id=application.id,
+                        question_number=question_number,
+                        answer_text="answer " * 20,
+                    ),
+                ),
+            )
+        await uow.commit()
+    async with utils.bench_session_factory(engine)() as session:
+        application_rows = await session.execute(
+            application_repository._GET_BY_ID,  # noqa: SLF001
+            {"application_id": application.id},
+        )
+        user_rows = await session.execute(
+            user_repository._RETRIEVE,  # noqa: SLF001
+            {"user_id": 1},
+        )
+        return application_rows.all(), user_rows.all()
+
+
+def _per_row_us(
+    mapper: Callable[[Row], BaseModel],
+    rows: Sequence[Row],
+    repeat: int,
+) -> float:
+    """
+    Return the mean duration of mapping one row in microseconds.
+
+    Args:
+        mapper (Callable[[Row], BaseModel]): The mapping function.
+        rows (Sequence[Row]): The rows to map.
+        repeat (int): The number of passes over the rows.
+
+    Returns:
+        float: Microseconds per row.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for row in rows:
+            mapper(row)
+    return (time.perf_counter() - start) / (repeat * len(rows)) * 1_000_000
+
+
+async def main(repeat: int) -> None:
+    """
+    Print the per row mapping time of both approaches.
+
+    Args:
+        repeat (int): The number of passes over the rows.
+
+    Returns:
+        None
+    """
+    async with utils.bench_database() as engine:
+        application_rows, user_rows = await fetch_rows(engine)
+    cases = (
+        (
+            ApplicationDTO,
+            application_repository._to_application_dto,  # noqa: SLF001
+            application_rows,
+        ),
+        (UserDTO, user_repository._to_user_dto, user_rows),  # noqa: SLF001
+    )
+    print("dto            | validate us/row | mapper us/row")
+    for dto_type, mapper, rows in cases:
+        assert mapper(rows[0]) == dto_type.model_validate(rows[0])  # noqa: S101
+        for func in (dto_type.model_validate, mapper):
+            _per_row_us(func, rows, repeat // 10)
+        validated = _per_row_us(dto_type.model_validate, rows, repeat)
+        mapped = _per_row_us(mapper, rows, repeat)
+        print(f"{dto_type.__name__:<14} | {validated:>15.2f} | {mapped:>13.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=100000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
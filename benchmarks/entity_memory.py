@@ -0,0 +1,140 @@
+"""
+Measure memory held by application entities loaded for listings and exports.
+
+Applications with all answers are read from the benchmark database and
+turned into entities twice: with the previous layout (instance `__dict__`
+and a dict of answer entities) and with the current slotted entities and
+`ApplicationAnswers`. The rows are fetched before measuring, so only the
+entities are counted.
+
+Usage:
+    python -m benchmarks.entity_memory --size 50000
+"""
+
+import argparse
+import asyncio
+import gc
+import itertools
+import operator
+import tracemalloc
+from collections.abc import Callable, Sequence
+
+from sqlalchemy import Row
+
+from app.db.repositories import ApplicationRepository
+from app.db.repositories import application as application_repository
+from app.domain.application.dto import ApplicationDTO
+from app.domain.application_answers.dto import AnswerDTO
+from benchmarks import utils
+from benchmarks.application_lookup import _seed
+
+
+class LegacyAnswer:
+    """Answer entity as it was before slots."""
+
+    def __init__(self, data: AnswerDTO) -> None:
+        """Copy the answer data."""
+        self.application_id = data.application_id
+        self.answer_text = data.answer_text
+        self.question_number = data.question_number
+
+
+class LegacyApplication:
+    """Application entity as it was before slots."""
+
+    def __init__(self, data: ApplicationDTO, answers: dict[int, LegacyAnswer]) -> None:
+        """Copy the application data."""
+        self.id = data.id
+        self.user_id = data.user_id
+        self.status = data.status
+        self.decision_date = data.decision_date
+        self.invite_link = data.invite_link
+        self.rejection_reason = data.rejection_reason
+        self.answers = answers
+        self.admin_id = data.admin_id
+
+
+def _legacy_entity(rows: Sequence[Row]) -> LegacyApplication:
+    data = application_repository._to_application_dto(rows[0])  # noqa: SLF001
+    return LegacyApplication(
+        data,
+        {
+            row.question_number: LegacyAnswer(
+                AnswerDTO.model_construct(
+                    application_id=data.id,
+                    question_number=row.question_number,
+                    answer_text=row.answer_text,
+                ),
+            )
+            for row in rows
+            if row.question_number is not None
+        },
+    )
+
+
+def _measure(
+    build: Callable[[Sequence[Row]], object],
+    groups: list[list[Row]],
+) -> int:
+    """
+    Return the bytes still allocated by the entities built from the groups.
+
+    Args:
+        build (Callable[[Sequence[Row]], object]): Builds one entity.
+        groups (list[list[Row]]): Rows grouped by application.
+
+    Returns:
+        int: Allocated bytes.
+    """
+    gc.collect()
+    tracemalloc.start()
+    entities = [build(rows) for rows in groups]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del entities
+    return size
+
+
+async def main(size: int) -> None:
+    """
+    Print memory per application for both layouts.
+
+    Args:
+        size (int): The number of applications.
+
+    Returns:
+        None
+    """
+    async with utils.bench_database() as engine:
+        await _seed(engine, 0, size)
+        async with utils.bench_session_factory(engine)() as session:
+            rows = (
+                await session.execute(
+                    application_repository._select_with_answers(  # noqa: SLF001
+                        application_repository._table,  # noqa: SLF001
+                    ).order_by(application_repository._table.c.id),  # noqa: SLF001
+                )
+            ).all()
+            repository = ApplicationRepository(session)
+    groups = [
+        list(group) for _, group in itertools.groupby(rows, operator.itemgetter(0))
+    ]
+    builders = {
+        "dict": _legacy_entity,
+        "slots": repository._get_application_entity_from_rows,  # noqa: SLF001
+    }
+    print(f"{len(groups)} applications, {len(rows)} rows")
+    print("layout | total MiB | bytes/application")
+    for name, build in builders.items():
+        allocated = _measure(build, groups)
+        print(
+            f"{name:<6} | {allocated / 2**20:>9.1f} "
+            f"| {allocated / len(groups):>17.0f}",
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=50_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.size))
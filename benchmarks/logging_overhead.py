@@ -0,0 +1,91 @@
+"""
+Measure the time logging takes from the handler of an update.
+
+Every update logs like an answer of an applicant: one INFO record and three
+DEBUG records with values. The records are written to files in a temporary
+directory with the file sinks of the bot before and after they were queued.
+
+Usage:
+    python -m benchmarks.logging_overhead --updates 20000
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from loguru import logger
+
+from app.core.logs import setup_logging
+
+
+def _log_update(update_id: int) -> None:
+    """Log like the handler of an answer."""
+    logger.info("Получен ответ пользователя user_id={}", update_id)
+    logger.debug("Сохранение ответа на вопрос question={}", update_id % 5)
+    logger.debug("Запрашиваем ответ в чате chat_id={}.", update_id)
+    logger.debug("Сохранено: user_data={}, диалоги={}", 1, 1)
+
+
+def _sync_sinks(logs_directory: Path) -> None:
+    """Add the file sinks written by the logging thread, as before."""
+    logger.remove()
+    logger.add(
+        logs_directory / "full_log.log",
+        level="DEBUG",
+        rotation="1 day",
+        compression="zip",
+    )
+    logger.add(
+        logs_directory / "warnings_and_above.log",
+        level="WARNING",
+        rotation="10 MB",
+        compression="zip",
+    )
+
+
+def _measure(setup: Callable[[Path], None], updates: int) -> float:
+    """Return microseconds of logging per update with the sinks of `setup`."""
+    with tempfile.TemporaryDirectory() as directory:
+        setup(Path(directory))
+        start = time.perf_counter()
+        for update_id in range(updates):
+            _log_update(update_id)
+        elapsed = time.perf_counter() - start
+        # Wait for queued records outside of the measured time.
+        logger.remove()
+    return elapsed / updates * 1_000_000
+
+
+def main(updates: int) -> None:
+    """
+    Print logging time per update for every sink setup.
+
+    Args:
+        updates (int): The number of updates.
+
+    Returns:
+        None
+    """
+    setups: dict[str, Callable[[Path], None]] = {
+        "file sinks, DEBUG": _sync_sinks,
+        "queued, DEBUG": lambda path: setup_logging(path, "DEBUG", False, {}),  # noqa: FBT003
+        "queued, DEBUG, JSON": lambda path: setup_logging(path, "DEBUG", True, {}),  # noqa: FBT003
+        "queued, DEBUG sampled 1/10": lambda path: setup_logging(
+            path,
+            "DEBUG",
+            False,  # noqa: FBT003
+            {__name__: 10},
+        ),
+        "queued, INFO": lambda path: setup_logging(path, "INFO", False, {}),  # noqa: FBT003
+    }
+    for name, setup in setups.items():
+        print(f"{name:<28} {_measure(setup, updates):>7.1f} us/update")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--updates", type=int, default=20_000)
+    args = parser.parse_args()
+    main(args.updates)
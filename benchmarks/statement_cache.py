@@ -0,0 +1,173 @@
+"""
+Measure per call Python overhead of building repository statements.
+
+"inline" builds the statement on every call like the repositories did
+before, "cached" reuses the module level statement with bound parameters.
+The first table only covers the statement construction and the cache key
+lookup SQLAlchemy does before it reaches the compiled cache. The second one
+measures full `get_by_id`/`retrieve_last_id` calls against the database.
+
+Usage:
+    python -m benchmarks.statement_cache --repeat 10000
+"""
+
+import argparse
+import asyncio
+import time
+from collections.abc import Callable
+
+from sqlalchemy import BigInteger, ClauseElement, insert, literal, select, update
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import selectinload
+
+from app.db.repositories import application as application_repository
+from app.domain.application.entities import Application as ApplicationEntity
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.user.dto import UserDTO
+from app.domain.user.entities import User
+from app.models import AdminProcessingApplication, Application
+from benchmarks import utils
+
+
+def _inline_get_by_id() -> ClauseElement:
+    return (
+        select(Application)
+        .options(selectinload(Application.answers))
+        .filter_by(id=1)
+    )
+
+
+def _inline_retrieve_last_id() -> ClauseElement:
+    return (
+        select(Application.id)
+        .where(Application.user_id == 1)
+        .order_by(Application.created_at.desc())
+        .limit(1)
+    )
+
+
+def _inline_take() -> ClauseElement:
+    taken = (
+        update(Application)
+        .where(
+            Application.id == 1,
+            Application.status == ApplicationEntity.TAKEABLE_STATUS,
+        )
+        .values(status=ApplicationStatusEnum.PROCESSING)
+        .returning(*Application.__table__.columns)
+        .cte("taken")
+    )
+    assign = insert(AdminProcessingApplication).from_select(
+        ["admin_id", "application_id"],
+        select(literal(1, BigInteger), taken.c.id),
+    )
+    return select(taken).add_cte(assign.cte("assigned"))
+
+
+STATEMENTS: dict[str, tuple[Callable[[], ClauseElement], ClauseElement]] = {
+    "get_by_id": (_inline_get_by_id, application_repository._GET_BY_ID),  # noqa: SLF001
+    "retrieve_last_id": (
+        _inline_retrieve_last_id,
+        application_repository._RETRIEVE_LAST_ID,  # noqa: SLF001
+    ),
+    "take": (_inline_take, application_repository._TAKE),  # noqa: SLF001
+}
+
+
+def _per_call_us(func: Callable[[], object], repeat: int) -> float:
+    """
+    Return the mean duration of `func` in microseconds.
+
+    Args:
+        func (Callable[[], object]): The function to measure.
+        repeat (int): The number of calls.
+
+    Returns:
+        float: Microseconds per call.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1_000_000
+
+
+def bench_python(repeat: int) -> None:
+    """
+    Print statement construction and cache key overhead per call.
+
+    Args:
+        repeat (int): The number of calls per statement.
+
+    Returns:
+        None
+    """
+    print("statement        | inline us/call | cached us/call")
+    for name, (build, cached) in STATEMENTS.items():
+        inline = _per_call_us(
+            lambda build=build: build()._generate_cache_key(),  # noqa: SLF001
+            repeat,
+        )
+        reused = _per_call_us(cached._generate_cache_key, repeat)  # noqa: SLF001
+        print(f"{name:<16} | {inline:>14.1f} | {reused:>14.1f}")
+
+
+async def bench_database(engine: AsyncEngine, repeat: int) -> None:
+    """
+    Print full call latency of inline and cached statements.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+        repeat (int): The number of calls per statement.
+
+    Returns:
+        None
+    """
+    uow = utils.BenchUnitOfWork(engine)
+    async with uow():
+        await uow.user.upsert(
+            User(UserDTO(id=1, username="user", first_name="name", last_name=None)),
+        )
+        application = await uow.application.create(user_id=1)
+        await uow.commit()
+    params = {"application_id": application.id, "user_id": 1}
+    session_factory = utils.bench_session_factory(engine)
+    async with session_factory() as session:
+        for name in ("get_by_id", "retrieve_last_id"):
+            build, cached = STATEMENTS[name]
+
+            async def inline(build: Callable[[], ClauseElement] = build) -> None:
+                await session.execute(build())
+
+            async def reused(cached: ClauseElement = cached) -> None:
+                await session.execute(cached, params)
+
+            for func in (inline, reused):
+                await utils.measure(func, repeat // 10)
+            inline_timings = await utils.measure(inline, repeat)
+            cached_timings = await utils.measure(reused, repeat)
+            print(
+                f"{name:<16} | inline {utils.summary(inline_timings)} "
+                f"| cached {utils.summary(cached_timings)}",
+            )
+
+
+async def main(repeat: int) -> None:
+    """
+    Run the Python only and the database benchmarks.
+
+    Args:
+        repeat (int): The number of calls per statement.
+
+    Returns:
+        None
+    """
+    bench_python(repeat)
+    async with utils.bench_database() as engine:
+        await bench_database(engine, repeat // 10)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=10000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
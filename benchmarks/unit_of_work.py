@@ -0,0 +1,143 @@
+"""
+Measure pool checkouts and transaction round trips per update for the unit of work.
+
+Every update loads an application, like `ApplicationFormattingService` does,
+once in the default transactional mode and once in the read-only mode.
+
+Usage:
+    python -m benchmarks.unit_of_work --repeat 1000
+"""
+
+import argparse
+import asyncio
+from collections import Counter
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.domain.application_answers.dto import AnswerDTO
+from app.domain.application_answers.entities import ApplicationAnswer
+from app.domain.user.dto import UserDTO
+from app.domain.user.entities import User
+from benchmarks import utils
+
+
+class _Counters:
+    """Count pool checkouts and transaction control statements."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        self.counts: Counter[str] = Counter()
+        event.listen(engine.sync_engine.pool, "checkout", self._on_checkout)
+
+    def _on_checkout(
+        self,
+        dbapi_connection: Any,  # noqa: ANN401
+        connection_record: Any,  # noqa: ANN401
+        *_: Any,  # noqa: ANN401
+    ) -> None:
+        self.counts["checkouts"] += 1
+        if not connection_record.info.get("query_logger"):
+            dbapi_connection.driver_connection.add_query_logger(self._on_query)
+            connection_record.info["query_logger"] = True
+
+    def _on_query(self, record: Any) -> None:  # noqa: ANN401
+        if record.query.startswith(("BEGIN", "ROLLBACK", "COMMIT")):
+            self.counts["transaction control"] += 1
+
+
+async def _seed(uow: utils.BenchUnitOfWork) -> int:
+    """
+    Create a user with a filled application.
+
+    Args:
+        uow (utils.BenchUnitOfWork): The unit of work.
+
+    Returns:
+        int: The application id.
+    """
+    async with uow():
+        await uow.user.create(
+            User(UserDTO(id=1, username="user", first_name="name", last_name=None)),
+        )
+        application = await uow.application.create(user_id=1)
+        for question_number in range(1, 6):
+            await uow.application_answer.add_answer(
+                ApplicationAnswer(
+                    AnswerDTO(
+                        application_id=application.id,
+                        question_number=question_number,
+                        answer_text="answer",
+                    ),
+                ),
+            )
+        await uow.commit()
+        return application.id
+
+
+async def _bench_mode(
+    engine: AsyncEngine,
+    counters: _Counters,
+    application_id: int,
+    repeat: int,
+    *,
+    read_only: bool,
+) -> None:
+    """
+    Print per update counters and latency for one unit of work mode.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+        counters (_Counters): The counters attached to the engine.
+        application_id (int): The application to format.
+        repeat (int): The number of updates.
+        read_only (bool): Whether the read-only mode is used.
+
+    Returns:
+        None
+    """
+    uow = utils.BenchUnitOfWork(engine)
+
+    async def update() -> None:
+        async with uow(read_only=read_only):
+            await uow.application.get_by_id(application_id)
+
+    await utils.measure(update, repeat // 10)
+    counters.counts.clear()
+    timings = await utils.measure(update, repeat)
+    per_update = ", ".join(
+        f"{name}={value / repeat:.2f}"
+        for name, value in sorted(counters.counts.items())
+    )
+    mode = "read-only" if read_only else "default"
+    print(f"{mode:>9} | {per_update} | {utils.summary(timings)}")
+
+
+async def main(repeat: int) -> None:
+    """
+    Seed the benchmark database and measure both unit of work modes.
+
+    Args:
+        repeat (int): The number of updates per mode.
+
+    Returns:
+        None
+    """
+    async with utils.bench_database() as engine:
+        counters = _Counters(engine)
+        application_id = await _seed(utils.BenchUnitOfWork(engine))
+        for read_only in (False, True):
+            await _bench_mode(
+                engine,
+                counters,
+                application_id,
+                repeat,
+                read_only=read_only,
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+    asyncio.run(main(args.repeat))
@@ -0,0 +1,143 @@
+"""
+Measure update throughput of the bot for different worker counts.
+
+Updates from several users go through a real `Application` with
+`PerUserUpdateProcessor`. The handler reads the user's last application
+from the benchmark database and creates an invite link, the Bot API is
+answered in-process after `--api-latency` seconds. Every user sends several
+updates, which have to be handled in order.
+
+Usage:
+    python -m benchmarks.update_processing --workers 1 2 4 8 16
+"""
+
+import argparse
+import asyncio
+import contextlib
+import time
+from datetime import datetime, timezone
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+from telegram import Bot, Chat, Message, Update, User
+from telegram.ext import ApplicationBuilder, ContextTypes, TypeHandler
+
+from app.core.update_processor import PerUserUpdateProcessor
+from app.domain.application.exceptions import ApplicationDoesNotExistError
+from benchmarks import utils
+from tests.utils import BotApiRequest
+
+
+def _update(update_id: int, user_id: int) -> Update:
+    """Return a private message update of the user."""
+    return Update(
+        update_id,
+        message=Message(
+            message_id=update_id,
+            date=datetime.now(tz=timezone.utc),
+            chat=Chat(id=user_id, type=Chat.PRIVATE),
+            from_user=User(id=user_id, first_name="user", is_bot=False),
+            text="text",
+        ),
+    )
+
+
+async def run(
+    engine: AsyncEngine,
+    workers: int,
+    users: int,
+    updates_per_user: int,
+    api_latency: float,
+) -> tuple[float, bool]:
+    """
+    Process the updates and return the throughput.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+        workers (int): The number of workers.
+        users (int): The number of users sending updates.
+        updates_per_user (int): The number of updates of every user.
+        api_latency (float): Seconds every Bot API call takes.
+
+    Returns:
+        tuple[float, bool]: Updates per second and whether the updates of
+        every user were handled in order.
+    """
+    application = (
+        ApplicationBuilder()
+        .bot(Bot("1:token", request=BotApiRequest(delay=api_latency)))
+        .updater(None)
+        .concurrent_updates(PerUserUpdateProcessor(workers, workers * 32))
+        .build()
+    )
+    handled: dict[int, list[int]] = {}
+    total = users * updates_per_user
+    done = asyncio.Event()
+
+    async def handle(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+        user = update.effective_user
+        assert user is not None  # noqa: S101
+        uow = utils.BenchUnitOfWork(engine)
+        async with uow(read_only=True):
+            with contextlib.suppress(ApplicationDoesNotExistError):
+                await uow.application.retrieve_last(user.id)
+        await context.bot.create_chat_invite_link(chat_id=1, member_limit=1)
+        handled.setdefault(user.id, []).append(update.update_id)
+        if sum(map(len, handled.values())) == total:
+            done.set()
+
+    application.add_handler(TypeHandler(Update, handle))
+    async with application:
+        await application.start()
+        start = time.perf_counter()
+        for update_id in range(total):
+            await application.update_queue.put(
+                _update(update_id, user_id=update_id % users + 1),
+            )
+        await done.wait()
+        elapsed = time.perf_counter() - start
+        await application.stop()
+    ordered = all(ids == sorted(ids) for ids in handled.values())
+    return total / elapsed, ordered
+
+
+async def main(
+    worker_counts: list[int],
+    users: int,
+    updates_per_user: int,
+    api_latency: float,
+) -> None:
+    """
+    Print throughput for every worker count.
+
+    Args:
+        worker_counts (list[int]): Worker counts to measure.
+        users (int): The number of users sending updates.
+        updates_per_user (int): The number of updates of every user.
+        api_latency (float): Seconds every Bot API call takes.
+
+    Returns:
+        None
+    """
+    async with utils.bench_database() as engine:
+        print("workers | updates/s | per-user order kept")
+        for workers in worker_counts:
+            throughput, ordered = await run(
+                engine,
+                workers,
+                users,
+                updates_per_user,
+                api_latency,
+            )
+            print(f"{workers:>7} | {throughput:>9.1f} | {ordered}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--updates-per-user", type=int, default=4)
+    parser.add_argument("--api-latency", type=float, default=0.05)
+    args = parser.parse_args()
+    asyncio.run(
+        main(args.workers, args.users, args.updates_per_user, args.api_latency),
+    )
@@ -0,0 +1,105 @@
+import statistics
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+
+from app.core.config import settings
+from app.db.engine import UnitOfWork
+from tests import utils
+
+
+@asynccontextmanager
+async def bench_database() -> AsyncIterator[AsyncEngine]:
+    """
+    Create a migrated benchmark database and drop it afterwards.
+
+    Yields:
+        AsyncEngine: An engine connected to the benchmark database.
+    """
+    url = make_url(str(settings.SQLALCHEMY_DATABASE_URI) + "_bench")
+    await utils.create_database(url)
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(utils.apply_migrations)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+        await utils.drop_database(url)
+
+
+def bench_session_factory(engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Create a session factory for the benchmark database.
+
+    Args:
+        engine (AsyncEngine): The benchmark engine.
+
+    Returns:
+        async_sessionmaker[AsyncSession]: The session factory.
+    """
+    return async_sessionmaker(engine, expire_on_commit=False)
+
+
+class BenchUnitOfWork(UnitOfWork):
+    """Unit of work bound to the benchmark database."""
+
+    def __init__(self, engine: AsyncEngine) -> None:
+        """
+        Initialize the unit of work instance.
+
+        Args:
+            engine (AsyncEngine): The benchmark engine.
+
+        Returns:
+            None
+        """
+        super().__init__()
+        self._session_factory = bench_session_factory(engine)
+        self._read_only_session_factory = bench_session_factory(
+            engine.execution_options(isolation_level="AUTOCOMMIT"),
+        )
+
+
+async def measure(
+    func: Callable[[], Awaitable[object]],
+    repeat: int,
+) -> list[float]:
+    """
+    Await `func` `repeat` times and collect wall time of every call.
+
+    Args:
+        func (Callable[[], Awaitable[object]]): The coroutine factory to measure.
+        repeat (int): The number of calls.
+
+    Returns:
+        list[float]: Call durations in milliseconds.
+    """
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summary(timings: list[float]) -> str:
+    """
+    Format median and p95 of the given timings.
+
+    Args:
+        timings (list[float]): Durations in milliseconds.
+
+    Returns:
+        str: Human readable summary.
+    """
+    p95 = statistics.quantiles(timings, n=20)[-1]
+    return f"median={statistics.median(timings):.3f}ms p95={p95:.3f}ms"
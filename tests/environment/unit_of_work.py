@@ -7,4 +7,6 @@ class TestUnitOfWork(UnitOfWork):
     __test__ = False
 
     def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        super().__init__()
         self._session_factory = session_factory
+        self._read_only_session_factory = session_factory
@@ -1,9 +1,46 @@
+from collections.abc import Generator
+from typing import Any
+
 import pytest
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from tests.environment.unit_of_work import TestUnitOfWork
 
+SAVEPOINT_PREFIXES = ("SAVEPOINT", "RELEASE SAVEPOINT", "ROLLBACK TO SAVEPOINT")
+
 
 @pytest.fixture()
 async def uow(session_factory: async_sessionmaker[AsyncSession]) -> TestUnitOfWork:
     return TestUnitOfWork(session_factory)
+
+
+@pytest.fixture()
+def queries(sqla_engine: AsyncEngine) -> Generator[list[str], Any, None]:
+    """Collect SQL statements sent to the database, except test savepoints."""
+    statements: list[str] = []
+
+    def before_cursor_execute(  # noqa: PLR0913
+        conn: Any,  # noqa: ANN401, ARG001
+        cursor: Any,  # noqa: ANN401, ARG001
+        statement: str,
+        parameters: Any,  # noqa: ANN401, ARG001
+        context: Any,  # noqa: ANN401, ARG001
+        executemany: bool,  # noqa: ARG001, FBT001
+    ) -> None:
+        if not statement.lstrip().upper().startswith(SAVEPOINT_PREFIXES):
+            statements.append(statement)
+
+    event.listen(
+        sqla_engine.sync_engine,
+        "before_cursor_execute",
+        before_cursor_execute,
+    )
+    try:
+        yield statements
+    finally:
+        event.remove(
+            sqla_engine.sync_engine,
+            "before_cursor_execute",
+            before_cursor_execute,
+        )
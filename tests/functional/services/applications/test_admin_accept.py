@@ -1,8 +1,14 @@
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
 import pytest
+from telegram import Bot, Chat, Message, Update
+from telegram import User as TelegramUser
 
 from app.domain.admin_processing_application.dto import AdminProcessingApplicationDTO
 from app.domain.admin_processing_application.entities import AdminProcessingApplication
 from app.domain.admin_processing_application.exceptions import (
+    AdminProcessingApplicationDoesNotExistError,
     ApplicationAlreadyProcessedError,
     WrongAdminError,
 )
@@ -11,10 +17,15 @@ from app.domain.application.exceptions import (
     ChangeApplicationStatusError,
 )
 from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.invite_link.exceptions import InviteLinkPoolIsEmptyError
+from app.handlers.chat.new_user_joined import new_user_joined_handler
 from app.services.applications.application_admin_accept import (
     ApplicationAdminAcceptService,
 )
 from tests.environment.unit_of_work import TestUnitOfWork
+from tests.utils import BotApiRequest
+
+JOIN_LINK = "https://t.me/+join"
 
 
 @pytest.fixture()
@@ -56,6 +67,98 @@ async def test_ok(
     assert accepted_application.admin_id is None
 
 
+async def test_notification_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    application = await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        "link",
+    )
+
+    async with uow():
+        messages = await uow.outbox.claim(10, timedelta())
+    assert [message.chat_id for message in messages] == [application.user_id] * 2
+    assert "link" in messages[0].message
+
+
+async def test_no_notification_fail(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    with pytest.raises(WrongAdminError):
+        await service.execute(admin_application.admin_id, -1, "link")
+
+    async with uow():
+        assert await uow.outbox.claim(10, timedelta()) == []
+
+
+async def test_link_from_pool_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    async with uow():
+        await uow.invite_link.add(["first", "second"])
+        await uow.commit()
+
+    accepted_application = await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+    )
+
+    assert accepted_application.invite_link == "first"
+    async with uow():
+        assert await uow.invite_link.count() == 1
+
+
+async def test_link_returned_to_pool_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    async with uow():
+        await uow.invite_link.add(["first"])
+        await uow.commit()
+
+    with pytest.raises(WrongAdminError):
+        await service.execute(admin_application.admin_id, -1)
+
+    async with uow():
+        assert await uow.invite_link.take() == "first"
+
+
+async def test_empty_pool_fail(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+) -> None:
+    with pytest.raises(InviteLinkPoolIsEmptyError):
+        await service.execute(
+            admin_application.admin_id,
+            admin_application.application_id,
+        )
+
+
+async def test_admin_released_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        "link",
+    )
+    async with uow():
+        with pytest.raises(AdminProcessingApplicationDoesNotExistError):
+            await uow.admin_processing_application.get_by_admin_id(
+                admin_application.admin_id,
+            )
+
+
 async def test_already_processed_fail(
     service: ApplicationAdminAcceptService,
     admin_application: AdminProcessingApplication,
@@ -110,3 +213,76 @@ async def test_wrong_status_fail(
             admin_application.application_id,
             "link",
         )
+
+
+async def test_message_ids_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    async with uow():
+        await uow.application.set_messages(admin_application.application_id, 10, 20)
+        await uow.commit()
+
+    accepted_application = await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        "link",
+    )
+
+    assert accepted_application.admin_chat_message_id == 10  # noqa: PLR2004
+    assert accepted_application.review_message_id == 20  # noqa: PLR2004
+
+
+async def test_join_link_not_saved_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    application = await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        join_link=JOIN_LINK,
+    )
+
+    assert application.invite_link is None
+    async with uow():
+        messages = await uow.outbox.claim(10, timedelta())
+        assert await uow.invite_link.count() == 0
+    assert JOIN_LINK in messages[0].message
+
+
+async def test_join_link_not_revoked_ok(
+    service: ApplicationAdminAcceptService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    application = await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        join_link=JOIN_LINK,
+    )
+    bot_api = BotApiRequest()
+    context = SimpleNamespace(
+        application=SimpleNamespace(bot=Bot("1:token", request=bot_api)),
+    )
+    update = Update(
+        1,
+        message=Message(
+            message_id=1,
+            date=datetime.now(tz=timezone.utc),
+            chat=Chat(id=-100, type=Chat.SUPERGROUP),
+            new_chat_members=[
+                TelegramUser(id=application.user_id, first_name="user", is_bot=False),
+            ],
+        ),
+    )
+
+    # The handler is registered again if the join request mode is turned off.
+    await new_user_joined_handler.__wrapped__(  # type: ignore[attr-defined]
+        update=update,
+        context=context,
+        uow=uow,
+    )
+
+    assert "revokeChatInviteLink" not in bot_api.methods
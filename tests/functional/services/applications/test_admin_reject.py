@@ -1,8 +1,11 @@
+from datetime import timedelta
+
 import pytest
 
 from app.domain.admin_processing_application.dto import AdminProcessingApplicationDTO
 from app.domain.admin_processing_application.entities import AdminProcessingApplication
 from app.domain.admin_processing_application.exceptions import (
+    AdminProcessingApplicationDoesNotExistError,
     ApplicationAlreadyProcessedError,
     WrongAdminError,
 )
@@ -69,6 +72,40 @@ async def test_without_reason_ok(
     assert accepted_application.admin_id is None
 
 
+async def test_notification_ok(
+    service: ApplicationAdminRejectService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    application = await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        "reason",
+    )
+
+    async with uow():
+        messages = await uow.outbox.claim(10, timedelta())
+    assert [message.chat_id for message in messages] == [application.user_id] * 2
+    assert "Причина отказа: reason." in messages[0].message
+
+
+async def test_admin_released_ok(
+    service: ApplicationAdminRejectService,
+    admin_application: AdminProcessingApplication,
+    uow: TestUnitOfWork,
+) -> None:
+    await service.execute(
+        admin_application.admin_id,
+        admin_application.application_id,
+        "reason",
+    )
+    async with uow():
+        with pytest.raises(AdminProcessingApplicationDoesNotExistError):
+            await uow.admin_processing_application.get_by_admin_id(
+                admin_application.admin_id,
+            )
+
+
 async def test_already_processed_fail(
     service: ApplicationAdminRejectService,
     admin_application: AdminProcessingApplication,
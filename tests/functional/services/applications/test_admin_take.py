@@ -11,8 +11,12 @@ from app.domain.application.exceptions import (
     ChangeApplicationStatusError,
 )
 from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.user.dto import UserDTO
 from app.domain.user.entities import User
 from app.services.applications.application_admin_take import ApplicationAdminTakeService
+from app.services.applications.application_formatting import (
+    ApplicationFormattingService,
+)
 from tests.environment.unit_of_work import TestUnitOfWork
 
 
@@ -53,6 +57,35 @@ async def test_ok(
     await service.execute(
         admin_id=filled_application.user_id, application_id=filled_application.id,
     )
+    async with uow():
+        application = await uow.application.get_by_id(filled_application.id)
+        admin_application = await uow.admin_processing_application.get_by_admin_id(
+            filled_application.user_id,
+        )
+    assert application.status == ApplicationStatusEnum.PROCESSING
+    assert admin_application.application_id == filled_application.id
+
+
+async def test_taken_by_another_admin_fail(
+    service: ApplicationAdminTakeService,
+    filled_application: Application,
+    uow: TestUnitOfWork,
+) -> None:
+    filled_application.complete()
+    another_admin = User(
+        data=UserDTO(id=2, username=None, first_name=None, last_name=None),
+    )
+    async with uow():
+        await uow.user.create(another_admin)
+        await uow.application.update(filled_application)
+        await uow.commit()
+    await service.execute(
+        admin_id=filled_application.user_id, application_id=filled_application.id,
+    )
+    with pytest.raises(ChangeApplicationStatusError):
+        await service.execute(
+            admin_id=another_admin.id, application_id=filled_application.id,
+        )
 
 
 async def test_does_not_exists_fail(
@@ -96,3 +129,28 @@ async def test_admin_already_processing_fail(
             admin_id=admin_application.admin_id,
             application_id=admin_application.application_id,
         )
+
+
+async def test_scope_formatting_without_queries_ok(
+    service: ApplicationAdminTakeService,
+    filled_application: Application,
+    uow: TestUnitOfWork,
+    queries: list[str],
+) -> None:
+    filled_application.complete()
+    async with uow():
+        await uow.application.update(filled_application)
+        await uow.commit()
+    async with uow.scope():
+        await service.execute(
+            admin_id=filled_application.user_id,
+            application_id=filled_application.id,
+        )
+        queries.clear()
+        formatted_in_scope = await ApplicationFormattingService(uow).execute(
+            filled_application.id,
+        )
+        assert queries == []
+
+    formatted = await ApplicationFormattingService(uow).execute(filled_application.id)
+    assert formatted_in_scope == formatted
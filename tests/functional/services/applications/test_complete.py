@@ -9,6 +9,9 @@ from app.domain.application.exceptions import (
 from app.domain.application.value_objects import ApplicationStatusEnum
 from app.domain.user.entities import User
 from app.services.applications.application_complete import ApplicationCompleteService
+from app.services.applications.application_formatting import (
+    ApplicationFormattingService,
+)
 from tests.environment.unit_of_work import TestUnitOfWork
 
 
@@ -25,6 +28,20 @@ async def test_add_ok(
     assert completed_application.status == ApplicationStatusEnum.WAITING
 
 
+async def test_formatting_reuses_completed_ok(
+    service: ApplicationCompleteService,
+    uow: TestUnitOfWork,
+    filled_application: Application,
+    queries: list[str],
+) -> None:
+    async with uow.scope():
+        completed_application = await service.execute(filled_application.user_id)
+        queries.clear()
+        await ApplicationFormattingService(uow).execute(completed_application.id)
+
+    assert queries == []
+
+
 async def test_does_not_exists_fail(
     service: ApplicationCompleteService,
     user: User,
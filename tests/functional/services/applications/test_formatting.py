@@ -2,8 +2,11 @@ import pytest
 
 from app.domain.application.entities import Application
 from app.domain.application.exceptions import ApplicationDoesNotExistError
+from app.domain.application.value_objects import ApplicationStatusEnum
 from app.services.applications.application_formatting import (
     ApplicationFormattingService,
+    escape_markdown,
+    format_application,
 )
 from tests.environment.unit_of_work import TestUnitOfWork
 
@@ -28,3 +31,31 @@ async def test_doest_not_exists_fail(
 ) -> None:
     with pytest.raises(ApplicationDoesNotExistError):
         await service.execute(1)
+
+
+def test_escape_markdown_ok() -> None:
+    assert escape_markdown("a_b*c[d](e)~`>#+-=|{}.!\\") == (
+        "a\\_b\\*c\\[d\\]\\(e\\)\\~\\`\\>\\#\\+\\-\\=\\|\\{\\}\\.\\!\\\\"
+    )
+
+
+async def test_cached_ok(
+    service: ApplicationFormattingService,
+    filled_application: Application,
+) -> None:
+    formatted_application = await service.execute(filled_application.id)
+
+    assert format_application(filled_application) is formatted_application
+
+
+async def test_transition_renders_again_ok(
+    service: ApplicationFormattingService,
+    filled_application: Application,
+) -> None:
+    formatted_application = await service.execute(filled_application.id)
+
+    filled_application.status = ApplicationStatusEnum.WAITING
+    waiting_application = format_application(filled_application)
+
+    assert waiting_application != formatted_application
+    assert escape_markdown(ApplicationStatusEnum.WAITING) in waiting_application
@@ -0,0 +1,66 @@
+import pytest
+
+from app.domain.application.entities import Application
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.user.entities import User
+from app.services.applications.application_join_request import (
+    ApplicationJoinRequestService,
+)
+from tests.environment.unit_of_work import TestUnitOfWork
+
+
+@pytest.fixture()
+def service(uow: TestUnitOfWork) -> ApplicationJoinRequestService:
+    return ApplicationJoinRequestService(uow)
+
+
+@pytest.mark.parametrize(
+    "empty_application",
+    [{"status": ApplicationStatusEnum.ACCEPTED}],
+    indirect=True,
+)
+async def test_accepted_ok(
+    service: ApplicationJoinRequestService,
+    empty_application: Application,
+    queries: list[str],
+) -> None:
+    assert await service.execute(empty_application.user_id) is True
+    assert len(queries) == 1
+
+
+@pytest.mark.parametrize(
+    "empty_application",
+    [{"status": ApplicationStatusEnum.REJECTED}],
+    indirect=True,
+)
+async def test_rejected_fail(
+    service: ApplicationJoinRequestService,
+    empty_application: Application,
+) -> None:
+    assert await service.execute(empty_application.user_id) is False
+
+
+@pytest.mark.parametrize(
+    "empty_application",
+    [{"status": ApplicationStatusEnum.ACCEPTED}],
+    indirect=True,
+)
+async def test_banned_fail(
+    service: ApplicationJoinRequestService,
+    empty_application: Application,
+    uow: TestUnitOfWork,
+) -> None:
+    async with uow():
+        user = await uow.user.retrieve(empty_application.user_id)
+        user.ban()
+        await uow.user.update(user)
+        await uow.commit()
+
+    assert await service.execute(empty_application.user_id) is False
+
+
+async def test_no_application_fail(
+    service: ApplicationJoinRequestService,
+    user: User,
+) -> None:
+    assert await service.execute(user.id) is False
@@ -0,0 +1,58 @@
+import pytest
+
+from app.domain.application.entities import Application
+from app.domain.application.exceptions import ApplicationDoesNotExistError
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.services.applications.application_admin_take import (
+    ApplicationAdminTakeService,
+)
+from app.services.applications.application_messages import (
+    ApplicationMessagesService,
+)
+from tests.environment.unit_of_work import TestUnitOfWork
+
+
+@pytest.fixture()
+def service(uow: TestUnitOfWork) -> ApplicationMessagesService:
+    return ApplicationMessagesService(uow)
+
+
+async def test_ok(
+    service: ApplicationMessagesService,
+    empty_application: Application,
+    uow: TestUnitOfWork,
+) -> None:
+    await service.execute(empty_application.id, admin_chat_message_id=10)
+    await service.execute(empty_application.id, review_message_id=20)
+
+    async with uow(read_only=True):
+        application = await uow.application.get_by_id(empty_application.id)
+    assert application.admin_chat_message_id == 10  # noqa: PLR2004
+    assert application.review_message_id == 20  # noqa: PLR2004
+
+
+@pytest.mark.parametrize(
+    "filled_application",
+    [{"status": ApplicationStatusEnum.WAITING}],
+    indirect=True,
+)
+async def test_kept_by_take_ok(
+    service: ApplicationMessagesService,
+    filled_application: Application,
+    uow: TestUnitOfWork,
+) -> None:
+    await service.execute(filled_application.id, admin_chat_message_id=10)
+
+    await ApplicationAdminTakeService(uow).execute(
+        filled_application.user_id,
+        filled_application.id,
+    )
+    async with uow(read_only=True):
+        application = await uow.application.get_by_id(filled_application.id)
+    assert application.admin_chat_message_id == 10  # noqa: PLR2004
+    assert application.review_message_id is None
+
+
+async def test_does_not_exist_fail(service: ApplicationMessagesService) -> None:
+    with pytest.raises(ApplicationDoesNotExistError):
+        await service.execute(1, admin_chat_message_id=10)
@@ -59,6 +59,25 @@ async def test_update_ok(
     assert len(user_application.answers) == MAX_ANSWERS
 
 
+async def test_answer_twice_ok(
+    service: ApplicationResponseService,
+    empty_application: Application,
+    uow: TestUnitOfWork,
+    dto: ApplicationResponseInputDTO,
+) -> None:
+    first = await service.execute(dto)
+    dto.answer_text = "changed answer"
+    second = await service.execute(dto)
+    assert first.status == ApplicationResponseStatusEnum.NEW
+    assert second.status == ApplicationResponseStatusEnum.UPDATE
+    async with uow():
+        user_application = await uow.application.retrieve_last(
+            empty_application.user_id,
+        )
+    assert user_application.answers[dto.question_number].answer_text == dto.answer_text
+    assert len(user_application.answers) == 1
+
+
 async def test_does_not_exists_fail(
     service: ApplicationResponseService,
     dto: ApplicationResponseInputDTO,
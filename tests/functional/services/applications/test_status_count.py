@@ -0,0 +1,30 @@
+import pytest
+
+from app.domain.application.entities import Application
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.services.applications.application_status_count import (
+    ApplicationStatusCountService,
+)
+from tests.environment.unit_of_work import TestUnitOfWork
+
+
+@pytest.fixture()
+def service(uow: TestUnitOfWork) -> ApplicationStatusCountService:
+    return ApplicationStatusCountService(uow)
+
+
+@pytest.mark.parametrize(
+    "filled_application",
+    [{"status": ApplicationStatusEnum.WAITING}],
+    indirect=True,
+)
+async def test_ok(
+    service: ApplicationStatusCountService,
+    filled_application: Application,  # noqa: ARG001
+) -> None:
+    counts = await service.execute()
+
+    assert counts == {
+        status: int(status == ApplicationStatusEnum.WAITING)
+        for status in ApplicationStatusEnum
+    }
@@ -0,0 +1,83 @@
+import pytest
+
+from app.domain.application.entities import Application
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.user.entities import User
+from app.domain.user.exceptions import UserIsBannedError
+from app.services.applications.application_user_start import (
+    UserApplicationStartService,
+)
+from app.services.users.dto import UserCreateDTO
+from tests.environment.unit_of_work import TestUnitOfWork
+
+# User upsert, last application lookup and application create/clear.
+MAX_START_STATEMENTS = 3
+
+
+@pytest.fixture()
+def service(uow: TestUnitOfWork) -> UserApplicationStartService:
+    return UserApplicationStartService(uow)
+
+
+@pytest.fixture()
+def user_create_dto(user: User) -> UserCreateDTO:
+    return UserCreateDTO(
+        id=user.id,
+        username="@new_username",
+        first_name=user.first_name,
+        last_name=user.last_name,
+    )
+
+
+async def test_new_user_ok(
+    service: UserApplicationStartService,
+    uow: TestUnitOfWork,
+    user_create_dto: UserCreateDTO,
+    queries: list[str],
+) -> None:
+    application = await service.execute(user_create_dto)
+
+    assert 0 < len(queries) <= MAX_START_STATEMENTS
+    async with uow():
+        db_user = await uow.user.retrieve(user_create_dto.id)
+        db_application = await uow.application.get_by_id(application.id)
+    assert db_user.username == user_create_dto.username
+    assert db_application.user_id == user_create_dto.id
+    assert db_application.status == ApplicationStatusEnum.IN_PROGRESS
+
+
+async def test_in_progress_cleared_ok(
+    service: UserApplicationStartService,
+    uow: TestUnitOfWork,
+    filled_application: Application,
+    user_create_dto: UserCreateDTO,
+    queries: list[str],
+) -> None:
+    queries.clear()
+    application = await service.execute(user_create_dto)
+
+    assert 0 < len(queries) <= MAX_START_STATEMENTS
+    assert application.id == filled_application.id
+    async with uow():
+        db_application = await uow.application.get_by_id(application.id)
+    assert db_application.answers == {}
+
+
+@pytest.mark.parametrize("user", [{"is_banned": True}], indirect=True)
+async def test_banned_fail(
+    service: UserApplicationStartService,
+    uow: TestUnitOfWork,
+    user: User,
+    user_create_dto: UserCreateDTO,
+) -> None:
+    async with uow():
+        await uow.user.create(user)
+        await uow.commit()
+
+    with pytest.raises(UserIsBannedError):
+        await service.execute(user_create_dto)
+
+    async with uow():
+        db_user = await uow.user.retrieve(user.id)
+    assert db_user.username == user_create_dto.username
+    assert db_user.is_banned is True
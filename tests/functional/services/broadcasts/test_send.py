@@ -0,0 +1,158 @@
+from datetime import datetime, timedelta, timezone
+from typing import cast
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from telegram.ext import ExtBot
+
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.broadcast.entities import Broadcast
+from app.domain.broadcast.value_objects import (
+    BroadcastAudienceEnum,
+    DeliveryStatusEnum,
+)
+from app.domain.user.dto import UserDTO
+from app.domain.user.entities import User
+from app.services.broadcasts.broadcast_send import BroadcastSendService
+from app.services.broadcasts.broadcast_start import BroadcastStartService
+from app.services.broadcasts.broadcast_unfinished import BroadcastUnfinishedService
+from tests.environment.unit_of_work import TestUnitOfWork
+from tests.utils import BroadcastBot
+
+
+def _service(
+    session_factory: async_sessionmaker[AsyncSession],
+    bot: BroadcastBot,
+    batch_size: int = 2,
+) -> BroadcastSendService:
+    return BroadcastSendService(
+        TestUnitOfWork(session_factory),
+        TestUnitOfWork(session_factory),
+        cast(ExtBot, bot),
+        workers=2,
+        batch_size=batch_size,
+    )
+
+
+async def _create_user(
+    uow: TestUnitOfWork,
+    user_id: int,
+    status: ApplicationStatusEnum | None = None,
+    decision_date: datetime | None = None,
+    *,
+    is_banned: bool = False,
+) -> None:
+    async with uow():
+        await uow.user.create(
+            User(
+                UserDTO(
+                    id=user_id,
+                    username=None,
+                    first_name=None,
+                    last_name=None,
+                    is_banned=is_banned,
+                ),
+            ),
+        )
+        if status is not None:
+            application = await uow.application.create(user_id)
+            application.status = status
+            application.decision_date = decision_date
+            await uow.application.update(application)
+        await uow.commit()
+
+
+async def _start(uow: TestUnitOfWork, audience: BroadcastAudienceEnum) -> Broadcast:
+    return await BroadcastStartService(uow).execute(1, audience, "text")
+
+
+async def test_all_ok(
+    uow: TestUnitOfWork,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    for user_id in range(1, 7):
+        await _create_user(uow, user_id, is_banned=user_id == 6)  # noqa: PLR2004
+    bot = BroadcastBot(blocked=frozenset({2}), failed=frozenset({4}))
+    broadcast = await _start(uow, BroadcastAudienceEnum.ALL)
+
+    result = await _service(session_factory, bot).execute(broadcast)
+
+    assert sorted(bot.sent) == [1, 3, 5]
+    assert (result.delivered, result.blocked, result.failed) == (3, 1, 1)
+    assert result.is_finished is True
+    assert await BroadcastUnfinishedService(uow).execute() == []
+
+
+async def test_accepted_ok(
+    uow: TestUnitOfWork,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _create_user(uow, 1, ApplicationStatusEnum.ACCEPTED)
+    await _create_user(uow, 2, ApplicationStatusEnum.REJECTED)
+    await _create_user(uow, 3)
+    await _create_user(uow, 4, ApplicationStatusEnum.ACCEPTED, is_banned=True)
+    bot = BroadcastBot()
+    broadcast = await _start(uow, BroadcastAudienceEnum.ACCEPTED)
+
+    await _service(session_factory, bot).execute(broadcast)
+
+    assert bot.sent == [1]
+
+
+async def test_rejected_this_month_ok(
+    uow: TestUnitOfWork,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    now = datetime.now(tz=timezone.utc)
+    await _create_user(uow, 1, ApplicationStatusEnum.REJECTED, now)
+    await _create_user(uow, 2, ApplicationStatusEnum.REJECTED, now - timedelta(days=40))
+    await _create_user(uow, 3, ApplicationStatusEnum.ACCEPTED, now)
+    await _create_user(uow, 4, ApplicationStatusEnum.REJECTED, now)
+    async with uow():
+        await uow.application.create(4)
+        await uow.commit()
+    bot = BroadcastBot()
+    broadcast = await _start(uow, BroadcastAudienceEnum.REJECTED_THIS_MONTH)
+
+    await _service(session_factory, bot).execute(broadcast)
+
+    assert bot.sent == [1]
+
+
+async def test_progress_saved_per_batch_ok(
+    uow: TestUnitOfWork,
+    session_factory: async_sessionmaker[AsyncSession],
+    queries: list[str],
+) -> None:
+    for user_id in range(1, 6):
+        await _create_user(uow, user_id)
+    broadcast = await _start(uow, BroadcastAudienceEnum.ALL)
+    queries.clear()
+
+    await _service(session_factory, BroadcastBot(), batch_size=2).execute(broadcast)
+
+    recipient_queries = [query for query in queries if "FROM users" in query]
+    saves = [query for query in queries if query.startswith("UPDATE broadcasts")]
+    assert len(recipient_queries) == 1
+    # Batches [1, 2], [3, 4], [5] and the finish.
+    assert len(saves) == 4  # noqa: PLR2004
+
+
+async def test_resume_ok(
+    uow: TestUnitOfWork,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    for user_id in range(1, 6):
+        await _create_user(uow, user_id)
+    broadcast = await _start(uow, BroadcastAudienceEnum.ALL)
+    broadcast.record(1, DeliveryStatusEnum.DELIVERED)
+    broadcast.record(2, DeliveryStatusEnum.BLOCKED)
+    async with uow():
+        await uow.broadcast.update(broadcast)
+        await uow.commit()
+    [stopped] = await BroadcastUnfinishedService(uow).execute()
+    bot = BroadcastBot()
+
+    result = await _service(session_factory, bot).execute(stopped)
+
+    assert sorted(bot.sent) == [3, 4, 5]
+    assert (result.delivered, result.blocked) == (4, 1)
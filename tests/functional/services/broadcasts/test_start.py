@@ -0,0 +1,18 @@
+from app.domain.broadcast.value_objects import BroadcastAudienceEnum
+from app.services.broadcasts.broadcast_start import BroadcastStartService
+from app.services.broadcasts.broadcast_unfinished import BroadcastUnfinishedService
+from tests.environment.unit_of_work import TestUnitOfWork
+
+
+async def test_ok(uow: TestUnitOfWork) -> None:
+    broadcast = await BroadcastStartService(uow).execute(
+        admin_id=1,
+        audience=BroadcastAudienceEnum.ACCEPTED,
+        message="text",
+    )
+
+    assert broadcast.audience == BroadcastAudienceEnum.ACCEPTED
+    assert broadcast.last_user_id == 0
+    assert broadcast.is_finished is False
+    unfinished = await BroadcastUnfinishedService(uow).execute()
+    assert [item.id for item in unfinished] == [broadcast.id]
@@ -0,0 +1,91 @@
+from datetime import timedelta
+from typing import Any, cast
+
+import pytest
+from sqlalchemy import update
+from telegram import ChatInviteLink, User
+from telegram.error import TelegramError
+from telegram.ext import ExtBot
+
+from app.models import InviteLink
+from app.services.invite_links.invite_link_pool_refill import (
+    InviteLinkPoolRefillService,
+)
+from tests.environment.unit_of_work import TestUnitOfWork
+
+CLAN_CHAT_ID = -100
+TIMED_OUT = "Timed out"
+_BOT = User(id=1, first_name="bot", is_bot=True)
+
+
+class InviteLinkBot:
+    """Creates numbered invite links and records revoked ones."""
+
+    def __init__(self, fail_after: int | None = None) -> None:
+        self.fail_after = fail_after
+        self.created: list[str] = []
+        self.revoked: list[str] = []
+
+    async def create_chat_invite_link(
+        self,
+        chat_id: int,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002, ANN401
+    ) -> ChatInviteLink:
+        """Return a new link or fail after `fail_after` links."""
+        if len(self.created) == self.fail_after:
+            raise TelegramError(TIMED_OUT)
+        link = f"https://t.me/+{len(self.created)}"
+        self.created.append(link)
+        return ChatInviteLink(link, _BOT, False, False, False)  # noqa: FBT003
+
+    async def revoke_chat_invite_link(self, chat_id: int, link: str) -> None:  # noqa: ARG002
+        """Record the revoked link."""
+        self.revoked.append(link)
+
+
+def _service(uow: TestUnitOfWork, bot: InviteLinkBot) -> InviteLinkPoolRefillService:
+    return InviteLinkPoolRefillService(
+        uow,
+        cast(ExtBot, bot),
+        CLAN_CHAT_ID,
+        size=3,
+        max_age=timedelta(hours=1),
+    )
+
+
+@pytest.fixture()
+def bot() -> InviteLinkBot:
+    return InviteLinkBot()
+
+
+async def test_fill_ok(uow: TestUnitOfWork, bot: InviteLinkBot) -> None:
+    assert await _service(uow, bot).execute() == 3  # noqa: PLR2004
+    assert await _service(uow, bot).execute() == 3  # noqa: PLR2004
+
+    assert len(bot.created) == 3  # noqa: PLR2004
+    async with uow():
+        assert await uow.invite_link.take() == bot.created[0]
+
+
+async def test_stale_replaced_ok(uow: TestUnitOfWork, bot: InviteLinkBot) -> None:
+    async with uow():
+        await uow.invite_link.add(["stale", "fresh"])
+        await uow.invite_link.session.execute(
+            update(InviteLink)
+            .where(InviteLink.link == "stale")
+            .values(created_at=InviteLink.created_at - timedelta(hours=2)),
+        )
+        await uow.commit()
+
+    await _service(uow, bot).execute()
+
+    assert bot.revoked == ["stale"]
+    assert len(bot.created) == 2  # noqa: PLR2004
+    async with uow():
+        assert await uow.invite_link.take() == "fresh"
+
+
+async def test_create_failure_ok(uow: TestUnitOfWork) -> None:
+    bot = InviteLinkBot(fail_after=1)
+
+    assert await _service(uow, bot).execute() == 1
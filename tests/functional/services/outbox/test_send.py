@@ -0,0 +1,161 @@
+import asyncio
+from datetime import timedelta
+from typing import Any, cast
+
+import pytest
+from telegram.error import Forbidden, NetworkError, TelegramError
+from telegram.ext import ExtBot
+
+from app.services.outbox.outbox_send import OutboxSendService
+from tests.environment.unit_of_work import TestUnitOfWork
+
+BLOCKED = "Forbidden: bot was blocked by the user"
+TIMED_OUT = "Timed out"
+
+
+class OutboxBot:
+    """Records sent messages and raises the queued errors of a text first."""
+
+    def __init__(
+        self,
+        errors: dict[str, list[TelegramError]] | None = None,
+        delay: float = 0,
+    ) -> None:
+        self.errors = errors or {}
+        self.delay = delay
+        self.sending = asyncio.Event()
+        self.release = asyncio.Event()
+        self.release.set()
+        self.sent: list[tuple[int, str]] = []
+
+    async def send_message(self, chat_id: int, text: str, **kwargs: Any) -> None:  # noqa: ANN401, ARG002
+        """Raise the next error of the text or record the message."""
+        self.sending.set()
+        await self.release.wait()
+        await asyncio.sleep(self.delay)
+        errors = self.errors.get(text)
+        if errors:
+            raise errors.pop(0)
+        self.sent.append((chat_id, text))
+
+
+def _service(  # noqa: PLR0913
+    uow: TestUnitOfWork,
+    bot: OutboxBot,
+    max_attempts: int = 3,
+    batch_size: int = 10,
+    retry_delay: timedelta = timedelta(),
+    lease: timedelta = timedelta(minutes=1),
+) -> OutboxSendService:
+    return OutboxSendService(
+        uow,
+        cast(ExtBot, bot),
+        batch_size=batch_size,
+        max_attempts=max_attempts,
+        retry_delay=retry_delay,
+        lease=lease,
+    )
+
+
+@pytest.fixture()
+async def _messages(uow: TestUnitOfWork) -> None:
+    async with uow():
+        await uow.outbox.add(1, ["first", "second"])
+        await uow.outbox.add(2, ["other"])
+        await uow.commit()
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_ok(uow: TestUnitOfWork) -> None:
+    bot = OutboxBot()
+
+    assert await _service(uow, bot).execute() == 3  # noqa: PLR2004
+
+    assert sorted(bot.sent) == [(1, "first"), (1, "second"), (2, "other")]
+    assert bot.sent.index((1, "first")) < bot.sent.index((1, "second"))
+    assert await _service(uow, bot).execute() == 0
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_retry_keeps_order_ok(uow: TestUnitOfWork) -> None:
+    bot = OutboxBot({"first": [NetworkError(TIMED_OUT)]})
+
+    await _service(uow, bot).execute()
+    assert bot.sent == [(2, "other")]
+    await _service(uow, bot).execute()
+
+    assert bot.sent[1:] == [(1, "first"), (1, "second")]
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_blocked_fail(uow: TestUnitOfWork) -> None:
+    bot = OutboxBot({"first": [Forbidden(BLOCKED)]})
+
+    await _service(uow, bot).execute()
+    assert await _service(uow, bot).execute() == 0
+
+    assert bot.sent == [(2, "other")]
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_max_attempts_fail(uow: TestUnitOfWork) -> None:
+    bot = OutboxBot({"first": [NetworkError(TIMED_OUT)]})
+
+    await _service(uow, bot, max_attempts=1).execute()
+    assert await _service(uow, bot).execute() == 0
+
+    assert sorted(bot.sent) == [(1, "second"), (2, "other")]
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_two_workers_keep_order_ok(uow: TestUnitOfWork) -> None:
+    first_bot = OutboxBot()
+    first_bot.release.clear()
+    second_bot = OutboxBot()
+
+    first = asyncio.create_task(_service(uow, first_bot, batch_size=1).execute())
+    await first_bot.sending.wait()
+    async with uow():
+        await uow.outbox.add(1, ["third"])
+        await uow.commit()
+    assert await _service(uow, second_bot).execute() == 1
+    first_bot.release.set()
+    assert await first == 2  # noqa: PLR2004
+    assert await _service(uow, second_bot).execute() == 1
+
+    assert first_bot.sent == [(1, "first"), (1, "second")]
+    assert second_bot.sent == [(2, "other"), (1, "third")]
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_retry_holds_later_messages_ok(uow: TestUnitOfWork) -> None:
+    bot = OutboxBot({"first": [NetworkError(TIMED_OUT)]})
+
+    await _service(uow, bot, retry_delay=timedelta(hours=1)).execute()
+    async with uow():
+        await uow.outbox.add(1, ["third"])
+        await uow.commit()
+
+    assert await _service(uow, bot).execute() == 0
+    assert bot.sent == [(2, "other")]
+
+
+@pytest.mark.usefixtures("_messages")
+async def test_lease_extended_while_sending_ok(
+    uow: TestUnitOfWork,
+    queries: list[str],
+) -> None:
+    lease = timedelta(milliseconds=20)
+    bot = OutboxBot(delay=lease.total_seconds() * 2)
+
+    await _service(uow, bot, lease=lease).execute()
+
+    extensions = [
+        query
+        for query in queries
+        if query.lstrip().startswith("UPDATE outbox")
+        and "attempts" not in query
+        and "chat_id" not in query
+        and "failed_at=" not in query
+    ]
+    assert extensions
@@ -49,7 +49,28 @@ async def test_already_created_ok(
         await uow.commit()
     result = await service.execute(dto)
     assert result.id == user.id
-    assert result.first_name == user.first_name
-    assert result.last_name == user.last_name
-    assert result.username == user.username
+    assert result.first_name == dto.first_name
+    assert result.last_name == dto.last_name
+    assert result.username == dto.username
     assert result.is_banned == user.is_banned is False
+
+
+async def test_ban_kept_ok(
+    service: EnsureUserExistsService,
+    dto: UserCreateDTO,
+    user: User,
+    uow: TestUnitOfWork,
+) -> None:
+    user.ban()
+    async with uow():
+        await uow.user.create(user)
+        await uow.commit()
+    result = await service.execute(dto)
+
+    async with uow():
+        stored_user = await uow.user.retrieve(dto.id)
+
+    assert result.username == stored_user.username == dto.username
+    assert result.first_name == stored_user.first_name == dto.first_name
+    assert result.last_name == stored_user.last_name == dto.last_name
+    assert result.is_banned is stored_user.is_banned is True
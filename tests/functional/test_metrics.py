@@ -0,0 +1,84 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from sqlalchemy import URL, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from telegram import Bot
+
+from app.core import metrics, metrics_server
+from app.infra.messaging.instrumented_request import InstrumentedRequest
+from tests.utils import BotApiRequest
+
+API_LATENCY = 0.02
+
+
+@pytest.fixture()
+async def measured_engine(database: URL) -> AsyncGenerator[AsyncEngine, Any]:
+    engine = create_async_engine(database)
+    metrics.instrument_engine(engine)
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+async def _sum(histogram: metrics.LatencyHistogram, **labels: str) -> float:
+    """Return the sum of values observed for the labels."""
+    for sample in await histogram.samples():
+        if sample.name.endswith("_sum") and sample.labels == labels:
+            return sample.value
+    return 0
+
+
+async def test_handler_split_ok(measured_engine: AsyncEngine) -> None:
+    bot = Bot(
+        "1:token",
+        request=InstrumentedRequest(BotApiRequest(delay=API_LATENCY)),
+        get_updates_request=BotApiRequest(),
+    )
+
+    async def split_handler(update: Any, context: Any) -> None:  # noqa: ANN401, ARG001
+        async with measured_engine.connect() as connection:
+            await connection.execute(text("SELECT pg_sleep(0.01)"))
+        await bot.get_me()
+
+    measured = metrics._measure_handler(split_handler)  # noqa: SLF001
+    selects = await _sum(metrics.query_duration, statement="SELECT")
+
+    await bot.initialize()
+    await measured(None, None)
+    await bot.shutdown()
+
+    db = await _sum(metrics.handler_db, handler="split_handler")
+    telegram = await _sum(metrics.handler_telegram, handler="split_handler")
+    assert db >= 0.01  # noqa: PLR2004
+    assert API_LATENCY <= telegram < 2 * API_LATENCY
+    assert await _sum(metrics.query_duration, statement="SELECT") >= selects + db
+
+
+async def _get(port: int, path: str) -> bytes:
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    await writer.drain()
+    response = await reader.read()
+    writer.close()
+    return response
+
+
+async def test_metrics_server_ok() -> None:
+    metrics.handler_duration.observe(0.1, "served_handler")
+    server = await metrics_server.start(metrics.registry, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    async with server:
+        response = await _get(port, "/metrics")
+        not_found = await _get(port, "/")
+
+    head, body = response.split(b"\r\n\r\n", 1)
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert f"Content-Length: {len(body)}".encode() in head
+    assert b"# TYPE bot_handler_duration_seconds histogram" in body
+    assert b'bot_handler_duration_seconds_count{handler="served_handler"}' in body
+    assert not_found.startswith(b"HTTP/1.1 404 Not Found")
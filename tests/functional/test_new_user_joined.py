@@ -0,0 +1,67 @@
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from telegram import Bot, Chat, Message, Update, User
+
+from app.domain.user.dto import UserDTO
+from app.domain.user.entities import User as UserEntity
+from app.handlers.chat.new_user_joined import new_user_joined_handler
+from tests.environment.unit_of_work import TestUnitOfWork
+from tests.utils import BotApiRequest
+
+MEMBERS = 50
+WITHOUT_APPLICATION = 1
+WITHOUT_LINK = 2
+
+
+def _join_update(user_ids: list[int]) -> Update:
+    return Update(
+        1,
+        message=Message(
+            message_id=1,
+            date=datetime.now(tz=timezone.utc),
+            chat=Chat(id=-100, type=Chat.SUPERGROUP),
+            new_chat_members=[
+                User(id=user_id, first_name="user", is_bot=False)
+                for user_id in user_ids
+            ],
+        ),
+    )
+
+
+async def _create_members(uow: TestUnitOfWork, user_ids: list[int]) -> None:
+    async with uow():
+        for user_id in user_ids:
+            await uow.user.create(
+                UserEntity(
+                    UserDTO(id=user_id, username=None, first_name=None, last_name=None),
+                ),
+            )
+            if user_id == WITHOUT_APPLICATION:
+                continue
+            application = await uow.application.create(user_id)
+            if user_id != WITHOUT_LINK:
+                application.invite_link = f"https://t.me/+{user_id}"
+                await uow.application.update(application)
+        await uow.commit()
+
+
+async def test_one_query_ok(uow: TestUnitOfWork, queries: list[str]) -> None:
+    user_ids = list(range(1, MEMBERS + 1))
+    await _create_members(uow, user_ids)
+    bot_api = BotApiRequest()
+    context = SimpleNamespace(
+        application=SimpleNamespace(bot=Bot("1:token", request=bot_api)),
+    )
+    queries.clear()
+
+    await new_user_joined_handler.__wrapped__(  # type: ignore[attr-defined]
+        update=_join_update(user_ids),
+        context=context,
+        uow=uow,
+    )
+
+    assert len(queries) == 1
+    assert "ANY" in queries[0]
+    # Members without an application or a link do not stop the others.
+    assert bot_api.methods.count("revokeChatInviteLink") == MEMBERS - 2
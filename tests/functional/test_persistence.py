@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.persistence import DatabasePersistence
+from app.handlers.config import ApplicationStates
+from tests.environment.unit_of_work import TestUnitOfWork
+
+
+@pytest.fixture()
+def persistence(uow: TestUnitOfWork) -> DatabasePersistence:
+    return DatabasePersistence(uow, update_interval=0.1)
+
+
+async def _hand_over(persistence: DatabasePersistence) -> None:
+    """Hand changes over like `Application.update_persistence` does."""
+    await asyncio.gather(
+        persistence.update_user_data(1, {"application_id": 10, "message_id": 20}),
+        persistence.update_user_data(2, {"application_id": 11}),
+        persistence.update_conversation(
+            "application",
+            (1, 1),
+            ApplicationStates.AGE_STATE,
+        ),
+        persistence.update_conversation(
+            "application",
+            (2, 2),
+            ApplicationStates.ABOUT_STATE,
+        ),
+    )
+
+
+async def test_write_behind_ok(
+    persistence: DatabasePersistence,
+    queries: list[str],
+) -> None:
+    await _hand_over(persistence)
+
+    assert queries == []
+    await persistence.flush()
+    # One upsert of each kind in one transaction.
+    assert len(queries) == 2  # noqa: PLR2004
+    assert all(query.lstrip().startswith("INSERT") for query in queries)
+
+
+async def test_restart_ok(
+    persistence: DatabasePersistence,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _hand_over(persistence)
+    await persistence.flush()
+
+    restarted = DatabasePersistence(TestUnitOfWork(session_factory), 0.1)
+
+    assert await restarted.get_user_data() == {
+        1: {"application_id": 10, "message_id": 20},
+        2: {"application_id": 11},
+    }
+    assert await restarted.get_conversations("application") == {
+        (1, 1): ApplicationStates.AGE_STATE,
+        (2, 2): ApplicationStates.ABOUT_STATE,
+    }
+    assert await restarted.get_conversations("reject_application") == {}
+
+
+async def test_end_and_drop_ok(
+    persistence: DatabasePersistence,
+    session_factory: async_sessionmaker[AsyncSession],
+) -> None:
+    await _hand_over(persistence)
+    await persistence.flush()
+
+    await persistence.update_conversation("application", (1, 1), None)
+    await persistence.drop_user_data(2)
+    await persistence.flush()
+
+    restarted = DatabasePersistence(TestUnitOfWork(session_factory), 0.1)
+    assert await restarted.get_user_data() == {
+        1: {"application_id": 10, "message_id": 20},
+    }
+    assert await restarted.get_conversations("application") == {
+        (2, 2): ApplicationStates.ABOUT_STATE,
+    }
+
+
+async def test_unchanged_state_not_written_ok(
+    persistence: DatabasePersistence,
+    queries: list[str],
+) -> None:
+    await _hand_over(persistence)
+    await persistence.flush()
+    queries.clear()
+
+    await persistence.update_conversation(
+        "application",
+        (1, 1),
+        ApplicationStates.AGE_STATE,
+    )
+    await persistence.flush()
+
+    assert queries == []
+
+
+async def test_count_states_ok(persistence: DatabasePersistence) -> None:
+    await _hand_over(persistence)
+    await persistence.update_conversation(
+        "application",
+        (3, 3),
+        ApplicationStates.AGE_STATE,
+    )
+    await persistence.flush()
+
+    # States are counted by value, like they are loaded from the database.
+    assert await persistence.count_states() == {
+        ("application", "2"): 2,
+        ("application", "5"): 1,
+    }
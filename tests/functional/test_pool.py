@@ -0,0 +1,72 @@
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from sqlalchemy import URL
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from app.core import metrics
+from app.db import pool_metrics
+from app.db.engine import warm_up_pool
+
+POOL_SIZE = 3
+
+
+@pytest.fixture()
+async def pool_engine(database: URL) -> AsyncGenerator[AsyncEngine, Any]:
+    engine = create_async_engine(
+        database,
+        poolclass=pool_metrics.InstrumentedAsyncPool,
+        pool_size=POOL_SIZE,
+        max_overflow=1,
+    )
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+
+
+async def test_warm_up_ok(pool_engine: AsyncEngine) -> None:
+    waits_before = pool_metrics.checkout_wait.count
+
+    await warm_up_pool(pool_engine, POOL_SIZE)
+
+    gauges = pool_metrics.snapshot(pool_engine.pool)
+    assert gauges["checked_in"] == POOL_SIZE
+    assert gauges["checked_out"] == 0
+    assert gauges["overflow"] == 0
+    assert pool_metrics.checkout_wait.count == waits_before + POOL_SIZE
+
+
+async def test_overflow_gauge_ok(pool_engine: AsyncEngine) -> None:
+    connections = [await pool_engine.connect() for _ in range(POOL_SIZE + 1)]
+
+    gauges = pool_metrics.snapshot(pool_engine.pool)
+    for connection in connections:
+        await connection.close()
+
+    assert gauges["checked_out"] == POOL_SIZE + 1
+    assert gauges["overflow"] == 1
+
+
+async def test_pool_metrics_types_ok(pool_engine: AsyncEngine) -> None:
+    registry = metrics.Registry()
+    metrics.register_pool(registry, pool_engine.pool)
+    await warm_up_pool(pool_engine, POOL_SIZE)
+
+    lines = (await registry.render()).splitlines()
+
+    types = {
+        line.split()[2]: line.split()[3] for line in lines if line.startswith("# TYPE")
+    }
+    assert types == {
+        "bot_db_pool_size": "gauge",
+        "bot_db_pool_checked_in": "gauge",
+        "bot_db_pool_checked_out": "gauge",
+        "bot_db_pool_overflow": "gauge",
+        "bot_db_pool_checkout_wait_seconds": "histogram",
+    }
+    assert "bot_db_pool_checked_in 3.0" in lines
+    waits = float(pool_metrics.checkout_wait.count)
+    assert f'bot_db_pool_checkout_wait_seconds_bucket{{le="+Inf"}} {waits}' in lines
+    assert f"bot_db_pool_checkout_wait_seconds_count {waits}" in lines
@@ -0,0 +1,126 @@
+from collections.abc import Generator
+from typing import Any
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker
+
+from app.db.engine import ReadOnlyUnitOfWorkError
+from app.domain.application.entities import Application
+from app.domain.application.exceptions import ApplicationDoesNotExistError
+from app.domain.application.value_objects import ApplicationStatusEnum
+from app.domain.user.entities import User
+from tests.environment.unit_of_work import TestUnitOfWork
+
+
+@pytest.fixture()
+def checkouts(sqla_engine: AsyncEngine) -> Generator[dict[str, int], Any, None]:
+    counter = {"checkouts": 0}
+
+    def on_checkout(*_: Any) -> None:  # noqa: ANN401
+        counter["checkouts"] += 1
+
+    event.listen(sqla_engine.sync_engine.pool, "checkout", on_checkout)
+    yield counter
+    event.remove(sqla_engine.sync_engine.pool, "checkout", on_checkout)
+
+
+@pytest.fixture()
+async def created_application(uow: TestUnitOfWork, user: User) -> Application:
+    async with uow():
+        await uow.user.create(user)
+        application = await uow.application.create(user_id=user.id)
+        await uow.commit()
+        return application
+
+
+@pytest.fixture()
+def engine_uow(sqla_engine: AsyncEngine) -> TestUnitOfWork:
+    return TestUnitOfWork(async_sessionmaker(sqla_engine))
+
+
+async def test_untouched_no_checkout(
+    engine_uow: TestUnitOfWork,
+    checkouts: dict[str, int],
+) -> None:
+    async with engine_uow():
+        pass
+    async with engine_uow(read_only=True):
+        pass
+
+    assert checkouts["checkouts"] == 0
+
+
+async def test_repository_checkout_once(
+    engine_uow: TestUnitOfWork,
+    checkouts: dict[str, int],
+) -> None:
+    async with engine_uow():
+        with pytest.raises(ApplicationDoesNotExistError):
+            await engine_uow.application.get_by_id(1)
+        assert engine_uow.application is engine_uow.application
+        with pytest.raises(ApplicationDoesNotExistError):
+            await engine_uow.application.retrieve_last(1)
+
+    assert checkouts["checkouts"] == 1
+
+
+async def test_read_only_commit_fail(uow: TestUnitOfWork) -> None:
+    with pytest.raises(ReadOnlyUnitOfWorkError):
+        async with uow(read_only=True):
+            await uow.commit()
+
+
+async def test_read_only_reset_ok(uow: TestUnitOfWork) -> None:
+    async with uow(read_only=True):
+        pass
+    async with uow():
+        await uow.commit()
+
+
+async def test_scope_read_once_ok(
+    uow: TestUnitOfWork,
+    created_application: Application,
+    queries: list[str],
+) -> None:
+    async with uow.scope():
+        async with uow(read_only=True):
+            first = await uow.application.get_by_id(created_application.id)
+        queries.clear()
+        async with uow(read_only=True):
+            second = await uow.application.get_by_id(created_application.id)
+
+    assert first is second
+    assert queries == []
+
+
+async def test_scope_rollback_forgets_ok(
+    uow: TestUnitOfWork,
+    created_application: Application,
+    queries: list[str],
+) -> None:
+    async with uow.scope():
+        async with uow():
+            application = await uow.application.get_by_id(created_application.id)
+            application.status = ApplicationStatusEnum.WAITING
+        queries.clear()
+        async with uow():
+            application = await uow.application.get_by_id(created_application.id)
+
+    assert application.status == ApplicationStatusEnum.IN_PROGRESS
+    assert queries
+
+
+async def test_scope_read_only_releases_connection_ok(
+    engine_uow: TestUnitOfWork,
+    sqla_engine: AsyncEngine,
+) -> None:
+    pool = sqla_engine.sync_engine.pool
+    checked_out = pool.checkedout()  # type: ignore[attr-defined]
+
+    async with engine_uow.scope():
+        async with engine_uow(read_only=True):
+            with pytest.raises(ApplicationDoesNotExistError):
+                await engine_uow.application.get_by_id(1)
+        # Like a handler waiting for Telegram between the blocks.
+        assert pool.checkedout() == checked_out  # type: ignore[attr-defined]
@@ -0,0 +1,131 @@
+import asyncio
+import json
+import socket
+from collections.abc import AsyncGenerator
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from telegram import Bot, Update
+from telegram.ext import Application, ApplicationBuilder, ContextTypes, TypeHandler
+
+from app.core.config import Settings
+from app.core.webhook import WebhookSecretTokenNotSetError, get_webhook_options
+from tests.utils import BotApiRequest
+
+SECRET_TOKEN = "test-secret"  # noqa: S105
+START_UPDATE = Path(__file__).parent / "updates" / "start_command.json"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+@pytest.fixture()
+def config() -> Settings:
+    return Settings(
+        WEBHOOK_URL="https://bot.example.com/",
+        WEBHOOK_PORT=_free_port(),
+        WEBHOOK_PATH="/telegram",
+        WEBHOOK_SECRET_TOKEN=SECRET_TOKEN,
+    )
+
+
+@pytest.fixture()
+async def received() -> asyncio.Queue[Update]:
+    return asyncio.Queue()
+
+
+@pytest.fixture()
+def bot_api() -> BotApiRequest:
+    return BotApiRequest()
+
+
+@pytest.fixture()
+async def application(
+    config: Settings,
+    bot_api: BotApiRequest,
+    received: asyncio.Queue[Update],
+) -> AsyncGenerator[Application, Any]:
+    application = (
+        ApplicationBuilder()
+        .bot(Bot("1:token", request=bot_api, get_updates_request=BotApiRequest()))
+        .build()
+    )
+
+    async def record(update: Update, _: ContextTypes.DEFAULT_TYPE) -> None:
+        await received.put(update)
+
+    application.add_handler(TypeHandler(Update, record))
+    await application.initialize()
+    await application.updater.start_webhook(**get_webhook_options(config))
+    await application.start()
+    try:
+        yield application
+    finally:
+        await application.updater.stop()
+        await application.stop()
+        await application.shutdown()
+
+
+async def _post(
+    config: Settings,
+    payload: bytes,
+    secret_token: str,
+) -> httpx.Response:
+    async with httpx.AsyncClient() as client:
+        return await client.post(
+            f"http://127.0.0.1:{config.WEBHOOK_PORT}/telegram",
+            content=payload,
+            headers={
+                "Content-Type": "application/json",
+                "X-Telegram-Bot-Api-Secret-Token": secret_token,
+            },
+        )
+
+
+@pytest.mark.usefixtures("application")
+async def test_webhook_update_ok(
+    config: Settings,
+    bot_api: BotApiRequest,
+    received: asyncio.Queue[Update],
+) -> None:
+    assert "setWebhook" in bot_api.methods
+    payload = START_UPDATE.read_bytes()
+
+    response = await _post(config, payload, SECRET_TOKEN)
+
+    assert response.status_code == httpx.codes.OK
+    update = await asyncio.wait_for(received.get(), timeout=5)
+    assert update.update_id == json.loads(payload)["update_id"]
+    assert update.effective_user is not None
+    assert update.effective_user.id == 100500  # noqa: PLR2004
+    assert update.effective_message is not None
+    assert update.effective_message.text == "/start"
+
+
+@pytest.mark.usefixtures("application")
+async def test_webhook_wrong_secret_token_fail(
+    config: Settings,
+    received: asyncio.Queue[Update],
+) -> None:
+    response = await _post(config, START_UPDATE.read_bytes(), "wrong")
+
+    assert response.status_code == httpx.codes.FORBIDDEN
+    assert received.empty()
+
+
+def test_webhook_options_ok(config: Settings) -> None:
+    options = get_webhook_options(config)
+
+    assert options["url_path"] == "telegram"
+    assert options["webhook_url"] == "https://bot.example.com/telegram"
+    assert options["secret_token"] == SECRET_TOKEN
+
+
+def test_webhook_options_without_secret_token_fail() -> None:
+    with pytest.raises(WebhookSecretTokenNotSetError):
+        get_webhook_options(Settings(WEBHOOK_URL="https://bot.example.com"))
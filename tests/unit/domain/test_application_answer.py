@@ -1,5 +1,11 @@
+import pytest
+
+from app.domain.application.value_objects import ApplicationQuestionEnum
 from app.domain.application_answers.dto import AnswerDTO
-from app.domain.application_answers.entities import ApplicationAnswer
+from app.domain.application_answers.entities import (
+    ApplicationAnswer,
+    ApplicationAnswers,
+)
 
 
 def test_create_ok() -> None:
@@ -13,3 +19,40 @@ def test_create_ok() -> None:
     assert answer.application_id == 1
     assert answer.question_number == 1
     assert answer.answer_text == "test"
+
+
+def test_answers_put_ok() -> None:
+    answers = ApplicationAnswers(application_id=1)
+    answer = ApplicationAnswer(
+        AnswerDTO(application_id=1, question_number=2, answer_text="test"),
+    )
+
+    answers.put(answer)
+
+    assert answers[ApplicationQuestionEnum.AGE] == answer
+    assert list(answers) == [ApplicationQuestionEnum.AGE]
+    assert len(answers) == 1
+    assert 1 not in answers
+    assert not answers.is_complete()
+
+
+def test_answers_complete_ok() -> None:
+    answers = ApplicationAnswers(
+        application_id=1,
+        texts=dict.fromkeys(ApplicationQuestionEnum.all_ids(), "test"),
+    )
+
+    assert answers.is_complete()
+    answers.clear()
+    assert answers == {}
+
+
+def test_answers_unknown_question_fail() -> None:
+    answers = ApplicationAnswers(application_id=1)
+
+    with pytest.raises(KeyError):
+        answers.put(
+            ApplicationAnswer(
+                AnswerDTO(application_id=1, question_number=100, answer_text="test"),
+            ),
+        )
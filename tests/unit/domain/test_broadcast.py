@@ -0,0 +1,51 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from app.domain.broadcast.dto import BroadcastDTO
+from app.domain.broadcast.entities import Broadcast
+from app.domain.broadcast.exceptions import BroadcastAlreadyFinishedError
+from app.domain.broadcast.value_objects import (
+    BroadcastAudienceEnum,
+    DeliveryStatusEnum,
+)
+
+
+@pytest.fixture()
+def broadcast() -> Broadcast:
+    return Broadcast(
+        BroadcastDTO(
+            id=1,
+            admin_id=1,
+            audience=BroadcastAudienceEnum.ALL,
+            message="text",
+            created_at=datetime.now(tz=timezone.utc),
+        ),
+    )
+
+
+def test_record_ok(broadcast: Broadcast) -> None:
+    broadcast.record(3, DeliveryStatusEnum.DELIVERED)
+    broadcast.record(1, DeliveryStatusEnum.BLOCKED)
+    broadcast.record(2, DeliveryStatusEnum.FAILED)
+
+    assert broadcast.delivered == 1
+    assert broadcast.blocked == 1
+    assert broadcast.failed == 1
+    assert broadcast.last_user_id == 3  # noqa: PLR2004
+
+
+def test_finish_ok(broadcast: Broadcast) -> None:
+    broadcast.finish()
+
+    assert broadcast.is_finished is True
+    assert broadcast.finished_at is not None
+
+
+def test_finished_fail(broadcast: Broadcast) -> None:
+    broadcast.finish()
+
+    with pytest.raises(BroadcastAlreadyFinishedError):
+        broadcast.record(1, DeliveryStatusEnum.DELIVERED)
+    with pytest.raises(BroadcastAlreadyFinishedError):
+        broadcast.finish()
@@ -0,0 +1,49 @@
+import asyncio
+
+import pytest
+from telegram.error import BadRequest
+
+from app.infra.messaging.fan_out import fan_out
+
+
+async def _call(done: list[str], name: str, delay: float = 0.05) -> None:
+    await asyncio.sleep(delay)
+    done.append(name)
+
+
+async def _fail(error: Exception) -> None:
+    await asyncio.sleep(0)
+    raise error
+
+
+async def test_concurrent_ok() -> None:
+    done: list[str] = []
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    results = await fan_out(edit=_call(done, "edit"), send=_call(done, "send"))
+
+    assert loop.time() - start < 0.09  # noqa: PLR2004
+    assert sorted(done) == ["edit", "send"]
+    assert results == {"edit": True, "send": True}
+
+
+async def test_telegram_error_isolated_ok() -> None:
+    done: list[str] = []
+
+    results = await fan_out(
+        edit=_fail(BadRequest("Message is not modified")),
+        send=_call(done, "send"),
+    )
+
+    assert done == ["send"]
+    assert results == {"edit": False, "send": True}
+
+
+async def test_other_error_fail() -> None:
+    done: list[str] = []
+
+    with pytest.raises(ExceptionGroup):
+        await fan_out(edit=_fail(ValueError("bug")), send=_call(done, "send"))
+
+    assert done == []
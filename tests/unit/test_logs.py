@@ -0,0 +1,125 @@
+import json
+import logging
+import sys
+import time
+import zipfile
+from collections.abc import Generator
+from pathlib import Path
+from typing import Any
+
+import pytest
+from loguru import logger
+
+from app.core.logs import (
+    DebugSampler,
+    QueuedFileSink,
+    _rotating_by_size,
+    _zip_rotator,
+    setup_logging,
+)
+
+
+@pytest.fixture()
+def logs_directory(tmp_path: Path) -> Generator[Path, Any, None]:
+    yield tmp_path / "logs"
+    logger.remove()
+    logger.add(sys.stderr)
+
+
+def _record(name: str, level: str) -> dict[str, Any]:
+    return {"name": name, "level": logger.level(level)}
+
+
+def test_debug_sampler_ok() -> None:
+    sampler = DebugSampler({"app.hot": 3})
+
+    kept = [sampler(_record("app.hot", "DEBUG")) for _ in range(6)]
+
+    assert kept == [True, False, False, True, False, False]
+    assert sampler(_record("app.hot", "INFO")) is True
+    assert sampler(_record("app.other", "DEBUG")) is True
+
+
+def test_setup_logging_ok(logs_directory: Path) -> None:
+    setup_logging(logs_directory, "INFO", False, {})  # noqa: FBT003
+
+    logger.debug("hidden {}", 1)
+    logger.info("shown {}", 2)
+    logger.warning("warning {}", 3)
+    # Removing the sinks writes the queued records.
+    logger.remove()
+
+    full_log = (logs_directory / "full_log.log").read_text(encoding="utf-8")
+    warnings_log = (logs_directory / "warnings_and_above.log").read_text(
+        encoding="utf-8",
+    )
+    assert "hidden" not in full_log
+    assert "shown 2" in full_log
+    assert "warning 3" in full_log
+    assert "shown" not in warnings_log
+    assert "warning 3" in warnings_log
+
+
+class SlowHandler(logging.Handler):
+    """Collects the texts it was given after a delay."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.texts: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:  # noqa: D102
+        time.sleep(0.05)
+        self.texts.append(record.getMessage())
+
+
+async def test_queued_file_sink_complete_ok() -> None:
+    handler = SlowHandler()
+    sink = QueuedFileSink(handler)
+    logger_id = logger.add(sink, format="{message}")
+
+    logger.info("written")
+    await logger.complete()
+
+    assert handler.texts == ["written\n"]
+    logger.remove(logger_id)
+
+
+def test_setup_logging_json_ok(logs_directory: Path) -> None:
+    setup_logging(logs_directory, "DEBUG", True, {})  # noqa: FBT003
+
+    logger.info("shown {}", 2)
+    logger.remove()
+
+    lines = (logs_directory / "full_log.log").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["record"]["message"] for line in lines] == ["shown 2"]
+
+
+def test_zip_rotator_ok(tmp_path: Path) -> None:
+    source = tmp_path / "full_log.log"
+    source.write_text("record\n", encoding="utf-8")
+    destination = tmp_path / "full_log.log.2026-10-18.zip"
+
+    _zip_rotator(str(source), str(destination))
+
+    assert not source.exists()
+    with zipfile.ZipFile(destination) as archive:
+        assert archive.read("full_log.log.2026-10-18") == b"record\n"
+
+
+def test_rotating_by_size_keeps_all_ok(tmp_path: Path) -> None:
+    handler = _rotating_by_size(tmp_path / "warnings.log", 15)
+    handler.terminator = ""
+
+    for number in range(3):
+        handler.handle(logging.makeLogRecord({"msg": f"record {number}\n"}))
+    handler.close()
+
+    archives = sorted(tmp_path.glob("warnings.*.log.zip"))
+    assert len(archives) == 2  # noqa: PLR2004
+    texts = []
+    for path in archives:
+        with zipfile.ZipFile(path) as archive:
+            assert archive.namelist() == [path.stem]
+            texts.append(archive.read(path.stem))
+    assert texts == [b"record 0\n", b"record 1\n"]
+    assert (tmp_path / "warnings.log").read_text() == "record 2\n"
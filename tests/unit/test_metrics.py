@@ -0,0 +1,141 @@
+from typing import Any
+
+import pytest
+from telegram import Bot
+from telegram.ext import (
+    ApplicationBuilder,
+    CommandHandler,
+    ConversationHandler,
+    MessageHandler,
+    filters,
+)
+
+from app.core import metrics
+from app.infra.messaging.instrumented_request import InstrumentedRequest
+from tests.utils import BotApiRequest
+
+
+async def _count(histogram: metrics.LatencyHistogram, **labels: str) -> float:
+    """Return the number of values observed for the labels."""
+    for sample in await histogram.samples():
+        if sample.name.endswith("_count") and sample.labels == labels:
+            return sample.value
+    return 0
+
+
+async def _read_states() -> dict[tuple[str, ...], float]:
+    return {("application", "1"): 2}
+
+
+async def test_render_ok() -> None:
+    registry = metrics.Registry()
+    counter = registry.counter("requests_total", "Requests.", ("method",))
+    histogram = registry.histogram("request_seconds", "Request time.", ())
+    registry.gauge("states", 'States "now".', ("name", "state"), _read_states)
+
+    counter.inc("get")
+    counter.inc("get", amount=2)
+    histogram.observe(0.007)
+    histogram.observe(20)
+
+    lines = (await registry.render()).splitlines()
+
+    assert lines[:3] == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{method="get"} 3.0',
+    ]
+    assert "# TYPE request_seconds histogram" in lines
+    assert 'request_seconds_bucket{le="0.005"} 0.0' in lines
+    assert 'request_seconds_bucket{le="0.01"} 1.0' in lines
+    assert 'request_seconds_bucket{le="+Inf"} 2.0' in lines
+    assert "request_seconds_sum 20.007" in lines
+    assert "request_seconds_count 2.0" in lines
+    assert 'states{name="application",state="1"} 2.0' in lines
+
+
+async def test_failed_gauge_skipped_ok() -> None:
+    async def fail() -> dict[tuple[str, ...], float]:
+        raise RuntimeError
+
+    registry = metrics.Registry()
+    registry.gauge("broken", "Broken.", (), fail)
+    registry.counter("calls_total", "Calls.", ()).inc()
+
+    assert await registry.render() == (
+        "# HELP calls_total Calls.\n# TYPE calls_total counter\ncalls_total 1.0\n"
+    )
+
+
+def test_duplicate_name_fail() -> None:
+    registry = metrics.Registry()
+    registry.counter("calls_total", "Calls.", ())
+
+    with pytest.raises(ValueError, match="already registered"):
+        registry.counter("calls_total", "Calls.", ())
+
+
+class MeasuredService:
+    @metrics.measure_service
+    async def execute(self, fail: bool) -> int:  # noqa: FBT001, D102
+        if fail:
+            raise RuntimeError
+        return 1
+
+
+async def test_measure_service_ok() -> None:
+    service = MeasuredService()
+    calls = await _count(metrics.service_duration, service="MeasuredService")
+
+    assert await service.execute(fail=False) == 1
+    with pytest.raises(RuntimeError):
+        await service.execute(fail=True)
+
+    assert await _count(
+        metrics.service_duration,
+        service="MeasuredService",
+    ) == calls + 2
+    errors = await metrics.service_errors.samples()
+    assert [sample.value for sample in errors if sample.labels == {
+        "service": "MeasuredService",
+    }] == [1]
+
+
+async def metrics_start_command(update: Any, context: Any) -> int:  # noqa: ANN401, ARG001
+    return 1
+
+
+async def metrics_answer(update: Any, context: Any) -> None:  # noqa: ANN401, ARG001
+    await context.bot.get_me()
+
+
+async def test_instrument_handlers_ok() -> None:
+    bot_api = BotApiRequest()
+    bot = Bot(
+        "1:token",
+        request=InstrumentedRequest(bot_api),
+        get_updates_request=BotApiRequest(),
+    )
+    application = ApplicationBuilder().bot(bot).build()
+    conversation = ConversationHandler(
+        entry_points=[CommandHandler("start", metrics_start_command)],
+        states={1: [MessageHandler(filters.TEXT, metrics_answer)]},
+        fallbacks=[],
+    )
+    application.add_handler(conversation)
+    metrics.instrument_handlers(application)
+    answers = await _count(metrics.handler_duration, handler="metrics_answer")
+    requests = await _count(metrics.telegram_duration, method="getMe")
+
+    async with bot:
+        assert await conversation.entry_points[0].callback(None, None) == 1
+        await conversation.states[1][0].callback(None, application)
+
+    assert await _count(metrics.handler_duration, handler="metrics_start_command")
+    assert await _count(
+        metrics.handler_duration,
+        handler="metrics_answer",
+    ) == answers + 1
+    # getMe of the answer and of `Bot.initialize`.
+    assert await _count(metrics.telegram_duration, method="getMe") == requests + 2
+    assert bot_api.methods == ["getMe", "getMe"]
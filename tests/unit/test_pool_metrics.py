@@ -0,0 +1,20 @@
+from app.db.pool_metrics import Histogram
+
+
+def test_histogram_observe_ok() -> None:
+    histogram = Histogram(buckets=(0.1, 1.0))
+
+    values = (0.05, 0.1, 0.5, 2.0)
+    for value in values:
+        histogram.observe(value)
+
+    assert histogram.count == len(values)
+    assert histogram.total == sum(values)
+    assert histogram.cumulative() == [(0.1, 2), (1.0, 3), (float("inf"), 4)]
+
+
+def test_histogram_empty_ok() -> None:
+    histogram = Histogram(buckets=(0.1,))
+
+    assert histogram.count == 0
+    assert histogram.cumulative() == [(0.1, 0), (float("inf"), 0)]
@@ -0,0 +1,153 @@
+import asyncio
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from telegram.error import RetryAfter
+
+from app.infra.messaging.rate_limiter import (
+    OutboundRateLimiter,
+    Priority,
+    TokenBucket,
+    admin_chats,
+)
+
+ADMIN_CHAT_ID = -100
+GROUP_CHAT_ID = -200
+
+
+def test_token_bucket_ok() -> None:
+    bucket = TokenBucket(rate=2, capacity=2)
+    now = 1000.0
+    bucket._updated_at = now  # noqa: SLF001
+
+    bucket.take(now)
+    bucket.take(now)
+
+    assert bucket.delay(now) == 0.5  # noqa: PLR2004
+    assert bucket.delay(now + 0.5) == 0
+    assert bucket.delay(now + 10) == 0
+    bucket.take(now + 10)
+    bucket.take(now + 10)
+    assert bucket.delay(now + 10) == 0.5  # noqa: PLR2004
+
+
+@pytest.fixture()
+async def limiter() -> AsyncGenerator[OutboundRateLimiter, Any]:
+    limiter = OutboundRateLimiter(
+        admin_chat_id=ADMIN_CHAT_ID,
+        messages_per_second=20,
+        group_messages_per_minute=600,
+        group_burst=1,
+        max_retries=1,
+    )
+    await limiter.initialize()
+    try:
+        yield limiter
+    finally:
+        await limiter.shutdown()
+
+
+async def _send(  # noqa: PLR0913
+    limiter: OutboundRateLimiter,
+    sent: list[str],
+    name: str,
+    chat_id: int,
+    endpoint: str = "sendMessage",
+    priority: Priority | None = None,
+) -> None:
+    async def callback() -> bool:
+        sent.append(name)
+        return True
+
+    await limiter.process_request(
+        callback,
+        (),
+        {},
+        endpoint,
+        {"chat_id": chat_id},
+        priority,
+    )
+
+
+async def test_priority_ok(limiter: OutboundRateLimiter) -> None:
+    sent: list[str] = []
+    # Use up the burst, so the next requests wait for the dispatcher.
+    await asyncio.gather(*(_send(limiter, [], "burst", 1) for _ in range(20)))
+
+    await asyncio.gather(
+        _send(limiter, sent, "bulk", 6, priority=Priority.BULK),
+        _send(limiter, sent, "user", 1),
+        _send(limiter, sent, "user", 2),
+        _send(limiter, sent, "edit", 3, endpoint="editMessageText"),
+        _send(limiter, sent, "admin chat", ADMIN_CHAT_ID),
+        _send(limiter, sent, "explicit", 4, priority=Priority.ADMIN),
+    )
+
+    assert sent[:3] == ["edit", "admin chat", "explicit"]
+    assert sent[3:] == ["user", "user", "bulk"]
+
+
+async def test_admin_chats_priority_ok(limiter: OutboundRateLimiter) -> None:
+    sent: list[str] = []
+    await asyncio.gather(*(_send(limiter, [], "burst", 1) for _ in range(20)))
+
+    token = admin_chats.set(frozenset({5}))
+    try:
+        await asyncio.gather(
+            _send(limiter, sent, "applicant", 1),
+            _send(limiter, sent, "admin", 5),
+        )
+    finally:
+        admin_chats.reset(token)
+
+    assert sent == ["admin", "applicant"]
+
+
+async def test_group_limit_ok(limiter: OutboundRateLimiter) -> None:
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    await _send(limiter, [], "first", GROUP_CHAT_ID)
+    await _send(limiter, [], "second", GROUP_CHAT_ID)
+
+    # 600 messages per minute without burst is one per 0.1 second.
+    assert loop.time() - start >= 0.09  # noqa: PLR2004
+
+
+async def test_retry_after_ok(limiter: OutboundRateLimiter) -> None:
+    calls = 0
+
+    async def callback() -> bool:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RetryAfter(0)
+        return True
+
+    result = await limiter.process_request(
+        callback,
+        (),
+        {},
+        "sendMessage",
+        {"chat_id": 1},
+        None,
+    )
+
+    assert result is True
+    assert calls == 2  # noqa: PLR2004
+
+
+async def test_retry_after_fail(limiter: OutboundRateLimiter) -> None:
+    async def callback() -> bool:
+        raise RetryAfter(0)
+
+    with pytest.raises(RetryAfter):
+        await limiter.process_request(
+            callback,
+            (),
+            {},
+            "sendMessage",
+            {"chat_id": 1},
+            None,
+        )
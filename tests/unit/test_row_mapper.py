@@ -0,0 +1,34 @@
+import pytest
+
+from app.db.repositories.abstract import RowMapper
+from app.domain.application.dto import ApplicationDTO
+from app.domain.application.value_objects import ApplicationStatusEnum
+
+KEYS = ("id", "user_id", "status", "decision_date", "rejection_reason", "invite_link")
+
+
+def test_row_mapper_ok() -> None:
+    mapper = RowMapper(ApplicationDTO, (*KEYS, "created_at"))
+    row = (1, 2, ApplicationStatusEnum.WAITING, None, None, "link", None)
+
+    dto = mapper(row)
+
+    expected = ApplicationDTO.model_validate(dict(zip(KEYS, row, strict=False)))
+    assert dto == expected
+    assert dto.model_fields_set == expected.model_fields_set
+    assert dto.admin_id is None
+    assert dto.model_dump() == expected.model_dump()
+
+
+def test_row_mapper_extra_columns_ok() -> None:
+    mapper = RowMapper(ApplicationDTO, (*KEYS, "question_number", "answer_text"))
+
+    dto = mapper((1, 2, ApplicationStatusEnum.WAITING, None, None, None, 3, "text"))
+
+    assert dto.id == 1
+    assert dto.invite_link is None
+
+
+def test_row_mapper_missing_required_column_fail() -> None:
+    with pytest.raises(ValueError, match="status"):
+        RowMapper(ApplicationDTO, ("id", "user_id"))
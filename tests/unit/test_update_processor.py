@@ -0,0 +1,86 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+from telegram import Chat, Message, Update, User
+
+from app.core.update_processor import PerUserUpdateProcessor
+
+
+def _update(update_id: int, user_id: int) -> Update:
+    return Update(
+        update_id,
+        message=Message(
+            message_id=update_id,
+            date=datetime.now(tz=timezone.utc),
+            chat=Chat(id=user_id, type=Chat.PRIVATE),
+            from_user=User(id=user_id, first_name="user", is_bot=False),
+            text="text",
+        ),
+    )
+
+
+async def _process(
+    processor: PerUserUpdateProcessor,
+    updates: list[Update],
+    delay: float = 0.01,
+) -> list[tuple[str, int, int]]:
+    events: list[tuple[str, int, int]] = []
+
+    async def handle(update: Update) -> None:
+        assert update.effective_user is not None
+        events.append(("start", update.effective_user.id, update.update_id))
+        await asyncio.sleep(delay)
+        events.append(("end", update.effective_user.id, update.update_id))
+
+    await asyncio.gather(
+        *(processor.process_update(update, handle(update)) for update in updates),
+    )
+    return events
+
+
+async def test_same_user_sequential_ok() -> None:
+    processor = PerUserUpdateProcessor(workers=4, max_concurrent_updates=16)
+    updates = [_update(update_id, user_id=1) for update_id in range(5)]
+
+    events = await _process(processor, updates)
+
+    assert events == [
+        (event, 1, update_id)
+        for update_id in range(5)
+        for event in ("start", "end")
+    ]
+    assert processor._locks == {}  # noqa: SLF001
+
+
+async def test_different_users_concurrent_ok() -> None:
+    processor = PerUserUpdateProcessor(workers=4, max_concurrent_updates=16)
+    updates = [_update(update_id, user_id=update_id) for update_id in range(4)]
+
+    events = await _process(processor, updates)
+
+    assert [event for event, *_ in events[:4]] == ["start"] * 4
+
+
+async def test_workers_limit_ok() -> None:
+    processor = PerUserUpdateProcessor(workers=2, max_concurrent_updates=16)
+    updates = [_update(update_id, user_id=update_id) for update_id in range(4)]
+
+    events = await _process(processor, updates)
+
+    assert [event for event, *_ in events[:3]] == ["start", "start", "end"]
+
+
+async def test_waiting_updates_do_not_take_workers_ok() -> None:
+    processor = PerUserUpdateProcessor(workers=2, max_concurrent_updates=16)
+    updates = [_update(update_id, user_id=1) for update_id in range(4)]
+    updates.append(_update(4, user_id=2))
+
+    events = await _process(processor, updates)
+
+    assert events[:2] == [("start", 1, 0), ("start", 2, 4)]
+
+
+def test_wrong_workers_fail() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        PerUserUpdateProcessor(workers=0, max_concurrent_updates=1)
@@ -1,9 +1,14 @@
+import asyncio
+import json
 from pathlib import Path
+from typing import Any
 
 from alembic import command
 from alembic.config import Config
 from sqlalchemy import URL, Connection, text
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from telegram.error import BadRequest, Forbidden
+from telegram.request import BaseRequest, RequestData
 
 from app.core.config import settings
 
@@ -74,3 +79,104 @@ async def drop_database(url: URL) -> None:
         )
 
         await conn.execute(text(f'DROP DATABASE "{url.database}"'))
+
+
+_BOT = {"id": 1, "is_bot": True, "first_name": "bot", "username": "test_bot"}
+# Results of Bot API methods that do not return True.
+_INVITE_LINK = {
+    "invite_link": "https://t.me/+test",
+    "creator": _BOT,
+    "creates_join_request": False,
+    "is_primary": False,
+    "is_revoked": False,
+}
+_MESSAGE = {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}}
+_BOT_API_RESULTS: dict[str, object] = {
+    "getMe": _BOT,
+    "sendMessage": _MESSAGE,
+    "createChatInviteLink": _INVITE_LINK,
+    "revokeChatInviteLink": {**_INVITE_LINK, "is_revoked": True},
+}
+
+
+class BotApiRequest(BaseRequest):
+    """Answers Bot API calls without the network and records called methods."""
+
+    def __init__(self, delay: float = 0) -> None:
+        """
+        Initialize the request.
+
+        Args:
+            delay (float): Seconds every call takes, like a network round trip.
+
+        Returns:
+            None
+        """
+        self.delay = delay
+        self.methods: list[str] = []
+
+    async def initialize(self) -> None:
+        """Nothing to initialize."""
+
+    async def shutdown(self) -> None:
+        """Nothing to shut down."""
+
+    @property
+    def read_timeout(self) -> float:
+        """Return the read timeout."""
+        return 1
+
+    async def do_request(
+        self,
+        url: str,
+        method: str,  # noqa: ARG002
+        request_data: RequestData | None = None,  # noqa: ARG002
+        *args: Any,  # noqa: ARG002, ANN401
+        **kwargs: Any,  # noqa: ARG002, ANN401
+    ) -> tuple[int, bytes]:
+        """Record the called method and return a successful response."""
+        api_method = url.rsplit("/", 1)[-1]
+        self.methods.append(api_method)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        result = _BOT_API_RESULTS.get(api_method, True)
+        return 200, json.dumps({"ok": True, "result": result}).encode()
+
+_BLOCKED_MESSAGE = "Forbidden: bot was blocked by the user"
+_CHAT_NOT_FOUND_MESSAGE = "Chat not found"
+
+
+class BroadcastBot:
+    """Records messages sent to users, some users blocked the bot or are gone."""
+
+    def __init__(
+        self,
+        blocked: frozenset[int] = frozenset(),
+        failed: frozenset[int] = frozenset(),
+    ) -> None:
+        """
+        Initialize the bot.
+
+        Args:
+            blocked (frozenset[int]): Users who blocked the bot.
+            failed (frozenset[int]): Users whose chat is not found.
+
+        Returns:
+            None
+        """
+        self.blocked = blocked
+        self.failed = failed
+        self.sent: list[int] = []
+
+    async def send_message(
+        self,
+        chat_id: int,
+        text: str,  # noqa: ARG002
+        **kwargs: Any,  # noqa: ARG002, ANN401
+    ) -> None:
+        """Record the message or raise the error of the user."""
+        if chat_id in self.blocked:
+            raise Forbidden(_BLOCKED_MESSAGE)
+        if chat_id in self.failed:
+            raise BadRequest(_CHAT_NOT_FOUND_MESSAGE)
+        self.sent.append(chat_id)